@@ -0,0 +1,79 @@
+"""Module: Mask matching benchmark
+
+Usage: python -m benchmarks.bench_mask [paths count]
+"""
+
+import sys
+import timeit
+
+from swagger2locustio.parsers.mask_matcher import MaskMatcher
+from benchmarks.synthetic import make_swagger_v2
+
+
+def legacy_filter(paths: dict, mask: dict) -> int:
+    """Function: filtering as it was done before MaskMatcher, with lowercased literals only"""
+
+    paths_white_list = {path.lower() for path in mask["paths_white_list"]}
+    tags_black_list = {tag.lower() for tag in mask["tags_black_list"]}
+    matched = 0
+    for path, path_data in paths.items():
+        if paths_white_list and path.lower() not in paths_white_list:
+            continue
+        for path_method, method_data in path_data.items():
+            if path_method.lower() not in mask["operations_white_list"]:
+                continue
+            tags = set(tag.lower() for tag in method_data.get("tags", []))
+            if tags_black_list.intersection(tags):
+                continue
+            matched += 1
+    return matched
+
+
+def matcher_filter(paths: dict, matcher: MaskMatcher) -> int:
+    """Function: filtering with compiled MaskMatcher"""
+
+    matched = 0
+    for path, path_data in paths.items():
+        if not matcher.match_path(path):
+            continue
+        for path_method, method_data in path_data.items():
+            if matcher.match_operation(path_method, method_data):
+                matched += 1
+    return matched
+
+
+def main():
+    """Function: run benchmark"""
+
+    paths_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    paths = make_swagger_v2(paths_count, operations_count=2)["paths"]
+    literal_mask = {
+        "operations_white_list": {"get"},
+        "paths_white_list": set(list(paths)[::2]),
+        "paths_black_list": set(),
+        "tags_white_list": set(),
+        "tags_black_list": {"tag3"},
+    }
+    glob_mask = dict(literal_mask, paths_white_list={"/v1/*", "/v2/resource1*", "re:/v0/resource\\d+/items\\d*5/.*"})
+    number = 2
+    rounds = 50
+
+    cases = [
+        ("legacy literals", lambda: legacy_filter(paths, literal_mask)),
+        ("matcher literals (compile+run)", lambda: matcher_filter(paths, MaskMatcher(literal_mask))),
+        ("matcher globs/regex (compile+run)", lambda: matcher_filter(paths, MaskMatcher(glob_mask))),
+    ]
+    reused = MaskMatcher(glob_mask)
+    cases.append(("matcher globs/regex (reused)", lambda: matcher_filter(paths, reused)))
+    # cases are interleaved, so that changes of CPU frequency and load affect all of them alike
+    best = [float("inf")] * len(cases)
+    for _ in range(rounds):
+        for num, (_, case) in enumerate(cases):
+            best[num] = min(best[num], timeit.timeit(case, number=number) / number)
+    print(f"{paths_count} paths, best of {rounds} interleaved rounds x {number} runs")
+    print(f"{'case':<36}{'ms per run':>12}{'vs legacy':>10}{'matched':>10}")
+    for (name, case), seconds in zip(cases, best):
+        print(f"{name:<36}{seconds * 1000:>12.2f}{best[0] / seconds:>9.2f}x{case():>10}")
+
+if __name__ == "__main__":
+    main()
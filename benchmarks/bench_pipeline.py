@@ -0,0 +1,202 @@
+"""Module: End to end pipeline benchmark
+
+Times every stage of generation for synthetic swagger v2 and OpenAPI v3 specifications, records wall time and
+peak RSS of the stages into JSON and compares them against baseline, stages slower or larger than baseline by more
+than the threshold are reported as regressions and the exit code is 1.
+
+Usage: python -m benchmarks.bench_pipeline [--paths N] [--operations M] [--params K] [--ref-depth D]
+           [--baseline PATH] [--save-baseline] [--threshold 0.2]
+
+The first run saves its results as baseline, as baseline depends on the machine it is not kept in the repo.
+"""
+
+import argparse
+import json
+import logging
+import multiprocessing
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from swagger2locustio.loader import load_swagger_file
+from swagger2locustio.parsers.mask_matcher import MaskMatcher
+from swagger2locustio.strategy.base_strategy import BaseStrategy
+from swagger2locustio.generators.base_generator import BaseGenerator, GeneratorConfig
+from swagger2locustio.utils import get_peak_rss, log_diff, log_result
+from benchmarks.synthetic import OPERATIONS, make_swagger_v2, make_swagger_v3
+
+SPEC_FACTORIES = {"v2": make_swagger_v2, "v3": make_swagger_v3}
+STAGES = (
+    "load",
+    "parse",
+    "group_test_classes",
+    "render_test_classes",
+    "write_test_classes",
+    "write_app_files",
+    "log_result",
+    "log_diff",
+)
+MEBIBYTE = 2 ** 20
+# differences below these are noise, whatever the threshold is
+MIN_SECONDS_DIFF = 0.01
+MIN_RSS_DIFF = 4.0
+
+
+def reset_peak_rss() -> None:
+    """Function: reset peak RSS of the process, it is supported by linux only"""
+
+    try:
+        Path("/proc/self/clear_refs").write_text("5")
+    except OSError:
+        pass
+
+
+def read_peak_rss() -> int:
+    """Function: read peak RSS of the process in bytes, it is reset by `reset_peak_rss` on linux"""
+
+    try:
+        for line in Path("/proc/self/status").read_text().splitlines():
+            if line.startswith("VmHWM:"):
+                return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return get_peak_rss()
+
+
+def measure(stages: Dict[str, Dict[str, float]], stage: str, func: Callable[..., Any], *args: Any) -> Any:
+    """Function: run stage, its wall time and peak RSS are kept if they are the best and the worst of runs"""
+
+    reset_peak_rss()
+    start = time.perf_counter()
+    result = func(*args)
+    seconds = time.perf_counter() - start
+    rss = read_peak_rss() / MEBIBYTE
+    stage_result = stages.setdefault(stage, {"seconds": seconds, "peak_rss_mib": rss})
+    stage_result["seconds"] = min(stage_result["seconds"], seconds)
+    stage_result["peak_rss_mib"] = max(stage_result["peak_rss_mib"], rss)
+    return result
+
+
+def run_stages(stages: Dict[str, Dict[str, float]], swagger_file: Path, results_path: Path) -> None:
+    """Function: run all the stages of generation once, as `BaseStrategy.process` and `main` do
+
+    `BaseGenerator.generate_locustfiles` streams parsed paths through grouping, rendering and writing of test classes,
+    here every stage is run for all the paths before the next one, so that they are timed separately.
+    """
+
+    file_content, _ = measure(stages, "load", load_swagger_file, swagger_file)
+    parser = BaseStrategy.get_specific_version_parser(file_content)
+    matcher = MaskMatcher({"operations_white_list": set(OPERATIONS)})
+    swagger_data = measure(stages, "parse", parser.parse_swagger_file, file_content, matcher)
+    generator = BaseGenerator(results_path, GeneratorConfig(app_name="bench"))
+    start = log_result(results_path)
+    measure(stages, "group_test_classes", generator.generate_test_classes, swagger_data["paths"])
+    test_classes = list(generator.test_classes_mapping.values())
+    rendered_test_classes = measure(
+        stages, "render_test_classes", list, generator.render_test_classes(test_classes, len(test_classes))
+    )
+    imports = measure(stages, "write_test_classes", generator.write_test_classes, rendered_test_classes)
+    security_cases = generator.generate_security_cases(swagger_data["security"])
+    measure(stages, "write_app_files", generator.write_app_files, swagger_data["host"], security_cases, *imports)
+    end = measure(stages, "log_result", log_result, results_path)
+    measure(stages, "log_diff", log_diff, start, end, results_path)
+
+
+def run_scenario(version: str, params: Dict[str, int], repeat: int) -> Dict[str, Dict[str, float]]:
+    """Function: run all the stages for synthetic spec `repeat` times, best time and worst RSS are returned"""
+
+    logging.disable(logging.CRITICAL)
+    stages: Dict[str, Dict[str, float]] = {}
+    with tempfile.TemporaryDirectory() as temp_dir:
+        swagger_file = Path(temp_dir) / "swagger.json"
+        swagger_file.write_text(json.dumps(SPEC_FACTORIES[version](**params)))
+        for run in range(repeat):
+            results_path = Path(temp_dir) / f"results{run}"
+            results_path.mkdir()
+            run_stages(stages, swagger_file, results_path)
+    return stages
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> List[str]:
+    """Function: compare results with baseline, descriptions of regressions are returned"""
+
+    regressions = []
+    for version, stages in results["scenarios"].items():
+        baseline_stages = baseline.get("scenarios", {}).get(version)
+        if baseline_stages is None:
+            continue
+        for stage, stage_result in stages.items():
+            baseline_result = baseline_stages.get(stage)
+            if baseline_result is None:
+                continue
+            for metric, min_diff in (("seconds", MIN_SECONDS_DIFF), ("peak_rss_mib", MIN_RSS_DIFF)):
+                value, baseline_value = stage_result[metric], baseline_result[metric]
+                if value > baseline_value * (1 + threshold) and value - baseline_value > min_diff:
+                    regressions.append(f"{version} {stage} {metric}: {baseline_value:.3f} -> {value:.3f}")
+    return regressions
+
+
+def parse_args() -> argparse.Namespace:
+    """Function: parse command line arguments"""
+
+    parser = argparse.ArgumentParser(description="Benchmark of all the stages of generation")
+    parser.add_argument("--paths", type=int, default=1000, help="Paths count")
+    parser.add_argument("--operations", type=int, default=2, choices=range(1, len(OPERATIONS) + 1))
+    parser.add_argument("--params", type=int, default=3, help="Query params count of each operation")
+    parser.add_argument("--ref-depth", type=int, default=3, help="Depth of references of response schemas")
+    parser.add_argument("--versions", nargs="+", default=list(SPEC_FACTORIES), choices=list(SPEC_FACTORIES))
+    parser.add_argument("--repeat", type=int, default=3, help="Runs count, best time is taken")
+    parser.add_argument("--output", type=Path, help="Path to write results to")
+    parser.add_argument("--baseline", type=Path, default=Path("benchmarks/baseline.json"), help="Baseline path")
+    parser.add_argument("--save-baseline", action="store_true", help="Save results as baseline, e.g. after a change")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed relative regression")
+    return parser.parse_args()
+
+
+def main():
+    """Function: run benchmark"""
+
+    args = parse_args()
+    params = {
+        "paths_count": args.paths,
+        "operations_count": args.operations,
+        "query_params_count": args.params,
+        "ref_depth": args.ref_depth,
+    }
+    results: Dict[str, Any] = {"params": params, "repeat": args.repeat, "scenarios": {}}
+    # every scenario runs in fresh process, so that peak RSS of one does not hide the other
+    context = multiprocessing.get_context("spawn")
+    for version in args.versions:
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            results["scenarios"][version] = executor.submit(run_scenario, version, params, args.repeat).result()
+
+    print(f"{args.paths} paths x {args.operations} operations, {args.params} params, ref depth {args.ref_depth}")
+    print(f"{'scenario':<10}{'stage':<24}{'seconds':>10}{'peak RSS MiB':>14}")
+    for version, stages in results["scenarios"].items():
+        for stage in STAGES:
+            print(f"{version:<10}{stage:<24}{stages[stage]['seconds']:>10.3f}{stages[stage]['peak_rss_mib']:>14.1f}")
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2))
+    # baseline depends on the machine, so it is not kept in the repo and the first run makes it
+    if args.save_baseline or not args.baseline.exists():
+        args.baseline.write_text(json.dumps(results, indent=2))
+        reason = "" if args.save_baseline else f"There was no baseline at {args.baseline}. "
+        print(f"{reason}Results are saved as baseline to {args.baseline}, the next runs are compared with them")
+        return
+    baseline = json.loads(args.baseline.read_text())
+    if baseline.get("params") != params:
+        print(f"Baseline params {baseline.get('params')} differ, results are not comparable")
+        return
+    regressions = compare(results, baseline, args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if regressions:
+        sys.exit(1)
+    print(f"No regressions beyond {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Module: Test methods rendering benchmark
+
+Usage: python -m benchmarks.bench_render [operations count]
+"""
+
+import sys
+import timeit
+from typing import List
+
+from jinja2 import Template
+
+from swagger2locustio.parsers.mask_matcher import MaskMatcher
+from swagger2locustio.parsers.swagger_v2 import SwaggerV2Parser
+from swagger2locustio.generators.base_generator import BaseGenerator, GeneratorConfig, TestClass
+from swagger2locustio.templates import helpers_templates
+from benchmarks.synthetic import make_swagger_v2
+
+LEGACY_FUNC = Template(
+    """
+    @task(1)
+    def {{ func_name }}(self):
+        self.client.{{ method }}(
+            name=self.get_generic_name(__file__),
+            url=self.url("{{ path }}"{{ path_params }}),
+            params={{ query_params }},
+            headers={{ header_params }},
+            cookies={{ cookie_params }},
+        )
+
+"""
+)
+LEGACY_PATH_PARAM_PAIR = Template("{{ key }}={{ val }}")
+LEGACY_DICT_PARAM_PAIR = Template('"{{ key }}": {{ val }}')
+
+
+def legacy_render(test_class: TestClass) -> List[str]:
+    """Function: rendering as it was done before, with standalone templates for functions and key=value pairs"""
+
+    rendered = []
+    for func_num, (path, method, method_data) in enumerate(test_class.operations):
+        formatted = {}
+        for location in ("path", "query", "header", "cookie"):
+            pairs = []
+            for param in method_data["params"].values():
+                if param.location != location:
+                    continue
+                val = helpers_templates.HELPER_MAPPING["choice"].format(values=f"{param.name.upper()}__{func_num}")
+                pair_template = LEGACY_PATH_PARAM_PAIR if location == "path" else LEGACY_DICT_PARAM_PAIR
+                pairs.append(pair_template.render(key=param.name, val=val))
+            if location == "path":
+                formatted[location] = ", " + ", ".join(pairs) if pairs else ""
+            else:
+                formatted[location] = "{" + ", ".join(pairs) + "}"
+        rendered.append(
+            LEGACY_FUNC.render(
+                func_name=f"{test_class.file_name.lower()}_test_{func_num}",
+                method=method,
+                path=path,
+                path_params=formatted["path"],
+                query_params=formatted["query"],
+                header_params=formatted["header"],
+                cookie_params=formatted["cookie"],
+            )
+        )
+    return rendered
+
+
+def main():
+    """Function: run benchmark"""
+
+    operations_count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    swagger_data = make_swagger_v2(operations_count, query_params_count=3)
+    mask = MaskMatcher({"operations_white_list": {"get"}})
+    paths = SwaggerV2Parser().parse_swagger_file(swagger_data, mask)["paths"]
+    operations = [
+        (path, method, method_data) for path, path_data in paths.items() for method, method_data in path_data.items()
+    ]
+    test_class = TestClass(file_path="", file_name="resource", class_name="ResourceTestClass", operations=operations)
+    number = 3
+    repeat = 5
+
+    print(f"{len(operations)} operations, best of {repeat} x {number} runs")
+    print(f"{'case':<36}{'us per operation':>18}")
+    cases = [
+        ("legacy templates", lambda: legacy_render(test_class)),
+        ("shared environment + str.format", lambda: BaseGenerator.render_test_methods(test_class, GeneratorConfig())),
+    ]
+    for name, case in cases:
+        seconds = min(timeit.repeat(case, number=number, repeat=repeat)) / number
+        print(f"{name:<36}{seconds / len(operations) * 10 ** 6:>18.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Module: Generated request bookkeeping benchmark
+
+Compares per request work of generated test methods: request name and url before and after request plans.
+
+Usage: python -m benchmarks.bench_request_plan
+"""
+
+import os
+import timeit
+
+API_PREFIX = "/api"
+PATH = "/v1/resources/{resourceId}/items/{itemId}"
+
+
+def generic_name(file):
+    """Function: request name, as it is generated in apps/base.py"""
+
+    if os.environ.get("DEBUG"):
+        return None
+    return "-".join(os.path.realpath(file).split("/")[-3:]).replace("_", "-").replace(".py", "")
+
+
+def url(_url: str, **kwargs):
+    """Function: url of request, as `TaskSet.url` in apps/base.py"""
+
+    return API_PREFIX + _url.format(**kwargs)
+
+
+REQUEST_NAME = generic_name(__file__)
+RESOURCES_TEST_0_URL = (API_PREFIX + PATH).format
+
+
+def legacy_request():
+    """Function: request name and url computed on every request"""
+
+    return generic_name(__file__), url(PATH, resourceId=1, itemId=2)
+
+
+def planned_request():
+    """Function: precomputed request name and url template"""
+
+    return REQUEST_NAME, RESOURCES_TEST_0_URL(resourceId=1, itemId=2)
+
+
+def main():
+    """Function: run benchmark"""
+
+    number = 100000
+    repeat = 5
+    print(f"best of {repeat} x {number} requests")
+    print(f"{'case':<24}{'us per request':>16}")
+    for name, case in (("legacy", legacy_request), ("request plan", planned_request)):
+        assert case() == legacy_request()
+        seconds = min(timeit.repeat(case, number=number, repeat=repeat)) / number
+        print(f"{name:<24}{seconds * 10 ** 6:>16.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Module: Synthetic swagger specifications for benchmarks"""
+
+from typing import Dict, Any, List, Tuple
+
+OPERATIONS = ("get", "post", "put", "delete")
+
+
+def make_models(ref_depth: int, ref_prefix: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Function: make response schema, which is `ref_depth` references deep, and models it refers to"""
+
+    if not ref_depth:
+        return {"type": "object", "properties": {"id": {"type": "integer"}}}, {}
+    models = {}
+    for level in range(1, ref_depth + 1):
+        child = {"$ref": f"{ref_prefix}Model{level + 1}"} if level < ref_depth else {"type": "string"}
+        models[f"Model{level}"] = {
+            "type": "object",
+            "required": ["id"],
+            "properties": {"id": {"type": "integer"}, "name": {"type": "string", "maxLength": 20}, "child": child},
+        }
+    return {"$ref": f"{ref_prefix}Model1"}, models
+
+
+def make_paths(
+    paths_count: int,
+    operations_count: int,
+    tags_count: int,
+    parameters: List[Dict[str, Any]],
+    response: Dict[str, Any],
+) -> Dict[str, Any]:
+    """Function: make `paths_count` paths with `operations_count` operations each"""
+
+    paths = {}
+    for i in range(paths_count):
+        path_data = {}
+        for operation in OPERATIONS[:operations_count]:
+            path_data[operation] = {
+                "operationId": f"{operation}Resource{i}",
+                "tags": [f"tag{i % tags_count}"],
+                "parameters": parameters,
+                "responses": {"200": response},
+            }
+        paths[f"/v{i % 3}/resource{i // 100}/items{i}/{{id}}"] = path_data
+    return paths
+
+
+def make_swagger_v2(
+    paths_count: int, operations_count: int = 1, tags_count: int = 10, query_params_count: int = 0, ref_depth: int = 0
+) -> Dict[str, Any]:
+    """Function: make swagger v2 specification with `paths_count` paths
+
+    With `ref_depth` query params are referenced from `parameters` and response schema is a chain of references.
+    """
+
+    query_params = {f"q{i}": {"name": f"q{i}", "in": "query", "type": "string"} for i in range(query_params_count)}
+    path_param = {"name": "id", "in": "path", "required": True, "type": "integer"}
+    if ref_depth:
+        parameters = [path_param, *({"$ref": f"#/parameters/{name}"} for name in query_params)]
+    else:
+        parameters = [path_param, *query_params.values()]
+    schema, models = make_models(ref_depth, "#/definitions/")
+    response = {"description": "ok", "schema": schema} if ref_depth else {"description": "ok"}
+    spec = {
+        "swagger": "2.0",
+        "info": {"title": "Synthetic API", "version": "1.0.0"},
+        "host": "api.example.com",
+        "paths": make_paths(paths_count, operations_count, tags_count, parameters, response),
+    }
+    if ref_depth:
+        spec["parameters"] = query_params
+        spec["definitions"] = models
+    return spec
+
+
+def make_swagger_v3(
+    paths_count: int, operations_count: int = 1, tags_count: int = 10, query_params_count: int = 0, ref_depth: int = 0
+) -> Dict[str, Any]:
+    """Function: make OpenAPI v3 specification with `paths_count` paths, it is equivalent to `make_swagger_v2` one"""
+
+    query_params = {
+        f"q{i}": {"name": f"q{i}", "in": "query", "schema": {"type": "string"}} for i in range(query_params_count)
+    }
+    path_param = {"name": "id", "in": "path", "required": True, "schema": {"type": "integer"}}
+    if ref_depth:
+        parameters = [path_param, *({"$ref": f"#/components/parameters/{name}"} for name in query_params)]
+    else:
+        parameters = [path_param, *query_params.values()]
+    schema, models = make_models(ref_depth, "#/components/schemas/")
+    response: Dict[str, Any] = {"description": "ok"}
+    if ref_depth:
+        response["content"] = {"application/json": {"schema": schema}}
+    spec = {
+        "openapi": "3.0.0",
+        "info": {"title": "Synthetic API", "version": "1.0.0"},
+        "servers": [{"url": "https://api.example.com"}],
+        "paths": make_paths(paths_count, operations_count, tags_count, parameters, response),
+    }
+    if ref_depth:
+        spec["components"] = {"parameters": query_params, "schemas": models}
+    return spec
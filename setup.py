@@ -38,6 +38,7 @@ setup(
     entry_points={
         "console_scripts": [
             "swagger2locustio=swagger2locustio.__main__:main",
+            "swagger2locustio-batch=swagger2locustio.batch:main",
         ]
     },
 )
@@ -1,21 +1,54 @@
 """Module: This is main module that activates library"""
 
-import json
 import argparse
 import logging
 from pathlib import Path
+from typing import Dict, List, Optional, Set
 
-import yaml
 import coloredlogs
 
-from swagger2locustio.utils import log_diff, log_result
+from swagger2locustio.cache import ParsedSpecCache, DEFAULT_CACHE_DIR, DEFAULT_CACHE_SIZE
+from swagger2locustio.utils import CONFLICT_POLICIES, log_diff, log_result
 from swagger2locustio.strategy.base_strategy import BaseStrategy
+from swagger2locustio.generators.base_generator import GeneratorConfig
+from swagger2locustio.traffic_profile import TrafficProfile
+from swagger2locustio.feeders import FEEDER_CURSORS, parse_feeder
+from swagger2locustio.profiler import Profiler
+from swagger2locustio.templates.environment import set_bytecode_cache
 
 API_OPERATIONS = ("get", "post", "put", "patch", "delete", "head", "options", "trace")
+USER_CLASSES = ("http", "fast")
+WAIT_MODES = ("between", "constant_pacing", "constant_throughput", "target_rps")
 
 
-def main():
-    """Launching function"""
+def add_cache_args(args: argparse.ArgumentParser) -> None:
+    """Function: add arguments of parsed swagger files and compiled templates caches"""
+
+    args.add_argument(
+        "--cache-dir",
+        help="path to store parsed swagger files and compiled templates",
+        required=False,
+        default=DEFAULT_CACHE_DIR,
+        type=Path,
+    )
+    args.add_argument(
+        "--cache-size",
+        help="max size of parsed swagger files cache in MiB",
+        required=False,
+        default=DEFAULT_CACHE_SIZE // 2 ** 20,
+        type=int,
+    )
+    args.add_argument(
+        "--no-cache",
+        help="do not use parsed swagger files and compiled templates caches",
+        required=False,
+        action="store_true",
+        default=False,
+    )
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Function: parse command line arguments, `sys.argv` is used if `argv` is None"""
 
     args = argparse.ArgumentParser(formatter_class=argparse.ArgumentDefaultsHelpFormatter)
     args.add_argument("-f", "--swagger-file", help="path to swagger file", required=True, type=Path)
@@ -30,6 +63,17 @@ def main():
     args.add_argument(
         "-v", "--verbose", help="verbose", required=False, action="store_true", default=False,
     )
+    args.add_argument(
+        "--app-name", help="name of created or updated app, it is prompted for if not set", required=False, type=str
+    )
+    args.add_argument(
+        "--conflict-policy",
+        help="what to do with previously generated files that are changed: "
+        "`prompt` - ask for each file, `overwrite` - overwrite them, `keep` - keep their previous content",
+        required=False,
+        choices=CONFLICT_POLICIES,
+        default="prompt",
+    )
     args.add_argument(
         "-o",
         "--operations",
@@ -51,53 +95,242 @@ def main():
     args.add_argument(
         "--tags-black", "--tb", help="tags to use in api testing", required=False, nargs="+", type=str, default=[]
     )
-    args = args.parse_args()
-    if args.verbose:
-        loglevel = "DEBUG"
-    else:
-        loglevel = "INFO"
-    coloredlogs.install(level=loglevel, fmt="%(asctime)s [%(levelname)s] %(filename)s: %(message)s")
+    args.add_argument(
+        "--operation-ids-white",
+        "--oiw",
+        help="operation ids to use in api testing",
+        required=False,
+        nargs="+",
+        type=str,
+        default=[],
+    )
+    args.add_argument(
+        "--operation-ids-black",
+        "--oib",
+        help="operation ids not to use in api testing",
+        required=False,
+        nargs="+",
+        type=str,
+        default=[],
+    )
+    add_cache_args(args)
+    args.add_argument(
+        "-j",
+        "--jobs",
+        help="number of processes to render test classes in parallel",
+        required=False,
+        default=1,
+        type=int,
+    )
+    args.add_argument(
+        "--user-class",
+        help="locust user class of generated locustfile: "
+        "`http` - HttpLocust based on python-requests, `fast` - FastHttpUser based on geventhttpclient (locust>=1.0)",
+        required=False,
+        choices=USER_CLASSES,
+        default="http",
+    )
+    args.add_argument(
+        "--data-pools",
+        help="generate values of constants in advance into seeded data pools instead of random choice per request",
+        required=False,
+        action="store_true",
+        default=False,
+    )
+    args.add_argument(
+        "--traffic-profile",
+        help="csv (`method,path,rps` rows) or json file with RPS of operations, task weights are derived from it",
+        required=False,
+        type=Path,
+    )
+    args.add_argument(
+        "--wait-mode",
+        help="wait time of users: `between` - random wait between tasks, `constant_pacing` - fixed period of tasks, "
+        "`constant_throughput` - fixed tasks per second, `target_rps` - pacing derived from total RPS and user count; "
+        "the values are set in base_constants.py",
+        required=False,
+        choices=WAIT_MODES,
+        default="between",
+    )
+    args.add_argument(
+        "--target-rps",
+        help="total RPS of `target_rps` wait mode (default: total RPS of traffic profile or 10)",
+        required=False,
+        type=float,
+    )
+    args.add_argument(
+        "--user-count",
+        help="number of users of `target_rps` wait mode, LOCUST_USERS env variable overrides it on run",
+        required=False,
+        default=100,
+        type=int,
+    )
+    args.add_argument(
+        "--launcher",
+        help="generate run_distributed.py that runs locust master and one worker per CPU core",
+        required=False,
+        action="store_true",
+        default=False,
+    )
+    args.add_argument(
+        "--validate-responses",
+        help="check status codes of responses and validate response bodies against schemas of responses",
+        required=False,
+        action="store_true",
+        default=False,
+    )
+    args.add_argument(
+        "--validation-sample",
+        help="validate body of 1 in N responses, VALIDATION_SAMPLE in base_constants.py overrides it on run",
+        required=False,
+        default=10,
+        type=int,
+    )
+    args.add_argument(
+        "--feeder",
+        help="NAME=PATH[:FORMAT], take values of param or constant NAME from newline-delimited (`lines`) "
+        "or binary (`int32`, `int64`) file, it is memory mapped and sharded between locust workers; can be repeated",
+        required=False,
+        action="append",
+        default=[],
+        type=parse_feeder,
+    )
+    args.add_argument(
+        "--feeder-cursor",
+        help="order of values taken from feeder files, FEEDER_CURSOR in base_constants.py overrides it on run",
+        required=False,
+        choices=FEEDER_CURSORS,
+        default="sequential",
+    )
+    args.add_argument(
+        "--chain-requests",
+        help="take path params from responses of operations that create them, e.g. `orderId` of `/orders/{orderId}` "
+        "from response of POST `/orders`, by OpenAPI links or names",
+        required=False,
+        action="store_true",
+        default=False,
+    )
+    args.add_argument(
+        "--profile",
+        help="path to write JSON report with time of stages and counters of the run to",
+        required=False,
+        type=Path,
+    )
+    args.add_argument(
+        "--profile-capture",
+        help="profile the run with cProfile into .prof file next to --profile report, "
+        "and add top memory allocations taken by tracemalloc to the report",
+        required=False,
+        action="store_true",
+        default=False,
+    )
+    parsed_args = args.parse_args(argv)
+    if parsed_args.profile_capture and parsed_args.profile is None:
+        args.error("--profile-capture requires --profile report path")
+    return parsed_args
 
-    main_start = log_result(args.results_path)
 
-    log = logging.getLogger(__name__)
-    log.debug("Command line args: %s", args)
-    swagger_file = args.swagger_file
-    ext = swagger_file.suffix
-    paths = [path.lower() for path in args.paths_white]
-    not_paths = [path.lower() for path in args.paths_black]
-    tags = [tag.lower() for tag in args.tags_white]
-    not_tags = [tag.lower() for tag in args.tags_black]
+def make_mask(args: argparse.Namespace) -> Dict[str, Set[str]]:
+    """Function: make mask of paths, tags, operations and operation ids from command line arguments"""
+
+    paths = args.paths_white
+    not_paths = args.paths_black
+    tags = args.tags_white
+    not_tags = args.tags_black
     if paths and not_paths:
         raise ValueError("Both `paths` and not `paths` arguments specified")
 
     if tags and not_tags:
         raise ValueError("Both `tags` and not `not_tags` arguments specified")
 
-    mask = {
+    return {
         "operations_white_list": set(args.operations),
         "paths_white_list": set(paths),
         "paths_black_list": set(not_paths),
         "tags_white_list": set(tags),
         "tags_black_list": set(not_tags),
+        "operation_ids_white_list": set(args.operation_ids_white),
+        "operation_ids_black_list": set(args.operation_ids_black),
     }
-    log.debug("Mask: %s", mask)
 
-    if ext == ".json":
-        with open(swagger_file) as file:
-            swagger_data = json.load(file)
-    elif ext in (".yaml", ".yml"):
-        with open(swagger_file) as file:
-            swagger_data = yaml.safe_load(file)
-    else:
-        raise ValueError("Incorrect file format")
-    swagger_strategy = BaseStrategy(swagger_data, args.results_path, mask)
+
+def make_config(args: argparse.Namespace) -> GeneratorConfig:
+    """Function: make generator config from command line arguments"""
+
+    if args.validation_sample < 1:
+        raise ValueError("`validation-sample` should be positive")
+
+    if args.app_name is not None and not args.app_name.isidentifier():
+        raise ValueError("`app-name` should be valid python identifier")
+
+    traffic_profile = None
+    if args.traffic_profile:
+        traffic_profile = TrafficProfile.load(args.traffic_profile)
+    return GeneratorConfig(
+        jobs=args.jobs,
+        user_class=args.user_class,
+        data_pools=args.data_pools,
+        traffic_profile=traffic_profile,
+        wait_mode=args.wait_mode,
+        target_rps=args.target_rps,
+        user_count=args.user_count,
+        launcher=args.launcher,
+        validate_responses=args.validate_responses,
+        validation_sample=args.validation_sample,
+        feeders={name: source._replace(path=source.path.resolve()) for name, source in args.feeder},
+        feeder_cursor=args.feeder_cursor,
+        chain_requests=args.chain_requests,
+        app_name=args.app_name,
+        conflict_policy=args.conflict_policy,
+    )
+
+
+def make_cache(args: argparse.Namespace) -> Optional[ParsedSpecCache]:
+    """Function: make parsed swagger files cache from command line arguments, None if it is disabled
+
+    Compiled templates are cached in the same cache dir unless caches are disabled.
+    """
+
+    if args.no_cache:
+        set_bytecode_cache(None)
+        return None
+    set_bytecode_cache(args.cache_dir)
+    return ParsedSpecCache(args.cache_dir, args.cache_size * 2 ** 20)
+
+
+def main():
+    """Launching function"""
+
+    args = parse_args()
+    coloredlogs.install(
+        level="DEBUG" if args.verbose else "INFO", fmt="%(asctime)s [%(levelname)s] %(filename)s: %(message)s"
+    )
+
+    profiler = Profiler(capture=args.profile_capture)
+    profiler.start()
+    with profiler.stage("log_result"):
+        main_start = log_result(args.results_path)
+
+    log = logging.getLogger(__name__)
+    log.debug("Command line args: %s", args)
+    mask = make_mask(args)
+    log.debug("Mask: %s", mask)
+    config = make_config(args)
+    swagger_strategy = BaseStrategy(
+        args.swagger_file, args.results_path, mask, make_cache(args), config, profiler=profiler
+    )
     try:
         swagger_strategy.process()
     except ValueError as error:
         logging.error(error)
 
-    log_diff(main_start, log_result(args.results_path), args.results_path)
+    with profiler.stage("log_result"):
+        main_end = log_result(args.results_path)
+    with profiler.stage("log_diff"):
+        log_diff(main_start, main_end, args.results_path)
+    profiler.stop()
+    if args.profile:
+        profiler.save(args.profile)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,216 @@
+"""Module: Batch mode, it generates locustfiles of many swagger files in one run without any prompts
+
+Manifest is JSON or YAML file with list of entries, or mapping with `entries` list and `args` common to all of them:
+
+    args: ["-o", "get", "post", "--user-class", "fast"]
+    entries:
+      - swagger_file: specs/orders.yaml
+        app_name: orders
+        args: ["--pw", "/orders*"]
+      - swagger_file: specs/users.json
+        app_name: users
+        results_path: generated/users
+
+Mask and other options of entries are set by `args` with the same flags as `swagger2locustio` command has.
+Relative paths of swagger files, results, traffic profiles and feeders are relative to the manifest.
+"""
+
+import time
+import argparse
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Set
+
+import yaml
+import coloredlogs
+
+from swagger2locustio.__main__ import add_cache_args, make_cache, make_config, make_mask, parse_args
+from swagger2locustio.cache import ParsedSpecCache
+from swagger2locustio.generators.base_generator import GeneratorConfig
+from swagger2locustio.strategy.base_strategy import BaseStrategy
+from swagger2locustio.utils import CONFLICT_POLICIES, log_diff, log_result
+
+LOG = logging.getLogger(__name__)
+
+# entries are never prompted, so conflicts are resolved by policy only
+BATCH_CONFLICT_POLICIES = tuple(policy for policy in CONFLICT_POLICIES if policy != "prompt")
+
+
+class BatchEntry(NamedTuple):
+    """Named Tuple: Batch Entry"""
+
+    swagger_file: Path
+    results_path: Path
+    app_name: str
+    mask: Dict[str, Set[str]]
+    config: GeneratorConfig
+
+
+class BatchResult(NamedTuple):
+    """Named Tuple: Batch Result"""
+
+    swagger_file: Path
+    app_name: str
+    seconds: float
+    error: Optional[str] = None
+
+
+def resolve_args_paths(args: argparse.Namespace, base_path: Path) -> None:
+    """Function: resolve relative paths of traffic profile and feeders of entry args against the manifest dir"""
+
+    if args.traffic_profile is not None:
+        args.traffic_profile = base_path / args.traffic_profile
+    args.feeder = [(name, source._replace(path=base_path / source.path)) for name, source in args.feeder]
+
+
+def load_manifest(manifest_file: Path, results_path: Path) -> List[BatchEntry]:
+    """Function: load entries of manifest, all of them are validated before any of them is processed"""
+
+    manifest = yaml.safe_load(manifest_file.read_text(encoding="utf-8"))
+    common_args: List[str] = []
+    if isinstance(manifest, dict):
+        common_args = [str(arg) for arg in manifest.get("args", [])]
+        manifest = manifest.get("entries")
+    if not isinstance(manifest, list) or not manifest:
+        raise ValueError(f"Manifest should have list of entries: {manifest_file}")
+    base_path = manifest_file.resolve().parent
+    entries = []
+    for num, raw_entry in enumerate(manifest):
+        if not isinstance(raw_entry, dict) or "swagger_file" not in raw_entry or "app_name" not in raw_entry:
+            raise ValueError(f"Entry {num} should have `swagger_file` and `app_name`")
+        argv = common_args + [str(arg) for arg in raw_entry.get("args", [])]
+        argv += ["-f", str(base_path / raw_entry["swagger_file"])]
+        argv += ["-r", str(base_path / raw_entry["results_path"] if "results_path" in raw_entry else results_path)]
+        argv += ["--app-name", str(raw_entry["app_name"])]
+        try:
+            args = parse_args(argv)
+        except SystemExit as error:
+            raise ValueError(f"Entry {num} has invalid args: {argv}") from error
+        resolve_args_paths(args, base_path)
+        entries.append(
+            BatchEntry(
+                swagger_file=args.swagger_file,
+                results_path=args.results_path.resolve(),
+                app_name=args.app_name,
+                mask=make_mask(args),
+                config=make_config(args),
+            )
+        )
+    return entries
+
+
+def process_entries(
+    entries: List[BatchEntry], cache: Optional[ParsedSpecCache], conflict_policy: str
+) -> List[BatchResult]:
+    """Function: process entries one by one, errors of entries are returned, so the rest of entries is processed"""
+
+    results = []
+    for entry in entries:
+        LOG.info("Processing %s as `%s` app", entry.swagger_file, entry.app_name)
+        start_time = time.perf_counter()
+        error = None
+        try:
+            start = log_result(entry.results_path)
+            config = replace(entry.config, conflict_policy=conflict_policy)
+            BaseStrategy(entry.swagger_file, entry.results_path, entry.mask, cache, config).process()
+            end = log_result(entry.results_path)
+            log_diff(start, end, entry.results_path)
+        except (ValueError, OSError) as exc:
+            LOG.error("%s: %s", entry.swagger_file, exc)
+            error = str(exc)
+        except Exception as exc:  # pylint: disable=broad-except
+            # unexpected error of an entry, e.g. of malformed swagger file, fails this entry only
+            LOG.exception("%s: unexpected error", entry.swagger_file)
+            error = f"{type(exc).__name__}: {exc}"
+        results.append(BatchResult(entry.swagger_file, entry.app_name, time.perf_counter() - start_time, error))
+    return results
+
+
+def process_manifest(
+    entries: List[BatchEntry], cache: Optional[ParsedSpecCache], conflict_policy: str, jobs: int = 1
+) -> List[BatchResult]:
+    """Function: process entries in this process or in pool of `jobs` processes
+
+    Entries with the same results path share files, e.g. `apps/base.py` and the manifest of generated files,
+    so they are processed one by one by the same process. Results are returned in the order of entries.
+    """
+
+    groups: Dict[Path, List[BatchEntry]] = {}
+    for entry in entries:
+        groups.setdefault(entry.results_path, []).append(entry)
+    if jobs <= 1 or len(groups) <= 1:
+        return process_entries(entries, cache, conflict_policy)
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {
+            # test classes are not rendered in nested process pools
+            results_path: executor.submit(
+                process_entries,
+                [entry._replace(config=replace(entry.config, jobs=1)) for entry in group],
+                cache,
+                conflict_policy,
+            )
+            for results_path, group in groups.items()
+        }
+        groups_results = {results_path: iter(future.result()) for results_path, future in futures.items()}
+    return [next(groups_results[entry.results_path]) for entry in entries]
+
+
+def parse_batch_args() -> argparse.Namespace:
+    """Function: parse command line arguments of batch mode"""
+
+    args = argparse.ArgumentParser(
+        prog="swagger2locustio-batch",
+        description="Generate locustfiles of all the swagger files of manifest without any prompts",
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter,
+    )
+    args.add_argument("manifest", help="path to JSON or YAML manifest of swagger files", type=Path)
+    args.add_argument(
+        "-r",
+        "--results-path",
+        help="path to store results of entries without their own `results_path`",
+        required=False,
+        default=Path("generated"),
+        type=Path,
+    )
+    args.add_argument(
+        "-j", "--jobs", help="number of processes to process entries in parallel", required=False, default=1, type=int
+    )
+    args.add_argument(
+        "-v", "--verbose", help="verbose", required=False, action="store_true", default=False,
+    )
+    args.add_argument(
+        "--conflict-policy",
+        help="what to do with previously generated files that are changed: "
+        "`overwrite` - overwrite them, `keep` - keep their previous content",
+        required=False,
+        choices=BATCH_CONFLICT_POLICIES,
+        default="overwrite",
+    )
+    add_cache_args(args)
+    return args.parse_args()
+
+
+def main():
+    """Launching function of batch mode"""
+
+    args = parse_batch_args()
+    coloredlogs.install(
+        level="DEBUG" if args.verbose else "INFO", fmt="%(asctime)s [%(levelname)s] %(filename)s: %(message)s"
+    )
+    entries = load_manifest(args.manifest, args.results_path)
+    LOG.info("%d entries are loaded from %s", len(entries), args.manifest)
+    results = process_manifest(entries, make_cache(args), args.conflict_policy, args.jobs)
+    for result in results:
+        status = "failed" if result.error is not None else "done"
+        LOG.info("%s `%s` %s in %.2fs", result.swagger_file, result.app_name, status, result.seconds)
+    failed = [result for result in results if result.error is not None]
+    LOG.info("%d of %d entries are done", len(results) - len(failed), len(results))
+    if failed:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""Module: Parsed swagger data cache"""
+
+import os
+import json
+import pickle  # nosec - cache files are created by the tool itself in the user cache dir
+import hashlib
+import logging
+from itertools import islice
+from pathlib import Path
+from typing import Any, BinaryIO, Iterable, Iterator, Optional, Set, Dict, Tuple
+
+from swagger2locustio.parsers.base_parser import PARSER_VERSION
+
+LOG = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "swagger2locustio"
+DEFAULT_CACHE_SIZE = 256 * 2 ** 20
+CACHE_FILE_SUFFIX = ".pickle"
+# Should be bumped each time format of cache files is changed
+CACHE_VERSION = "3"
+CHUNK_SIZE = 2 ** 20
+BROKEN_ENTRY_ERRORS = (
+    pickle.UnpicklingError,
+    EOFError,
+    AttributeError,
+    ImportError,
+    IndexError,
+    KeyError,
+    TypeError,
+    ValueError,
+)
+
+
+class RefsPickler(pickle.Pickler):
+    """Class: Refs Pickler
+
+    Pickles objects resolved by `$ref` which are already written to the file as references to them.
+    """
+
+    def __init__(self, file: BinaryIO, written_refs: Dict[int, str]):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.written_refs = written_refs
+
+    def persistent_id(self, obj: Any) -> Optional[str]:
+        return self.written_refs.get(id(obj))
+
+
+class RefsUnpickler(pickle.Unpickler):
+    """Class: Refs Unpickler
+
+    Unpickles references to objects resolved by `$ref` which are read from the file before.
+    """
+
+    def __init__(self, file: BinaryIO, refs: Dict[str, Any]):
+        super().__init__(file)
+        self.refs = refs
+
+    def persistent_load(self, pid: Any) -> Any:
+        return self.refs[pid]
+
+
+class ParsedSpecCache:
+    """Class: Parsed Spec Cache
+
+    Stores results of `SwaggerBaseParser.parse_swagger_file` keyed by swagger file content, parser version and mask.
+    Least recently used entries are evicted when total size of the cache exceeds `max_size` bytes.
+    Entry is a header with host, security and path names followed by one record per path, so paths are written
+    while they are parsed and read back while they are consumed, all of them are never kept in memory.
+    Objects resolved by `$ref` are shared by many paths, every one of them is written once, in the record of the first
+    path that refers to it, and later records refer to it, so they are shared again when they are read back.
+    """
+
+    def __init__(self, cache_dir: Path = DEFAULT_CACHE_DIR, max_size: int = DEFAULT_CACHE_SIZE):
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+
+    @staticmethod
+    def make_key(swagger_file: Path, mask: Dict[str, Set[str]]) -> str:
+        """Method: make cache key"""
+
+        key = hashlib.blake2b(digest_size=20)
+        key.update(CACHE_VERSION.encode())
+        key.update(PARSER_VERSION.encode())
+        key.update(json.dumps({name: sorted(values) for name, values in mask.items()}, sort_keys=True).encode())
+        with open(swagger_file, "rb") as file:
+            for chunk in iter(lambda: file.read(CHUNK_SIZE), b""):
+                key.update(chunk)
+        return key.hexdigest()
+
+    def get(self, key: str) -> Optional[dict]:
+        """Method: get parsed swagger data, None if there is no such entry
+
+        Paths data is an iterator, which reads paths one by one while it is consumed, and names of them are listed
+        in `path_names`. ValueError is raised by it if the entry turns out to be broken, the entry is removed then.
+        """
+
+        cache_file = self._get_cache_file(key)
+        try:
+            with open(cache_file, "rb") as file:
+                header = pickle.load(file)  # nosec
+                offset = file.tell()
+        except FileNotFoundError:
+            return None
+        except BROKEN_ENTRY_ERRORS as error:
+            LOG.warning("Broken cache entry %s is removed: %s", cache_file, error)
+            self._remove(cache_file)
+            return None
+        if not isinstance(header, dict) or not {"host", "security", "path_names"}.issubset(header):
+            LOG.warning("Broken cache entry %s is removed: no header", cache_file)
+            self._remove(cache_file)
+            return None
+        os.utime(cache_file)  # mark entry as recently used
+        return dict(header, paths=self._read_paths(cache_file, offset, len(header["path_names"])))
+
+    def put(self, key: str, swagger_data: dict) -> dict:
+        """Method: put parsed swagger data, it is returned with paths data, which is written while it is consumed
+
+        Paths data is either dict or iterator of (path, methods data) pairs with names of its paths in `path_names`.
+        Objects resolved by `$ref` are taken from `refs`, which is filled while paths are parsed.
+        The entry is added once all the paths are consumed, it is not added if consuming of them is not finished.
+        """
+
+        paths_data = swagger_data["paths"]
+        if isinstance(paths_data, dict):
+            path_names, paths_items = list(paths_data), paths_data.items()
+        else:
+            path_names, paths_items = swagger_data["path_names"], paths_data
+        header = {"host": swagger_data["host"], "security": swagger_data["security"], "path_names": path_names}
+        refs = swagger_data.get("refs", {})
+        return dict(header, paths=self._write_paths(self._get_cache_file(key), header, paths_items, refs))
+
+    def _read_paths(self, cache_file: Path, offset: int, paths_count: int) -> Iterator[Tuple[str, dict]]:
+        refs: Dict[str, Any] = {}
+        with open(cache_file, "rb") as file:
+            file.seek(offset)
+            for _ in range(paths_count):
+                try:
+                    new_refs, path_item = RefsUnpickler(file, refs).load()  # nosec
+                    refs.update(new_refs)
+                except BROKEN_ENTRY_ERRORS as error:
+                    LOG.warning("Broken cache entry %s is removed: %s", cache_file, error)
+                    self._remove(cache_file)
+                    raise ValueError(f"Cache entry is broken, run again: {error}") from error
+                yield path_item
+
+    def _write_paths(
+        self, cache_file: Path, header: dict, paths_items: Iterable[Tuple[str, dict]], refs: Dict[str, Any]
+    ) -> Iterator:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        written_refs: Dict[int, str] = {}
+        written_count = 0
+        completed = False
+        try:
+            with open(tmp_file, "wb") as file:
+                pickle.dump(header, file, protocol=pickle.HIGHEST_PROTOCOL)
+                for path_item in paths_items:
+                    # refs are only added while paths are parsed, the ones resolved for this path are written with it
+                    new_refs = dict(islice(refs.items(), written_count, None))
+                    # every path is pickled by a pickler of its own, so pickled paths are not referenced by its memo
+                    RefsPickler(file, written_refs).dump((new_refs, path_item))
+                    written_count += len(new_refs)
+                    for name, value in new_refs.items():
+                        written_refs.setdefault(id(value), name)
+                    yield path_item
+            os.replace(tmp_file, cache_file)
+            completed = True
+        finally:
+            if not completed:
+                self._remove(tmp_file)
+        self._evict()
+
+    @staticmethod
+    def _remove(cache_file: Path) -> None:
+        try:
+            cache_file.unlink()
+        except FileNotFoundError:  # already removed by concurrent run
+            pass
+
+    def _get_cache_file(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{CACHE_FILE_SUFFIX}"
+
+    def _evict(self) -> None:
+        entries = []
+        for cache_file in self.cache_dir.glob(f"*{CACHE_FILE_SUFFIX}"):
+            try:
+                stat = cache_file.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, cache_file))
+        entries.sort()
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, cache_file in entries[:-1]:
+            if total_size <= self.max_size:
+                break
+            LOG.debug("Cache entry %s is evicted", cache_file)
+            self._remove(cache_file)
+            total_size -= size
@@ -0,0 +1,29 @@
+"""Module: Feeders"""
+
+import argparse
+from pathlib import Path
+from typing import NamedTuple, Tuple
+
+# `lines` files are newline-delimited text, `int32` and `int64` files are arrays of little-endian integers
+FEEDER_FORMATS = ("lines", "int32", "int64")
+FEEDER_CURSORS = ("sequential", "random")
+
+
+class FeederSource(NamedTuple):
+    """Named Tuple: Feeder Source"""
+
+    path: Path
+    file_format: str = "lines"
+
+
+def parse_feeder(value: str) -> Tuple[str, FeederSource]:
+    """Function: parse `NAME=PATH[:FORMAT]` feeder argument, NAME is param name or constant name, PATH is kept as is"""
+
+    name, separator, path = value.partition("=")
+    if not separator or not name or not path:
+        raise argparse.ArgumentTypeError(f"Feeder should be NAME=PATH[:FORMAT]: {value}")
+    file_format = "lines"
+    path_part, _, format_part = path.rpartition(":")
+    if path_part and format_part in FEEDER_FORMATS:
+        path, file_format = path_part, format_part
+    return name, FeederSource(path=Path(path), file_format=file_format)
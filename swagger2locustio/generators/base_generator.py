@@ -2,10 +2,21 @@
 
 import re
 import logging
-from dataclasses import dataclass, field
+from collections import Counter, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import List, Dict, Union, Any
+from typing import List, Dict, Any, Tuple, Iterable, Iterator, Optional, Deque
 
+from swagger2locustio.feeders import FeederSource
+from swagger2locustio.parsers.base_parser import Param
+from swagger2locustio.generators.body_compiler import BodyCompiler
+from swagger2locustio.generators.file_writer import FileWriter
+from swagger2locustio.generators.fingerprints import Fingerprints
+from swagger2locustio.generators.request_chains import apply_request_chains
+from swagger2locustio.generators.validator_compiler import ValidatorCompiler
+from swagger2locustio.traffic_profile import TrafficProfile, scale_weights
+from swagger2locustio.utils import changed_files_user_check
 from swagger2locustio.templates import locustfile_templates as l_templates
 from swagger2locustio.templates import helpers_templates
 from swagger2locustio.templates import auth_templates
@@ -15,6 +26,13 @@ LOG = logging.getLogger(__name__)
 
 PATH_PARAMS_PATTERN = re.compile(r"{.*?}", re.UNICODE)
 IDENTIFIER_PATTERN = re.compile(r"[^\d\w/]", re.UNICODE)
+CONSTANT_NAME_PATTERN = re.compile(r"[^A-Z0-9_]")
+PARAM_LOCATIONS = ("path", "query", "header", "cookie", "formData")
+FORM_MEDIA_TYPE_PATTERN = re.compile(r"^(application/x-www-form-urlencoded|multipart/form-data)", re.UNICODE)
+DEFAULT_TARGET_RPS = 10.0
+# max number of test classes sent to worker process at once, and max number of chunks per worker in flight
+RENDER_CHUNK_SIZE = 64
+RENDER_CHUNKS_PER_JOB = 2
 
 
 @dataclass(frozen=True, order=True)
@@ -24,6 +42,7 @@ class Constant:
     name: str
     val: Any
     value_type: str
+    kind: str = "list"
 
 
 @dataclass
@@ -32,6 +51,9 @@ class TestMethod:
 
     method_data: str
     constants: List[Constant]
+    request_plan: str = ""
+    bodies: Dict[str, str] = field(default_factory=dict)
+    validators: Dict[str, str] = field(default_factory=dict)
 
 
 @dataclass
@@ -41,28 +63,106 @@ class TestClass:
     file_path: Path
     file_name: str
     class_name: str
-    test_methods: List[TestMethod] = field(default_factory=lambda: [])
+    operations: List[Tuple[str, str, dict]] = field(default_factory=lambda: [])
 
 
-class BaseGenerator:
+@dataclass
+class RenderedTestClass:  # pylint: disable=too-many-instance-attributes
+    """Data Class: Rendered Test Class"""
+
+    file_path: Path
+    file_name: str
+    class_name: str
+    methods_count: int
+    class_file: str
+    constants_file: str
+    warnings: List[str]
+    bodies: Dict[str, str] = field(default_factory=dict)
+    validators: Dict[str, str] = field(default_factory=dict)
+    unchanged: bool = False
+
+
+@dataclass
+class GeneratorConfig:  # pylint: disable=too-many-instance-attributes
+    """Data Class: Generator Config"""
+
+    jobs: int = 1
+    user_class: str = "http"
+    data_pools: bool = False
+    traffic_profile: Optional[TrafficProfile] = None
+    wait_mode: str = "between"
+    target_rps: Optional[float] = None
+    user_count: int = 100
+    launcher: bool = False
+    validate_responses: bool = False
+    validation_sample: int = 10
+    feeders: Dict[str, FeederSource] = field(default_factory=dict)
+    feeder_cursor: str = "sequential"
+    chain_requests: bool = False
+    app_name: Optional[str] = None
+    conflict_policy: str = "prompt"
+
+
+class BaseGenerator:  # pylint: disable=too-many-instance-attributes,too-many-public-methods
     """Class: Base Generator"""
 
-    def __init__(self, results_path: Path):
+    def __init__(self, results_path: Path, config: Optional[GeneratorConfig] = None):
         self.test_classes_mapping: Dict[str, TestClass] = {}
+        self.test_classes_order: Dict[str, int] = {}
+        self.operations_count = 0
+        self.rendered_methods_count = 0
         self.results_path = results_path
+        self.config = config if config is not None else GeneratorConfig()
+        self.writer = FileWriter(results_path)
         self.apps_path = Path("apps")
         constants_path = Path("constants")
-        self.app_name = self.get_app_name()
+        self.app_name = self.config.app_name or self.get_app_name()
         self.current_app_path = self.apps_path / self.app_name
         self.tests_path = self.current_app_path / "tasksets" / "generated_tests"
         self.current_app_constants_path = self.current_app_path / "constants"
+        # traffic profile is already applied to weights of operations, jobs and conflict policy do not change
+        # rendered files
+        self.fingerprints = Fingerprints(
+            results_path,
+            self.app_name,
+            repr(replace(self.config, jobs=1, traffic_profile=None, conflict_policy="prompt")),
+        )
         (self.results_path / self.tests_path).mkdir(exist_ok=True, parents=True)
         (self.results_path / constants_path).mkdir(exist_ok=True, parents=True)
         (self.results_path / self.current_app_constants_path).mkdir(exist_ok=True, parents=True)
-        (self.results_path / constants_path / "base_constants.py").write_text(
-            constants_templates.CONSTANTS_BASE_FILE.render()
+        self.writer.write(
+            self.results_path / constants_path / "base_constants.py",
+            constants_templates.CONSTANTS_BASE_FILE.render(
+                user_class=self.config.user_class,
+                data_pools=self.config.data_pools,
+                wait_mode=self.config.wait_mode,
+                target_rps=self.get_target_rps(),
+                user_count=self.config.user_count,
+                worker_constants=self.config.launcher or self.config.data_pools or bool(self.config.feeders),
+                feeder_cursor=self.config.feeder_cursor if self.config.feeders else None,
+                chain_requests=self.config.chain_requests,
+                validation_sample=self.config.validation_sample if self.config.validate_responses else None,
+            ),
         )
-        (self.results_path / self.apps_path / "helper.py").write_text(helpers_templates.HELPER_CLASS.render())
+        self.writer.write(self.results_path / self.apps_path / "helper.py", helpers_templates.HELPER_CLASS.render())
+        if self.config.data_pools:
+            self.writer.write(
+                self.results_path / self.apps_path / "data_pool.py", helpers_templates.DATA_POOL_FILE.render()
+            )
+        if self.config.feeders:
+            for name, source in self.config.feeders.items():
+                if not source.path.is_file():
+                    LOG.warning("Feeder file of %s does not exist: %s", name, source.path)
+            self.writer.write(self.results_path / self.apps_path / "feeder.py", helpers_templates.FEEDER_FILE.render())
+
+    def get_target_rps(self) -> float:
+        """Method: get total RPS of target_rps wait mode, it is taken from traffic profile unless it is set"""
+
+        if self.config.target_rps is not None:
+            return self.config.target_rps
+        if self.config.traffic_profile is not None:
+            return round(self.config.traffic_profile.total_rps, 3)
+        return DEFAULT_TARGET_RPS
 
     def get_app_name(self):
         """Method: returns app name"""
@@ -84,57 +184,167 @@ class BaseGenerator:
         return dir_name
 
     def generate_locustfiles(self, swagger_data: dict) -> None:
-        """Method: generate locustfiles"""
-
-        self.generate_test_classes(swagger_data["paths"])
-        security_cases = self.generate_security_cases(swagger_data["security"])
-        test_classes_imports = []
-        test_classes_inheritance = []
-        for test_class in self.test_classes_mapping.values():
-            methods_count = len(test_class.test_methods)
-            if not methods_count:
-                continue
-            class_methods = []
-            class_constants = []
-            for test_method in test_class.test_methods:
-                class_methods.append(test_method.method_data)
-                class_constants.extend(test_method.constants)
-            methods_str = "".join(class_methods)
-            class_file_path = self.results_path / self.tests_path / test_class.file_path
-            class_file_path.mkdir(parents=True, exist_ok=True)
-            file_name = f"{test_class.file_name}.py"
-            class_constants = list(sorted(set(class_constants)))
-            constants_str = ", ".join([constant.name for constant in class_constants])
-            import_path = str(self.tests_path / test_class.file_path / test_class.file_name).replace("/", ".")
-            test_classes_imports.append(f"from {import_path} import {test_class.class_name}")
-            test_classes_inheritance.append(test_class.class_name)
-            (class_file_path / file_name).write_text(
-                l_templates.TEST_CLASS_FILE.render(
-                    file_name=test_class.file_name,
-                    test_methods=methods_str,
-                    class_name=test_class.class_name,
-                    constants=constants_str,
-                    app_name=self.app_name,
-                )
-            )
-            if class_constants:
-                (self.results_path / self.current_app_constants_path / file_name).write_text(
-                    constants_templates.CONSTANTS_FILE.render(constants=class_constants)
-                )
-        (self.results_path / "locustfile.py").write_text(
-            l_templates.MAIN_LOCUSTFILE.render(host=swagger_data["host"], app_name=self.app_name,)
+        """Method: generate locustfiles
+
+        Paths data is either dict or iterator of (path, methods data) pairs with names of its paths in `path_names`,
+        test classes are rendered and written as soon as all their paths are consumed.
+        """
+
+        paths_data = swagger_data["paths"]
+        if self.config.traffic_profile is not None or self.config.chain_requests:
+            # weights and chains depend on all the operations, so all of them are collected
+            paths_data = paths_data if isinstance(paths_data, dict) else dict(paths_data)
+        if self.config.traffic_profile is not None:
+            paths_data = self.apply_traffic_profile(paths_data, self.config.traffic_profile)
+        if self.config.chain_requests:
+            paths_data = apply_request_chains(paths_data)
+        if isinstance(paths_data, dict):
+            path_names, paths_items = list(paths_data), paths_data.items()
+        else:
+            path_names, paths_items = swagger_data["path_names"], paths_data
+        test_classes_paths = Counter(self.get_test_class_names(path)[2] for path in path_names)
+        security_cases = self.generate_security_cases(
+            swagger_data["security"], "self.headers" if self.config.user_class == "fast" else "self.client.headers"
+        )
+        test_classes = self.stream_test_classes(paths_items, test_classes_paths)
+        test_classes_imports, test_classes_inheritance = self.write_test_classes(
+            self.render_test_classes(test_classes, len(test_classes_paths))
+        )
+        self.write_app_files(swagger_data["host"], security_cases, test_classes_imports, test_classes_inheritance)
+
+    def write_app_files(
+        self, host: str, security_cases: str, test_classes_imports: List[str], test_classes_inheritance: List[str]
+    ) -> None:
+        """Method: write files of app, resolve conflicts of changed files, and save fingerprints and manifest"""
+
+        wait_function, wait_time, wait_constants = l_templates.WAIT_TIME_MAPPING[self.config.wait_mode]
+        wait_params = {"wait_function": wait_function, "wait_time": wait_time, "wait_constants": wait_constants}
+        self.writer.write(
+            self.results_path / "locustfile.py",
+            l_templates.MAIN_LOCUSTFILE.render(
+                host=host, app_name=self.app_name, user_class=self.config.user_class, **wait_params
+            ),
         )
-        (self.results_path / self.current_app_path / "generated_taskset.py").write_text(
+        self.writer.write(
+            self.results_path / self.current_app_path / "generated_taskset.py",
             l_templates.GENERATED_TASKSET_FILE.render(
                 test_classes_names=test_classes_inheritance, test_classes_imports=test_classes_imports,
-            )
+            ),
         )
-        (self.results_path / self.apps_path / "base.py").write_text(
-            l_templates.BASE_TASKSET_FILE.render(security_cases=security_cases,)
+        self.writer.write(
+            self.results_path / self.apps_path / "base.py",
+            l_templates.BASE_TASKSET_FILE.render(
+                security_cases=security_cases,
+                user_class=self.config.user_class,
+                chain_requests=self.config.chain_requests,
+            ),
         )
+        if self.config.launcher:
+            self.generate_launcher()
+        # conflicts are resolved before saving, so kept files are not taken as generated ones by the next run
+        kept_files = changed_files_user_check(self.writer, self.config.conflict_policy)
+        self.fingerprints.log_changes()
+        self.fingerprints.drop_files(kept_files)
+        self.fingerprints.save()
+        self.writer.save_manifest()
         LOG.info("%s test methods were created successfully", len(test_classes_inheritance))
 
-    def _get_or_create_test_class(self, ulr_path: str) -> TestClass:
+    def write_test_classes(self, test_classes: Iterable[RenderedTestClass]) -> Tuple[List[str], List[str]]:
+        """Method: write rendered test classes, their constants and shared bodies, imports and names are returned
+
+        Test classes are written as soon as they are rendered, only their imports and names are kept.
+        """
+
+        imports: List[Tuple[int, str, str]] = []
+        bodies: Dict[str, str] = {}
+        validators: Dict[str, str] = {}
+        unchanged_count = 0
+        for test_class in test_classes:
+            for warning in test_class.warnings:
+                logging.warning(warning)
+            if test_class.unchanged:
+                unchanged_count += 1
+            else:
+                self.rendered_methods_count += test_class.methods_count
+                self.fingerprints.put(test_class.class_name, self.write_test_class(test_class))
+            if not test_class.methods_count:
+                continue
+            import_path = str(self.tests_path / test_class.file_path / test_class.file_name).replace("/", ".")
+            import_str = f"from {import_path} import {test_class.class_name}"
+            imports.append((self.test_classes_order[test_class.class_name], import_str, test_class.class_name))
+            bodies.update(test_class.bodies)
+            validators.update(test_class.validators)
+        LOG.info("%d test classes are not changed since the previous run", unchanged_count)
+        # test classes are yielded once their last paths are parsed, imports keep order of their first paths
+        imports.sort()
+        test_classes_imports = [import_str for _, import_str, _ in imports]
+        test_classes_inheritance = [class_name for _, _, class_name in imports]
+        if bodies:
+            self.writer.write(
+                self.results_path / self.current_app_path / "bodies.py",
+                helpers_templates.BODIES_FILE.render(functions=[bodies[name] for name in sorted(bodies)]),
+            )
+        if self.config.validate_responses:
+            self.writer.write(
+                self.results_path / self.current_app_path / "validators.py",
+                helpers_templates.VALIDATORS_FILE.render(functions=[validators[name] for name in sorted(validators)]),
+            )
+        return test_classes_imports, test_classes_inheritance
+
+    def write_test_class(self, test_class: RenderedTestClass) -> dict:
+        """Method: write files of rendered test class, its entry to be kept by fingerprints is returned"""
+
+        file_name = f"{test_class.file_name}.py"
+        files = []
+        if test_class.methods_count:
+            files.append(self.tests_path / test_class.file_path / file_name)
+        if test_class.methods_count and test_class.constants_file:
+            files.append(self.current_app_constants_path / file_name)
+        for file_path, content in zip(files, (test_class.class_file, test_class.constants_file)):
+            self.writer.write(self.results_path / file_path, content)
+        return {
+            "files": [file_path.as_posix() for file_path in files],
+            "methods_count": test_class.methods_count,
+            "bodies": test_class.bodies,
+            "validators": test_class.validators,
+        }
+
+    def get_unchanged_test_class(self, test_class: TestClass) -> Optional[RenderedTestClass]:
+        """Method: get test class, which is not needed to be rendered again, from fingerprints of the previous run"""
+
+        self.fingerprints.fingerprint_operations(test_class.class_name, test_class.operations)
+        entry = self.fingerprints.get_unchanged(test_class.class_name, self.writer.files)
+        if entry is None:
+            return None
+        self.fingerprints.put(test_class.class_name, entry)
+        return RenderedTestClass(
+            file_path=test_class.file_path,
+            file_name=test_class.file_name,
+            class_name=test_class.class_name,
+            methods_count=entry["methods_count"],
+            class_file="",
+            constants_file="",
+            warnings=[],
+            bodies=entry["bodies"],
+            validators=entry["validators"],
+            unchanged=True,
+        )
+
+    def generate_launcher(self) -> None:
+        """Method: generate script that runs locust master and workers"""
+
+        flags = l_templates.DISTRIBUTED_FLAGS_MAPPING[self.config.user_class]
+        self.writer.write(
+            self.results_path / "run_distributed.py",
+            l_templates.LAUNCHER_FILE.render(
+                worker_flag=flags["worker"], expect_workers_flag=flags["expect_workers"], users_flag=flags["users"]
+            ),
+        )
+
+    @staticmethod
+    def get_test_class_names(ulr_path: str) -> Tuple[Path, str, str]:
+        """Method: get file path, file name and class name of test class of path"""
+
         file_path_str = re.sub(PATH_PARAMS_PATTERN, "", ulr_path)
         file_path_str = file_path_str.strip("/")
         file_path_str = re.sub(IDENTIFIER_PATTERN, "_", file_path_str)
@@ -147,11 +357,15 @@ class BaseGenerator:
         file_name = file_name.title()
         class_name = file_name.replace(" ", "")
         file_name = file_name.replace(" ", "_")
+        return file_path, file_name, class_name
 
+    def _get_or_create_test_class(self, ulr_path: str) -> TestClass:
+        file_path, file_name, class_name = self.get_test_class_names(ulr_path)
         test_class = self.test_classes_mapping.get(class_name)
         if test_class is None:
             test_class = TestClass(file_path=file_path, file_name=file_name, class_name=class_name)
             self.test_classes_mapping[class_name] = test_class
+            self.test_classes_order.setdefault(class_name, len(self.test_classes_order))
         return test_class
 
     def generate_test_classes(self, paths_data: dict) -> None:
@@ -161,69 +375,309 @@ class BaseGenerator:
             test_class = self._get_or_create_test_class(ulr_path)
 
             for method, method_data in methods_data.items():
-                # responses_data = method_data.get("responses", {})
-                constants: List[Constant] = []
-                try:
-                    params = self.extract_params(method_data.get("params", {}), constants, len(test_class.test_methods))
-                except ValueError as error:
-                    logging.warning(error)
+                test_class.operations.append((ulr_path, method, method_data))
+
+    def stream_test_classes(
+        self, paths_items: Iterable[Tuple[str, dict]], test_classes_paths: Dict[str, int]
+    ) -> Iterator[TestClass]:
+        """Method: generate test cases, test class is yielded as soon as all its paths, counted in advance, are consumed
+
+        Yielded test classes are removed from mapping, so their parsed data is released once they are written.
+        """
+
+        remaining_paths = dict(test_classes_paths)
+        for ulr_path, methods_data in paths_items:
+            test_class = self._get_or_create_test_class(ulr_path)
+            for method, method_data in methods_data.items():
+                test_class.operations.append((ulr_path, method, method_data))
+            self.operations_count += len(methods_data)
+            remaining_paths[test_class.class_name] = remaining_paths.get(test_class.class_name, 1) - 1
+            if remaining_paths[test_class.class_name] <= 0:
+                yield self.test_classes_mapping.pop(test_class.class_name)
+        # paths are counted in advance, so test classes are left here only if some paths were not consumed
+        for class_name in list(self.test_classes_mapping):
+            yield self.test_classes_mapping.pop(class_name)
+
+    @staticmethod
+    def apply_traffic_profile(paths_data: dict, traffic_profile: TrafficProfile) -> dict:
+        """Method: set weights of operations according to traffic profile, operations without traffic get 0"""
+
+        operations = [(path, method) for path, methods_data in paths_data.items() for method in methods_data]
+        weights = scale_weights(traffic_profile.match(operations))
+        missing = len(operations) - len(weights)
+        if missing:
+            LOG.warning("%d operations are missing in traffic profile, their weight is 0", missing)
+        return {
+            path: {
+                method: dict(method_data, weight=weights.get((path, method), 0))
+                for method, method_data in methods_data.items()
+            }
+            for path, methods_data in paths_data.items()
+        }
+
+    def render_test_classes(
+        self, test_classes: Iterable[TestClass], test_classes_count: int
+    ) -> Iterator[RenderedTestClass]:
+        """Method: render test classes, in parallel if it is configured, unchanged test classes are not rendered
+
+        Chunks of test classes are rendered by worker processes, only a few chunks of them are in flight, and results
+        are yielded in order of submission, so warnings are logged in the same order as in serial run.
+        Unchanged test classes are yielded at once, ahead of chunks in flight.
+        """
+
+        # traffic profile is already applied, it is not needed to be sent to worker processes
+        config = replace(self.config, traffic_profile=None)
+        if self.config.jobs <= 1 or test_classes_count <= 1:
+            for test_class in test_classes:
+                unchanged_test_class = self.get_unchanged_test_class(test_class)
+                yield unchanged_test_class or render_test_class(test_class, self.app_name, config)
+            return
+        chunk_size = max(1, min(RENDER_CHUNK_SIZE, test_classes_count // (self.config.jobs * 4)))
+        pending: Deque[Future] = deque()
+        chunk: List[TestClass] = []
+        with ProcessPoolExecutor(max_workers=self.config.jobs) as executor:
+            for test_class in test_classes:
+                unchanged_test_class = self.get_unchanged_test_class(test_class)
+                if unchanged_test_class is not None:
+                    yield unchanged_test_class
                     continue
-                test_method_data = l_templates.FUNC.render(
-                    func_name=f"{test_class.file_name.lower()}_test_{len(test_class.test_methods)}",
-                    method=method,
-                    path=ulr_path,
-                    path_params=params["path_params"],
-                    query_params=params["query_params"],
-                    header_params=params["header_params"],
-                    cookie_params=params["cookie_params"],
+                chunk.append(test_class)
+                if len(chunk) >= chunk_size:
+                    pending.append(executor.submit(render_test_classes_chunk, chunk, self.app_name, config))
+                    chunk = []
+                while len(pending) > self.config.jobs * RENDER_CHUNKS_PER_JOB:
+                    yield from pending.popleft().result()
+            if chunk:
+                pending.append(executor.submit(render_test_classes_chunk, chunk, self.app_name, config))
+            while pending:
+                yield from pending.popleft().result()
+
+    @staticmethod
+    def render_test_methods(test_class: TestClass, config: GeneratorConfig) -> Tuple[List[TestMethod], List[str]]:
+        """Method: render test methods of test class, warnings about skipped operations are returned as well"""
+
+        test_methods: List[TestMethod] = []
+        warnings = []
+        compiler = BodyCompiler()
+        validator_compiler = ValidatorCompiler() if config.validate_responses else None
+        for ulr_path, method, method_data in test_class.operations:
+            func_name = f"{test_class.file_name.lower()}_test_{len(test_methods)}"
+            try:
+                test_methods.append(
+                    BaseGenerator.render_test_method(
+                        func_name,
+                        (ulr_path, method, method_data),
+                        len(test_methods),
+                        config,
+                        (compiler, validator_compiler),
+                    )
                 )
-                test_class.test_methods.append(TestMethod(method_data=test_method_data, constants=constants))
-
-    def extract_params(self, params: dict, constants: List[Constant], method_num: int) -> Dict[str, Union[str, dict]]:
-        """Method: extract params"""
-        path_params: List[dict] = []
-        query_params: List[dict] = []
-        header_params: List[dict] = []
-        cookie_params: List[dict] = []
-        for param, param_config in params.items():
-            param_location = param_config.get("in")
-            if param_location == "query":
-                target_params = query_params
-            elif param_location == "path":
-                target_params = path_params
-            elif param_location == "header":
-                target_params = header_params
-            elif param_location == "cookie":
-                target_params = cookie_params
+            except ValueError as error:
+                warnings.append(str(error))
+                continue
+            if config.data_pools:
+                warnings.extend(
+                    f"{method.upper()} {ulr_path}: there is no data pool of {constant.value_type or 'untyped'} "
+                    f"param without default, fill in values of `{constant.name}` constant"
+                    for constant in test_methods[-1].constants
+                    if constant.kind == "list" and not constant.val
+                )
+        return test_methods, warnings
+
+    @staticmethod
+    def render_test_method(  # pylint: disable=too-many-locals
+        func_name: str,
+        operation: Tuple[str, str, dict],
+        method_num: int,
+        config: GeneratorConfig,
+        compilers: Tuple[BodyCompiler, Optional[ValidatorCompiler]],
+    ) -> TestMethod:
+        """Method: render test method of (path, method, method data) operation, ValueError is raised if it is skipped
+
+        Responses are validated if validator compiler is given. Chained params are taken from values
+        saved by producers of them, DELETE operations remove the values they use.
+        """
+
+        ulr_path, method, method_data = operation
+        compiler, validator_compiler = compilers
+        constants: List[Constant] = []
+        chain_function = "chain_pop" if method == "delete" else "chain_value"
+        params = BaseGenerator.extract_params(
+            method_data.get("params", {}),
+            constants,
+            method_num,
+            config,
+            compiler,
+            chains={
+                param: f"self.{chain_function}({key!r}, "
+                for param, key in method_data.get("chain_consumers", {}).items()
+            },
+        )
+        request_plan, url = BaseGenerator.make_request_plan(func_name, ulr_path, params["path_params"])
+        responses = ""
+        validators: Dict[str, str] = {}
+        if validator_compiler is not None and method_data.get("responses"):
+            responses_plan, responses = BaseGenerator.make_responses_plan(
+                func_name, method_data["responses"], validator_compiler, validators
+            )
+            request_plan += "\n" + responses_plan
+        weight = method_data.get("weight")
+        template_params: Dict[str, Any] = {
+            "func_name": func_name,
+            "weight": 1 if weight is None else weight,
+            "method": method,
+            "url": url,
+            "body": params["body"],
+            "responses": responses,
+            "chain_saves": [
+                f"self.save_chain_value({key!r}, response, {pointer!r})"
+                for key, pointer in method_data.get("chain_producers", [])
+            ],
+        }
+        if config.user_class == "fast":
+            test_method_data = BaseGenerator.render_fast_test_method(params, **template_params)
+        else:
+            test_method_data = l_templates.FUNC.render(
+                query_params=params["query_params"],
+                header_params=params["header_params"],
+                cookie_params=params["cookie_params"],
+                **template_params,
+            )
+        body_function = params["body_function"]
+        return TestMethod(
+            method_data=test_method_data,
+            constants=constants,
+            request_plan=request_plan,
+            bodies={body_function: compiler.functions[body_function]} if body_function else {},
+            validators=validators,
+        )
+
+    @staticmethod
+    def make_request_plan(func_name: str, ulr_path: str, path_params: str) -> Tuple[str, str]:
+        """Method: make module level url template of test method and url expression that uses it
+
+        Url template is prefixed once on import, path params are filled in by bound `str.format` of the template.
+        """
+
+        url_name = f"{func_name.upper()}_URL"
+        if not path_params:
+            return f'{url_name} = API_PREFIX + "{ulr_path}"', url_name
+        return f'{url_name} = (API_PREFIX + "{ulr_path}").format', f"{url_name}({path_params[2:]})"
+
+    @staticmethod
+    def make_responses_plan(
+        func_name: str, responses: dict, validator_compiler: ValidatorCompiler, validators: Dict[str, str]
+    ) -> Tuple[str, str]:
+        """Method: make module level `{status: validator}` dict of test method and its name
+
+        Validators of responses are compiled once on generation, their sources are added to `validators`.
+        """
+
+        responses_name = f"{func_name.upper()}_RESPONSES"
+        responses_validators, validator_names = validator_compiler.compile_responses(responses)
+        validators.update((name, validator_compiler.functions[name]) for name in validator_names)
+        return f"{responses_name} = {responses_validators}", responses_name
+
+    @staticmethod
+    def render_fast_test_method(params: Dict[str, str], url: str, **template_params: Any) -> str:
+        """Method: render test method for FastHttpUser
+
+        FastHttpUser client has neither `params` nor `cookies` arguments, nor session headers,
+        so query is encoded into url, cookies are sent in `Cookie` header and default headers are kept by TaskSet.
+        """
+
+        if params["query_params"] != "{}":
+            url += f' + "?" + urlencode({params["query_params"]})'
+        headers = ["**self.headers"]
+        if params["header_params"] != "{}":
+            headers.append(params["header_params"][1:-1])
+        if params["cookie_params"] != "{}":
+            headers.append(f'"Cookie": self.cookie_header({params["cookie_params"]})')
+        headers_str = "self.headers" if len(headers) == 1 else "{" + ", ".join(headers) + "}"
+        return l_templates.FAST_FUNC.render(url=url, headers=headers_str, **template_params)
+
+    @staticmethod
+    def extract_params(  # pylint: disable=too-many-arguments
+        params: Dict[str, Param],
+        constants: List[Constant],
+        method_num: int,
+        config: Optional[GeneratorConfig] = None,
+        compiler: Optional[BodyCompiler] = None,
+        *,
+        chains: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, str]:
+        """Method: extract params, request body is compiled by `compiler` into function, which builds payload
+
+        Values of params in `chains` are wrapped into calls that take values of request chains, e.g.
+        `self.chain_value(key, ` prefix and `)`, so generated values are used until producer saves any.
+        """
+        located_params: Dict[str, List[Param]] = {location: [] for location in PARAM_LOCATIONS}
+        body_param: Optional[Param] = None
+        for param_name, param in params.items():
+            param_location = param.location
+            if param_location == "body" and compiler is not None:
+                body_param = param
+            elif param_location in located_params:
+                located_params[param_location].append(param)
             else:
-                raise ValueError(f"Not valid {param} `in` value: {param_location}", param_config)
-            target_params.append(param_config)
+                raise ValueError(f"Not valid {param_name} `in` value: {param_location}", param.raw)
 
         extracted_params = {
-            "path_params": self._format_params(path_params, "path", constants, method_num),
-            "query_params": self._format_params(query_params, "query", constants, method_num),
-            "header_params": self._format_params(header_params, "header", constants, method_num),
-            "cookie_params": self._format_params(cookie_params, "cookie", constants, method_num),
+            f"{location}_params": BaseGenerator._format_params(
+                located_params[location], location, constants, method_num, config or GeneratorConfig(), chains=chains
+            )
+            for location in PARAM_LOCATIONS
         }
+        extracted_params["body"] = ""
+        extracted_params["body_function"] = ""
+        if body_param is not None and compiler is not None:
+            body_function = compiler.compile(body_param.raw.get("schema", {}))
+            body_kwarg = "data" if FORM_MEDIA_TYPE_PATTERN.match(body_param.raw.get("mediaType", "")) else "json"
+            extracted_params["body"] = f"{body_kwarg}={body_function}()"
+            extracted_params["body_function"] = body_function
+        elif located_params["formData"]:
+            extracted_params["body"] = f"data={extracted_params['formData_params']}"
         return extracted_params
 
     @staticmethod
-    def _format_params(raw_params: List[dict], param_type, constants, method_num: int) -> Union[str, dict]:
+    def _format_params(  # pylint: disable=too-many-arguments
+        raw_params: List[Param],
+        param_type,
+        constants,
+        method_num: int,
+        config: GeneratorConfig,
+        *,
+        chains: Optional[Dict[str, str]] = None,
+    ) -> str:
         params = []
         for param in raw_params:
-            param_name = param.get("name", "")
-            const_name = param_name.upper() + f"__{method_num}"
-            param_val = param.get("default")
-            param_val_type = param.get("type", "")
-            const_val = repr(param_val)
-            if param_val is None:
-                const_val = helpers_templates.HELPER_MAPPING.get(param_val_type, "")
-            param_val = helpers_templates.HELPER_MAPPING["choice"].format(values=const_name)
-            constants.append(Constant(name=const_name, val=const_val, value_type=param_val_type))
+            param_name = param.name
+            const_name = BaseGenerator.get_constant_name(param_name, method_num)
+            param_val = param.default
+            param_val_type = param.value_type
+            feeder = config.feeders.get(const_name) or config.feeders.get(param_name)
+            if feeder is not None:
+                const_val = f"{str(feeder.path)!r}, {feeder.file_format!r}"
+                param_val = helpers_templates.HELPER_MAPPING["pool"].format(values=const_name)
+                constants.append(Constant(name=const_name, val=const_val, value_type=param_val_type, kind="feeder"))
+            elif config.data_pools and (
+                param_val is not None or param_val_type in helpers_templates.POOL_FACTORY_MAPPING
+            ):
+                const_val = BaseGenerator._format_pool_args(param_val, param_val_type)
+                param_val = helpers_templates.HELPER_MAPPING["pool"].format(values=const_name)
+                constants.append(Constant(name=const_name, val=const_val, value_type=param_val_type, kind="pool"))
+            else:
+                const_val = repr(param_val)
+                if param_val is None:
+                    const_val = helpers_templates.HELPER_MAPPING.get(param_val_type, "")
+                param_val = helpers_templates.HELPER_MAPPING["choice"].format(values=const_name)
+                constants.append(Constant(name=const_name, val=const_val, value_type=param_val_type))
+            if chains and param_name in chains:
+                param_val = f"{chains[param_name]}{param_val})"
             if param_type == "path":
-                params.append(l_templates.PATH_PARAM_PAIR.render(key=param_name, val=param_val))
+                params.append(l_templates.PATH_PARAM_PAIR.format(key=param_name, val=param_val))
             else:
-                params.append(l_templates.DICT_PARAM_PAIR.render(key=param_name, val=param_val))
+                params.append(l_templates.DICT_PARAM_PAIR.format(key=param_name, val=param_val))
         if param_type == "path":
             formatted_params = ""
             if params:
@@ -235,22 +689,99 @@ class BaseGenerator:
         return formatted_params
 
     @staticmethod
-    def generate_security_cases(security_data: dict) -> str:
-        """Method: generate security cases"""
+    def get_constant_name(param_name: str, method_num: int) -> str:
+        """Method: get name of constant of param, e.g. `X_TRACE__0` of `X-Trace` header"""
+
+        const_name = re.sub(CONSTANT_NAME_PATTERN, "_", param_name.upper())
+        if not const_name or const_name[0].isdigit():
+            const_name = "_" + const_name
+        return f"{const_name}__{method_num}"
+
+    @staticmethod
+    def _format_pool_args(default: Any, value_type: str) -> str:
+        if default is not None:
+            return f"values=[{default!r}]"
+        factory = helpers_templates.POOL_FACTORY_MAPPING[value_type]
+        typecode = helpers_templates.POOL_TYPECODES.get(value_type)
+        if typecode is None:
+            return f"factory={factory}"
+        return f'factory={factory}, typecode="{typecode}"'
+
+    @staticmethod
+    def generate_security_cases(security_data: dict, headers: str = "self.client.headers") -> str:
+        """Method: generate security cases, `headers` is the expression of default headers dict in TaskSet"""
 
         security_cases = []
         for security_type, security_config in security_data.items():
             if security_type == "basic":
-                security_cases.append(auth_templates.AUTH_BASIC.render(security_config=security_config))
+                security_cases.append(
+                    auth_templates.AUTH_BASIC.render(security_config=security_config, headers=headers)
+                )
             elif security_type == "apiKey":
                 location = security_config.get("in")
                 name = security_config.get("name")
                 if location.lower() == "header" and name:
                     security_cases.append(
-                        auth_templates.AUTH_KEY_HEADER.render(name=name, security_config=security_config)
+                        auth_templates.AUTH_KEY_HEADER.render(
+                            name=name, security_config=security_config, headers=headers
+                        )
                     )
                 else:
                     raise ValueError(security_config)
             else:
                 security_cases.append(auth_templates.AUTH_UNDEFINED.render(security_config=security_config))
         return "".join(security_cases)
+
+
+def render_test_classes_chunk(
+    test_classes: List[TestClass], app_name: str, config: GeneratorConfig
+) -> List[RenderedTestClass]:
+    """Function: render chunk of test classes, it is picklable to be run in worker processes"""
+
+    return [render_test_class(test_class, app_name, config) for test_class in test_classes]
+
+
+def render_test_class(test_class: TestClass, app_name: str, config: GeneratorConfig) -> RenderedTestClass:
+    """Function: render test class and its constants files, it is picklable to be run in worker processes"""
+
+    test_methods, warnings = BaseGenerator.render_test_methods(test_class, config)
+    class_methods = []
+    class_constants = []
+    request_plans = []
+    bodies: Dict[str, str] = {}
+    validators: Dict[str, str] = {}
+    for test_method in test_methods:
+        class_methods.append(test_method.method_data)
+        class_constants.extend(test_method.constants)
+        request_plans.append(test_method.request_plan)
+        bodies.update(test_method.bodies)
+        validators.update(test_method.validators)
+    class_constants = list(sorted(set(class_constants)))
+    constants_str = ", ".join([constant.name for constant in class_constants])
+    class_file = ""
+    constants_file = ""
+    if test_methods:
+        class_file = l_templates.TEST_CLASS_FILE.render(
+            file_name=test_class.file_name,
+            test_methods="".join(class_methods),
+            request_plans=request_plans,
+            class_name=test_class.class_name,
+            constants=constants_str,
+            bodies=", ".join(sorted(bodies)),
+            validators=", ".join(["validate_response"] + sorted(validators)) if config.validate_responses else "",
+            app_name=app_name,
+            user_class=config.user_class,
+        )
+    if class_constants:
+        constants_file = constants_templates.CONSTANTS_FILE.render(constants=class_constants)
+    return RenderedTestClass(
+        file_path=test_class.file_path,
+        file_name=test_class.file_name,
+        class_name=test_class.class_name,
+        methods_count=len(test_methods),
+        class_file=class_file,
+        constants_file=constants_file,
+        warnings=warnings,
+        bodies=bodies,
+        validators=validators,
+    )
@@ -0,0 +1,148 @@
+"""Module: Body Compiler"""
+
+import math
+from typing import Any, Union
+
+from swagger2locustio.generators.schema_compiler import INDENT, SchemaCompiler
+
+DEFAULT_MIN_NUMBER = 0
+DEFAULT_MAX_NUMBER = 1000
+DEFAULT_MAX_LENGTH = 20
+DEFAULT_MAX_ITEMS = 3
+# numbers are rounded to this number of digits, exclusive bounds of them are moved by the smallest step of it
+NUMBER_DIGITS = 2
+
+STRING_FORMATS = {
+    "date-time": 'Helper.get_random_datetime("%Y-%m-%dT%H:%M:%SZ")',
+    "date": 'Helper.get_random_datetime("%Y-%m-%d")',
+    "email": "Helper.get_random_email()",
+    "password": "Helper.get_random_password()",
+    "ipv4": "Helper.get_random_ipv4()",
+    "ipv6": "Helper.get_random_ipv6()",
+    "uuid": "str(uuid4())",
+    "uri": '"https://example.com/" + random_string(1, 10)',
+    "url": '"https://example.com/" + random_string(1, 10)',
+}
+
+
+class BodyCompiler(SchemaCompiler):
+    """Class: Body Compiler
+
+    Compiles request body schemas into functions, which build payloads conforming to schemas.
+    Generated functions are plain expressions.
+    """
+
+    prefix = "body"
+
+    def compile_function(self, name: str, schema: dict) -> str:
+        """Method: compile source code of function named `name`, which returns payload"""
+
+        return f"def {name}():\n{INDENT}return {self.compile_schema(schema, 1)}\n"
+
+    def compile_schema(self, schema: Any, depth: int) -> str:
+        """Method: compile schema into python expression"""
+
+        if not self.is_compilable(schema, depth):
+            return "None"
+        if "allOf" in schema:
+            schema = self.merge_all_of(schema)
+        if "example" in schema:
+            return repr(schema["example"])
+        if schema.get("enum"):
+            return f"choice({tuple(schema['enum'])!r})"
+        for key in ("oneOf", "anyOf"):
+            if schema.get(key):
+                return self.compile_schema(schema[key][0], depth)
+
+        compile_type = getattr(self, f"_compile_{self.get_type(schema)}", self._compile_null)
+        return compile_type(schema, depth)
+
+    @staticmethod
+    def get_bounds(schema: dict, default_min: int, default_max: int, step: int) -> tuple:
+        """Method: get bounds of number, exclusive bounds are moved by `step`"""
+
+        minimum = schema.get("minimum")
+        maximum = schema.get("maximum")
+        exclusive_minimum = schema.get("exclusiveMinimum")
+        exclusive_maximum = schema.get("exclusiveMaximum")
+        # exclusive bounds are booleans in OpenAPI 3.0 and swagger 2, and numbers in OpenAPI 3.1
+        if not isinstance(exclusive_minimum, bool) and isinstance(exclusive_minimum, (int, float)):
+            minimum = exclusive_minimum + step
+        elif exclusive_minimum and minimum is not None:
+            minimum += step
+        if not isinstance(exclusive_maximum, bool) and isinstance(exclusive_maximum, (int, float)):
+            maximum = exclusive_maximum - step
+        elif exclusive_maximum and maximum is not None:
+            maximum -= step
+        if minimum is None:
+            minimum = default_min if maximum is None or maximum >= default_min else maximum - default_max
+        if maximum is None:
+            maximum = max(minimum, default_min) + default_max
+        return minimum, max(minimum, maximum)
+
+    @staticmethod
+    def _compile_null(schema: dict, depth: int) -> str:  # pylint: disable=unused-argument
+        return "None"
+
+    @staticmethod
+    def round_bound(value: float, digits: int, up: bool) -> Union[int, float]:
+        """Method: round bound of number up or down to `digits` digits, so that rounded numbers stay in bounds"""
+
+        scale = 10 ** digits
+        scaled = round(value * scale, 6)  # float error, e.g. of 1.01 * 100, is not rounded up or down
+        rounded = math.ceil(scaled) if up else math.floor(scaled)
+        return rounded // scale if rounded % scale == 0 else rounded / scale
+
+    def _compile_integer(self, schema: dict, depth: int) -> str:  # pylint: disable=unused-argument
+        minimum, maximum = self.get_bounds(schema, DEFAULT_MIN_NUMBER, DEFAULT_MAX_NUMBER, 1)
+        minimum, maximum = self.round_bound(minimum, 0, up=True), self.round_bound(maximum, 0, up=False)
+        return f"randint({minimum}, {max(minimum, maximum)})"
+
+    def _compile_number(self, schema: dict, depth: int) -> str:  # pylint: disable=unused-argument
+        minimum, maximum = self.get_bounds(schema, DEFAULT_MIN_NUMBER, DEFAULT_MAX_NUMBER, 10 ** -NUMBER_DIGITS)
+        low = self.round_bound(minimum, NUMBER_DIGITS, up=True)
+        high = self.round_bound(maximum, NUMBER_DIGITS, up=False)
+        if low > high:  # there are no rounded numbers in bounds
+            return f"uniform({minimum!r}, {maximum!r})"
+        return f"round(uniform({low!r}, {high!r}), {NUMBER_DIGITS})"
+
+    @staticmethod
+    def _compile_boolean(schema: dict, depth: int) -> str:  # pylint: disable=unused-argument
+        return "choice((True, False))"
+
+    @staticmethod
+    def _compile_string(schema: dict, depth: int) -> str:  # pylint: disable=unused-argument
+        string_format = STRING_FORMATS.get(schema.get("format", ""))
+        if string_format is not None:
+            return string_format
+        min_length = schema.get("minLength", 1)
+        max_length = max(min_length, schema.get("maxLength", max(min_length, DEFAULT_MAX_LENGTH)))
+        return f"random_string({min_length}, {max_length})"
+
+    def _compile_array(self, schema: dict, depth: int) -> str:
+        items = self.compile_schema(schema.get("items"), depth + 1)
+        if items == "None":
+            return "[]"
+        min_items = schema.get("minItems", 1)
+        max_items = max(min_items, schema.get("maxItems", max(min_items, DEFAULT_MAX_ITEMS)))
+        indent = INDENT * depth
+        loop = f"for _ in range(randint({min_items}, {max_items}))"
+        return f"[\n{indent}{INDENT}{items}\n{indent}{INDENT}{loop}\n{indent}]"
+
+    def _compile_object(self, schema: dict, depth: int) -> str:
+        properties = schema.get("properties")
+        if not isinstance(properties, dict) or not properties:
+            return "{}"
+        required = set(schema.get("required", ()))
+        indent = INDENT * depth
+        lines = []
+        for name, property_schema in properties.items():
+            if isinstance(property_schema, dict) and property_schema.get("readOnly"):
+                continue
+            value = self.compile_schema(property_schema, depth + 1)
+            if value == "None" and name not in required:
+                continue
+            lines.append(f"{indent}{INDENT}{name!r}: {value},\n")
+        if not lines:
+            return "{}"
+        return "{\n" + "".join(lines) + indent + "}"
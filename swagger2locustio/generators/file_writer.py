@@ -0,0 +1,184 @@
+"""Module: File Writer"""
+
+import os
+import re
+import json
+import time
+import shutil
+import hashlib
+import logging
+from pathlib import Path
+from typing import Dict, List
+
+LOG = logging.getLogger(__name__)
+
+MANIFEST_FILE_NAME = ".swagger2locustio-manifest.json"
+MANIFEST_VERSION = 2
+SYMBOL_PATTERN = re.compile(r"^[ \t]*(class|def)[ \t]+(\w+)", re.MULTILINE)
+
+
+class FileWriter:  # pylint: disable=too-many-instance-attributes
+    """Class: File Writer
+
+    Writes files atomically and skips the ones with unchanged content. Hashes of written files, their classes
+    and functions are kept in a manifest inside results dir, so unchanged files are detected without reading them
+    back and the difference between runs is calculated without scanning results dir.
+    Replaced files are moved to backup files next to them, previous content is never kept in memory, backups are
+    restored when files are kept by user or the run is rolled back, and they are removed once the manifest is saved.
+    Files kept by user instead of being replaced remember hash of the generated content they were kept instead of,
+    so they are not replaced again until the generated content of them is changed.
+    """
+
+    def __init__(self, results_path: Path):
+        self.results_path = results_path
+        self.files: Dict[str, dict] = self.load_manifest(results_path)
+        self.written: List[str] = []
+        self.skipped: List[str] = []
+        # replaced file -> backup of its previous content
+        self.replaced: Dict[str, Path] = {}
+        self.kept: List[str] = []
+        self.bytes_written = 0
+        self.write_seconds = 0.0
+
+    @staticmethod
+    def load_manifest(results_path: Path) -> Dict[str, dict]:
+        """Method: load manifest files entries"""
+
+        try:
+            manifest = json.loads((results_path / MANIFEST_FILE_NAME).read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return {}
+        if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+            return {}
+        return manifest.get("files", {})
+
+    @staticmethod
+    def get_hash(data: bytes) -> str:
+        """Method: get content hash"""
+
+        return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    @staticmethod
+    def get_symbols(content: str) -> Dict[str, Dict[str, str]]:
+        """Method: get hashes of classes and functions, each of them lasts until the next class or function"""
+
+        symbols: Dict[str, Dict[str, str]] = {"classes": {}, "functions": {}}
+        matches = list(SYMBOL_PATTERN.finditer(content))
+        for i, match in enumerate(matches):
+            end = matches[i + 1].start() if i + 1 < len(matches) else len(content)
+            kind, name = match.groups()
+            group = symbols["classes"] if kind == "class" else symbols["functions"]
+            group[f"{kind} {name}"] = FileWriter.get_hash(content[match.start() : end].encode("utf-8"))
+        return symbols
+
+    def write(self, path: Path, content: str) -> bool:
+        """Method: write file if its content is changed, returns True if file was written"""
+
+        start = time.perf_counter()
+        try:
+            return self._write(path, content)
+        finally:
+            self.write_seconds += time.perf_counter() - start
+
+    def _write(self, path: Path, content: str) -> bool:
+        data = content.encode("utf-8")
+        content_hash = self.get_hash(data)
+        key = path.relative_to(self.results_path).as_posix()
+        if self._is_unchanged(path, key, data, content_hash):
+            self.skipped.append(key)
+            if "classes" not in self.files[key]:
+                self.files[key].update(self.get_symbols(content))
+            return False
+
+        if path.exists():
+            if key not in self.replaced:
+                self.replaced[key] = self._back_up(path)
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+        self._replace_file(path, data)
+        self._remember(path, key, content_hash)
+        self.files[key].update(self.get_symbols(content))
+        self.written.append(key)
+        self.bytes_written += len(data)
+        return True
+
+    def keep(self, key: str) -> None:
+        """Method: restore previous content of replaced file, it is remembered as kept instead of written content"""
+
+        path = self.results_path / key
+        os.replace(self.replaced.pop(key), path)
+        data = path.read_bytes()
+        generated_hash = self.files[key]["hash"]
+        self._remember(path, key, self.get_hash(data))
+        self.files[key].update(self.get_symbols(data.decode("utf-8")), generated=generated_hash)
+        self.kept.append(key)
+
+    def rollback(self) -> None:
+        """Method: restore replaced files and remove new ones written by the run, e.g. when the run fails halfway"""
+
+        for key in self.written:
+            path = self.results_path / key
+            try:
+                if key in self.replaced:
+                    os.replace(self.replaced[key], path)
+                elif key not in self.kept:
+                    path.unlink()
+            except FileNotFoundError:  # file is removed or its backup is removed by saved manifest
+                pass
+        LOG.info("%d written files were rolled back", len(self.written))
+        self.written = []
+        self.replaced = {}
+
+    @staticmethod
+    def _back_up(path: Path) -> Path:
+        backup_path = path.with_name(f".{path.name}.{os.getpid()}.bak")
+        try:
+            # file is replaced by a new one, so the hard link keeps its previous content without copying it
+            os.link(path, backup_path)
+        except OSError:
+            shutil.copy2(path, backup_path)
+        return backup_path
+
+    @staticmethod
+    def _replace_file(path: Path, data: bytes) -> None:
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+    def _is_unchanged(self, path: Path, key: str, data: bytes, content_hash: str) -> bool:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return False
+        entry = self.files.get(key)
+        if entry is not None and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+            # kept file is not changed as long as content generated for it is the same as when it was kept
+            return entry.get("generated", entry["hash"]) == content_hash
+        if stat.st_size != len(data):
+            return False
+        # file is unknown or was modified after the last run, so it has to be compared with new content
+        if path.read_bytes() != data:
+            return False
+        self._remember(path, key, content_hash)
+        return True
+
+    def _remember(self, path: Path, key: str, content_hash: str) -> None:
+        stat = path.stat()
+        self.files[key] = {"hash": content_hash, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    def save_manifest(self) -> None:
+        """Method: save manifest with hashes of all the known files, backups of replaced files are removed"""
+
+        for key in [key for key in self.files if not (self.results_path / key).exists()]:
+            del self.files[key]
+        manifest = {"version": MANIFEST_VERSION, "files": self.files}
+        manifest_path = self.results_path / MANIFEST_FILE_NAME
+        tmp_path = manifest_path.with_name(f".{manifest_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(manifest, indent=1, sort_keys=True), encoding="utf-8")
+        os.replace(tmp_path, manifest_path)
+        for backup_path in self.replaced.values():
+            try:
+                backup_path.unlink()
+            except FileNotFoundError:  # manifest is saved again
+                pass
+        LOG.info("%d files were written, %d unchanged files were skipped", len(self.written), len(self.skipped))
@@ -0,0 +1,166 @@
+"""Module: Fingerprints of operations"""
+
+import os
+import json
+import hashlib
+import logging
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+LOG = logging.getLogger(__name__)
+
+FINGERPRINTS_FILE_NAME = ".swagger2locustio-fingerprints.json"
+FINGERPRINTS_VERSION = 2
+# containers of operations serialized longer than this are fingerprinted once per object, e.g. schemas shared by `$ref`
+MEMOIZED_SIZE = 1024
+MEMO_MAX_SIZE = 4096
+DIGEST_MARK = "\0"
+# code which renders test classes, any change of it makes all the test classes to be rendered again
+RENDERING_CODE_DIRS = ("generators", "templates")
+
+
+def get_fingerprint(data: Any) -> str:
+    """Function: get fingerprint of JSON-like data, e.g. parsed data of operation"""
+
+    raw_data = json.dumps(data, default=_json_default, separators=(",", ":")).encode("utf-8")
+    return hashlib.blake2b(raw_data, digest_size=16).hexdigest()
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (set, frozenset)):
+        return sorted(map(repr, value))
+    return repr(value)
+
+
+def get_code_fingerprint() -> str:
+    """Function: get fingerprint of source code of generators and templates"""
+
+    code_hash = hashlib.blake2b(digest_size=16)
+    package_path = Path(__file__).resolve().parent.parent
+    for code_dir in RENDERING_CODE_DIRS:
+        for source_file in sorted((package_path / code_dir).glob("*.py")):
+            code_hash.update(source_file.name.encode("utf-8"))
+            code_hash.update(source_file.read_bytes())
+    return code_hash.hexdigest()
+
+
+class Fingerprints:  # pylint: disable=too-many-instance-attributes
+    """Class: Fingerprints
+
+    Fingerprints of operations of test classes of an app, they are kept in results dir next to generated files.
+    Test class is not rendered again if its operations, the context of rendering (config and code of generators),
+    and its generated files are not changed, the stored entry of it is used instead.
+    """
+
+    def __init__(self, results_path: Path, app_name: str, context: Any):
+        self.results_path = results_path
+        self.app_name = app_name
+        self.context = get_fingerprint([FINGERPRINTS_VERSION, get_code_fingerprint(), context])
+        self.apps = self.load(results_path)
+        app_data = self.apps.get(app_name, {})
+        self.previous: Dict[str, dict] = {}
+        if app_data.get("context") == self.context:
+            self.previous = app_data.get("classes", {})
+        elif app_data:
+            LOG.info("Config or version of generator is changed, all test classes are rendered")
+        self.current: Dict[str, dict] = {}
+        self.operations: Dict[str, List[List[str]]] = {}
+        # id of container -> (container, its digest), the container is kept, so its id is not reused
+        self.memo: "OrderedDict[int, Tuple[Any, str]]" = OrderedDict()
+
+    @staticmethod
+    def load(results_path: Path) -> Dict[str, dict]:
+        """Method: load fingerprints of all the apps of results dir"""
+
+        try:
+            data = json.loads((results_path / FINGERPRINTS_FILE_NAME).read_text(encoding="utf-8"))
+        except (FileNotFoundError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != FINGERPRINTS_VERSION:
+            return {}
+        return data.get("apps", {})
+
+    def fingerprint_operations(self, class_name: str, operations: List[tuple]) -> List[List[str]]:
+        """Method: fingerprint (path, method, method data) operations of test class, they are kept for `put`"""
+
+        self.operations[class_name] = [
+            [f"{method.upper()} {path}", get_fingerprint(self.compact(method_data))]
+            for path, method, method_data in operations
+        ]
+        return self.operations[class_name]
+
+    def compact(self, data: Any) -> Any:
+        """Method: replace large containers inside data by their digests
+
+        Digests are memoized by object, so a schema resolved once and shared by many operations is serialized once.
+        Memo keeps only the most recently used containers, so parsed data of written test classes is released.
+        """
+
+        if not isinstance(data, (dict, list, tuple)):
+            return data
+        memoized = self.memo.get(id(data))
+        if memoized is not None:
+            self.memo.move_to_end(id(data))
+            return memoized[1]
+        if isinstance(data, dict):
+            compact_data: Any = {key: self.compact(value) for key, value in data.items()}
+        else:
+            compact_data = [self.compact(value) for value in data]
+        raw_data = json.dumps(compact_data, default=_json_default, separators=(",", ":"))
+        if len(raw_data) <= MEMOIZED_SIZE:
+            return compact_data
+        digest = DIGEST_MARK + hashlib.blake2b(raw_data.encode("utf-8"), digest_size=16).hexdigest()
+        self.memo[id(data)] = (data, digest)
+        if len(self.memo) > MEMO_MAX_SIZE:
+            self.memo.popitem(last=False)
+        return digest
+
+    def get_unchanged(self, class_name: str, known_files: Dict[str, dict]) -> Optional[dict]:
+        """Method: get stored entry of test class, None if its operations or any of its files are changed"""
+
+        entry = self.previous.get(class_name)
+        if entry is None or entry["operations"] != self.operations.get(class_name):
+            return None
+        for file_name in entry["files"]:
+            # files unknown to the manifest of generated files, deleted or modified since the last run are written again
+            known_file = known_files.get(file_name)
+            try:
+                stat = (self.results_path / file_name).stat()
+            except FileNotFoundError:
+                return None
+            if known_file is None or (known_file["size"], known_file["mtime_ns"]) != (stat.st_size, stat.st_mtime_ns):
+                return None
+        return entry
+
+    def put(self, class_name: str, entry: dict) -> None:
+        """Method: put entry of test class, operations fingerprinted by `fingerprint_operations` are added to it"""
+
+        self.current[class_name] = dict(entry, operations=self.operations[class_name])
+
+    def drop_files(self, file_names: List[str]) -> None:
+        """Method: drop entries of test classes with any of files, e.g. kept by user, so they are rendered again"""
+
+        dropped = set(file_names)
+        for class_name in [name for name, entry in self.current.items() if dropped.intersection(entry["files"])]:
+            del self.current[class_name]
+
+    def log_changes(self) -> None:
+        """Method: log added, removed and modified operations comparing to the previous run"""
+
+        previous = {key: value for entry in self.previous.values() for key, value in entry["operations"]}
+        current = {key: value for entry in self.current.values() for key, value in entry["operations"]}
+        added = len(current.keys() - previous.keys())
+        removed = len(previous.keys() - current.keys())
+        modified = sum(1 for key in current.keys() & previous.keys() if current[key] != previous[key])
+        LOG.info("Operations since the previous run: %d added, %d removed, %d modified", added, removed, modified)
+
+    def save(self) -> None:
+        """Method: save fingerprints, entries of the other apps of results dir are kept"""
+
+        self.apps[self.app_name] = {"context": self.context, "classes": self.current}
+        fingerprints_path = self.results_path / FINGERPRINTS_FILE_NAME
+        tmp_path = fingerprints_path.with_name(f".{fingerprints_path.name}.{os.getpid()}.tmp")
+        data = {"version": FINGERPRINTS_VERSION, "apps": self.apps}
+        tmp_path.write_text(json.dumps(data, indent=1, sort_keys=True), encoding="utf-8")
+        os.replace(tmp_path, fingerprints_path)
@@ -0,0 +1,188 @@
+"""Module: Request chains"""
+
+import re
+import logging
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+
+from swagger2locustio.generators.schema_compiler import SchemaCompiler
+from swagger2locustio.generators.validator_compiler import ValidatorCompiler
+
+LOG = logging.getLogger(__name__)
+
+PATH_PARAM_PATTERN = re.compile(r"^{(.+)}$", re.UNICODE)
+RESPONSE_BODY_EXPRESSION = "$response.body#"
+ID_PROPERTY = "id"
+
+
+class ChainLink(NamedTuple):
+    """Named Tuple: Chain Link
+
+    Value at `pointer` of response body of producer operation is used as `param` of consumer operation,
+    operations are (path, method) pairs.
+    """
+
+    producer: Tuple[str, str]
+    consumer: Tuple[str, str]
+    param: str
+    pointer: Tuple[str, ...]
+
+    @property
+    def key(self) -> str:
+        """Method: key of values of the link, it is shared by all the consumers of the same value"""
+
+        return f"{self.producer[1].upper()} {self.producer[0]}#/{'/'.join(self.pointer)}"
+
+
+def apply_request_chains(paths_data: dict) -> dict:
+    """Function: mark producers and consumers of linked operations, method data of them is copied"""
+
+    links = find_links(paths_data)
+    producers: Dict[Tuple[str, str], List[Tuple[str, Tuple[str, ...]]]] = {}
+    consumers: Dict[Tuple[str, str], Dict[str, str]] = {}
+    for link in links:
+        link_producers = producers.setdefault(link.producer, [])
+        if (link.key, link.pointer) not in link_producers:
+            link_producers.append((link.key, link.pointer))
+        consumers.setdefault(link.consumer, {})[link.param] = link.key
+    LOG.info("%d request chains are found", len(links))
+    chained_paths_data: Dict[str, Dict[str, dict]] = {}
+    for path, methods_data in paths_data.items():
+        chained_paths_data[path] = {}
+        for method, method_data in methods_data.items():
+            operation = (path, method)
+            if operation in producers or operation in consumers:
+                method_data = dict(
+                    method_data,
+                    chain_producers=producers.get(operation, []),
+                    chain_consumers=consumers.get(operation, {}),
+                )
+            chained_paths_data[path][method] = method_data
+    return chained_paths_data
+
+
+def find_links(paths_data: dict) -> List[ChainLink]:
+    """Function: find links declared by OpenAPI `links` of responses, other params are linked by names"""
+
+    links = find_declared_links(paths_data)
+    linked_params = {(link.consumer, link.param) for link in links}
+    links.extend(link for link in find_named_links(paths_data) if (link.consumer, link.param) not in linked_params)
+    return links
+
+
+def find_declared_links(paths_data: dict) -> List[ChainLink]:
+    """Function: find links declared by OpenAPI `links` of successful responses"""
+
+    operation_ids = {
+        method_data["operation_id"]: (path, method)
+        for path, methods_data in paths_data.items()
+        for method, method_data in methods_data.items()
+        if method_data.get("operation_id")
+    }
+    links = []
+    for path, methods_data in paths_data.items():
+        for method, method_data in methods_data.items():
+            for status, response in method_data.get("responses", {}).items():
+                if str(status).startswith("2") and isinstance(response, dict):
+                    links.extend(get_response_links((path, method), response, operation_ids, paths_data))
+    return links
+
+
+def get_response_links(
+    producer: Tuple[str, str], response: dict, operation_ids: Dict[str, Tuple[str, str]], paths_data: dict
+) -> List[ChainLink]:
+    """Function: get links of response, only values of response body are supported"""
+
+    links = []
+    for link in (response.get("links") or {}).values():
+        consumer = get_link_operation(link, operation_ids, paths_data)
+        if consumer is None:
+            continue
+        for param, expression in (link.get("parameters") or {}).items():
+            if not isinstance(expression, str) or not expression.startswith(RESPONSE_BODY_EXPRESSION):
+                continue
+            pointer = parse_pointer(expression[len(RESPONSE_BODY_EXPRESSION) :])
+            # param may be qualified by its location, e.g. `path.orderId`
+            param = param.split(".", 1)[1] if "." in param else param
+            links.append(ChainLink(producer=producer, consumer=consumer, param=param, pointer=pointer))
+    return links
+
+
+def get_link_operation(
+    link: dict, operation_ids: Dict[str, Tuple[str, str]], paths_data: dict
+) -> Optional[Tuple[str, str]]:
+    """Function: get (path, method) of operation of link by its operationId or local operationRef"""
+
+    if not isinstance(link, dict):
+        return None
+    if "operationId" in link:
+        return operation_ids.get(link["operationId"])
+    operation_ref = link.get("operationRef", "")
+    if not operation_ref.startswith("#/paths/"):
+        return None
+    parts = parse_pointer(operation_ref[1:])
+    if len(parts) != 3 or parts[2] not in paths_data.get(parts[1], {}):
+        return None
+    return parts[1], parts[2]
+
+
+def parse_pointer(pointer: str) -> Tuple[str, ...]:
+    """Function: parse JSON pointer into its unescaped parts"""
+
+    if not pointer:
+        return ()
+    return tuple(part.replace("~1", "/").replace("~0", "~") for part in pointer.lstrip("/").split("/"))
+
+
+def find_named_links(paths_data: dict) -> List[ChainLink]:
+    """Function: link POST of collection, e.g. `/orders`, to the first path param after it, e.g. `/orders/{orderId}`
+
+    Value is taken from response property named as the param, or from `id` property.
+    """
+
+    producers = find_collection_producers(paths_data)
+    links = []
+    for path, methods_data in paths_data.items():
+        segments = path.rstrip("/").split("/")
+        for index, segment in enumerate(segments):
+            match = PATH_PARAM_PATTERN.match(segment)
+            producer = producers.get("/".join(segments[:index]))
+            if match is None or producer is None:
+                continue
+            param = match.group(1)
+            field = param if param in producer[1] else ID_PROPERTY if ID_PROPERTY in producer[1] else None
+            if field is None:
+                continue
+            for method, method_data in methods_data.items():
+                if param in method_data.get("params", {}):
+                    links.append(ChainLink((producer[0], "post"), (path, method), param, (field,)))
+    return links
+
+
+def find_collection_producers(paths_data: dict) -> Dict[str, Tuple[str, Set[str]]]:
+    """Function: find POST operations of collections, they are mapped to path and response properties"""
+
+    producers = {}
+    for path, methods_data in paths_data.items():
+        collection = path.rstrip("/")
+        if "post" not in methods_data or PATH_PARAM_PATTERN.match(collection.rsplit("/", 1)[-1]):
+            continue
+        properties = get_response_properties(methods_data["post"])
+        if properties:
+            producers[collection] = (path, properties)
+    return producers
+
+
+def get_response_properties(method_data: dict) -> Optional[Set[str]]:
+    """Function: get names of properties of the first successful response body of operation"""
+
+    responses = method_data.get("responses", {})
+    for status in sorted(responses, key=str):
+        if not str(status).startswith("2"):
+            continue
+        schema = ValidatorCompiler.get_response_schema(responses[status])
+        if isinstance(schema, dict) and "allOf" in schema:
+            schema = SchemaCompiler.merge_all_of(schema)
+        if isinstance(schema, dict) and isinstance(schema.get("properties"), dict):
+            return set(schema["properties"])
+        return None
+    return None
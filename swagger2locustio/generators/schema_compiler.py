@@ -0,0 +1,83 @@
+"""Module: Schema Compiler"""
+
+import json
+import hashlib
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+
+# Schemas nested deeper are not compiled, e.g. recursive schemas
+MAX_DEPTH = 8
+INDENT = "    "
+
+
+class SchemaCompiler(ABC):
+    """Class: Schema Compiler
+
+    Base of compilers of schemas into source code of python functions, schema is walked only once on generation.
+    Functions are named by hash of schema, so names are stable and equal schemas share the same function.
+    """
+
+    prefix = "schema"
+
+    def __init__(self):
+        self.functions: Dict[str, str] = {}
+
+    def compile(self, schema: dict) -> str:
+        """Method: compile schema into function, returns name of the function"""
+
+        schema_json = json.dumps(schema, sort_keys=True, default=str)
+        name = f"{self.prefix}_" + hashlib.blake2b(schema_json.encode(), digest_size=6).hexdigest()
+        if name not in self.functions:
+            self.functions[name] = self.compile_function(name, schema)
+        return name
+
+    @abstractmethod
+    def compile_function(self, name: str, schema: dict) -> str:
+        """Method: compile source code of function named `name`"""
+
+        raise NotImplementedError()
+
+    @staticmethod
+    def is_compilable(schema: Any, depth: int) -> bool:
+        """Method: check that schema is resolved and is not nested too deep"""
+
+        return isinstance(schema, dict) and "$ref" not in schema and depth <= MAX_DEPTH
+
+    @staticmethod
+    def get_type(schema: dict) -> Optional[str]:
+        """Method: get type of schema, it is guessed by keywords if it is not set"""
+
+        schema_type = schema.get("type")
+        if isinstance(schema_type, list):  # e.g. ["string", "null"]
+            schema_type = next((item for item in schema_type if item != "null"), None)
+        if schema_type is None:
+            if "properties" in schema:
+                schema_type = "object"
+            elif "items" in schema:
+                schema_type = "array"
+        return schema_type
+
+    @staticmethod
+    def merge_all_of(schema: dict) -> dict:
+        """Method: merge allOf subschemas into one schema"""
+
+        merged: Dict[str, Any] = {key: value for key, value in schema.items() if key != "allOf"}
+        properties: Dict[str, Any] = dict(merged.get("properties", {}))
+        required: List[str] = list(merged.get("required", []))
+        for subschema in schema["allOf"]:
+            if not isinstance(subschema, dict):
+                continue
+            if "allOf" in subschema:
+                subschema = SchemaCompiler.merge_all_of(subschema)
+            for key, value in subschema.items():
+                if key == "properties":
+                    properties.update(value)
+                elif key == "required":
+                    required.extend(value)
+                else:
+                    merged.setdefault(key, value)
+        if properties:
+            merged["properties"] = properties
+        if required:
+            merged["required"] = required
+        return merged
@@ -0,0 +1,181 @@
+"""Module: Validator Compiler"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from swagger2locustio.generators.schema_compiler import INDENT, SchemaCompiler
+from swagger2locustio.parsers.swagger_v3 import JSON_MEDIA_TYPE_PATTERN
+
+TYPE_CHECKS = {
+    "integer": "isinstance({value}, int) and not isinstance({value}, bool)",
+    "number": "isinstance({value}, (int, float)) and not isinstance({value}, bool)",
+    "string": "isinstance({value}, str)",
+    "boolean": "isinstance({value}, bool)",
+    "array": "isinstance({value}, list)",
+    "object": "isinstance({value}, dict)",
+    "null": "{value} is None",
+}
+
+
+class ValidatorCompiler(SchemaCompiler):
+    """Class: Validator Compiler
+
+    Compiles response schemas into functions, which check that response body conforms to schema.
+    Generated functions are single boolean expressions, formats and patterns of strings are not checked.
+    """
+
+    prefix = "validate"
+
+    def compile_function(self, name: str, schema: dict) -> str:
+        """Method: compile source code of function named `name`, which returns True if value is valid"""
+
+        checks = self.compile_checks(schema, "value", 1)
+        if not checks:
+            return f"def {name}(value):\n{INDENT}return True\n"
+        expression = f"\n{INDENT * 2}and ".join(checks)
+        return f"def {name}(value):\n{INDENT}return (\n{INDENT * 2}{expression}\n{INDENT})\n"
+
+    def compile_responses(self, responses: dict) -> Tuple[str, List[str]]:
+        """Method: compile responses of operation into `{status: validator}` dict expression
+
+        Status codes without JSON body schema are mapped to None, names of used validators are returned as well.
+        """
+
+        validators: Dict[Any, Optional[str]] = {}
+        for status, response in responses.items():
+            status = str(status).lower()  # e.g. 200, 2xx or default
+            key = int(status) if status.isdigit() else status
+            schema = self.get_response_schema(response)
+            validators[key] = None if schema is None else self.compile(schema)
+        validators_str = ", ".join(f"{key!r}: {validator}" for key, validator in validators.items())
+        return "{" + validators_str + "}", [validator for validator in validators.values() if validator is not None]
+
+    @staticmethod
+    def get_response_schema(response: Any) -> Optional[dict]:
+        """Method: get JSON body schema of swagger 2 or OpenAPI 3 response"""
+
+        if not isinstance(response, dict):
+            return None
+        if "schema" in response:
+            return response["schema"]
+        content = response.get("content") or {}
+        media_type = next((media for media in content if JSON_MEDIA_TYPE_PATTERN.match(media)), None)
+        if media_type is None:
+            return None
+        return content[media_type].get("schema")
+
+    def compile_schema(self, schema: Any, value: str, depth: int) -> str:
+        """Method: compile schema into boolean python expression, which checks `value`"""
+
+        checks = self.compile_checks(schema, value, depth)
+        if not checks:
+            return "True"
+        if len(checks) == 1:
+            return checks[0]
+        return "(" + " and ".join(checks) + ")"
+
+    def compile_checks(self, schema: Any, value: str, depth: int) -> List[str]:
+        """Method: compile schema into list of boolean python expressions, which check `value`"""
+
+        if not self.is_compilable(schema, depth):
+            return []
+        if "allOf" in schema:
+            schema = self.merge_all_of(schema)
+        checks = self.compile_alternatives(schema, value, depth) + self.compile_types(schema, value, depth)
+        if schema.get("enum"):
+            checks.append(f"{value} in {tuple(schema['enum'])!r}")
+        if checks and self.is_nullable(schema):
+            return [f"({value} is None or " + " and ".join(checks) + ")"]
+        return checks
+
+    def compile_alternatives(self, schema: dict, value: str, depth: int) -> List[str]:
+        """Method: compile oneOf and anyOf subschemas into checks, any of their alternatives has to be valid"""
+
+        checks = []
+        for key in ("oneOf", "anyOf"):
+            if schema.get(key):
+                alternatives = [self.compile_schema(subschema, value, depth) for subschema in schema[key]]
+                if "True" not in alternatives:
+                    checks.append("(" + " or ".join(alternatives) + ")")
+        return checks
+
+    def compile_types(self, schema: dict, value: str, depth: int) -> List[str]:
+        """Method: compile checks of type of value and checks specific to the type, e.g. bounds of number"""
+
+        schema_types = schema.get("type")
+        if isinstance(schema_types, list) and len(set(schema_types) - {"null"}) > 1:  # e.g. ["string", "integer"]
+            type_checks = [TYPE_CHECKS[item].format(value=value) for item in schema_types if item in TYPE_CHECKS]
+            return ["(" + " or ".join(type_checks) + ")"]
+        checks = []
+        schema_type = self.get_type(schema)
+        if schema_type in TYPE_CHECKS:
+            checks.append(TYPE_CHECKS[schema_type].format(value=value))
+        compile_type = getattr(self, f"_compile_{schema_type}", None)
+        if compile_type is not None:
+            checks.extend(compile_type(schema, value, depth))
+        return checks
+
+    @staticmethod
+    def is_nullable(schema: dict) -> bool:
+        """Method: check if schema allows null, it is set differently by swagger 2, OpenAPI 3.0 and 3.1"""
+
+        schema_type = schema.get("type")
+        return bool(
+            schema.get("nullable")
+            or schema.get("x-nullable")
+            or (isinstance(schema_type, list) and "null" in schema_type and schema_type != ["null"])
+        )
+
+    @staticmethod
+    def compile_bounds(schema: dict, value: str) -> List[str]:
+        """Method: compile checks of minimum and maximum of number"""
+
+        checks = []
+        for key, operator, exclusive_operator in (("minimum", ">=", ">"), ("maximum", "<=", "<")):
+            bound = schema.get(key)
+            exclusive = schema.get(f"exclusive{key.title()}")
+            # exclusive bounds are booleans in OpenAPI 3.0 and swagger 2, and numbers in OpenAPI 3.1
+            if not isinstance(exclusive, bool) and isinstance(exclusive, (int, float)):
+                checks.append(f"{value} {exclusive_operator} {exclusive!r}")
+            elif isinstance(bound, (int, float)):
+                checks.append(f"{value} {exclusive_operator if exclusive else operator} {bound!r}")
+        return checks
+
+    def _compile_integer(self, schema: dict, value: str, depth: int) -> List[str]:  # pylint: disable=unused-argument
+        return self.compile_bounds(schema, value)
+
+    def _compile_number(self, schema: dict, value: str, depth: int) -> List[str]:  # pylint: disable=unused-argument
+        return self.compile_bounds(schema, value)
+
+    @staticmethod
+    def _compile_string(schema: dict, value: str, depth: int) -> List[str]:  # pylint: disable=unused-argument
+        checks = []
+        if isinstance(schema.get("minLength"), int) and schema["minLength"] > 0:
+            checks.append(f"len({value}) >= {schema['minLength']}")
+        if isinstance(schema.get("maxLength"), int):
+            checks.append(f"len({value}) <= {schema['maxLength']}")
+        return checks
+
+    def _compile_array(self, schema: dict, value: str, depth: int) -> List[str]:
+        checks = []
+        if isinstance(schema.get("minItems"), int) and schema["minItems"] > 0:
+            checks.append(f"len({value}) >= {schema['minItems']}")
+        if isinstance(schema.get("maxItems"), int):
+            checks.append(f"len({value}) <= {schema['maxItems']}")
+        item = f"item{depth}"
+        item_check = self.compile_schema(schema.get("items"), item, depth + 1)
+        if item_check != "True":
+            checks.append(f"all({item_check} for {item} in {value})")
+        return checks
+
+    def _compile_object(self, schema: dict, value: str, depth: int) -> List[str]:
+        checks = [f"{name!r} in {value}" for name in schema.get("required", ()) if isinstance(name, str)]
+        properties = schema.get("properties")
+        if not isinstance(properties, dict):
+            return checks
+        for name, property_schema in properties.items():
+            if isinstance(property_schema, dict) and property_schema.get("writeOnly"):
+                continue
+            property_check = self.compile_schema(property_schema, f"{value}[{name!r}]", depth + 1)
+            if property_check != "True":
+                checks.append(f"({name!r} not in {value} or {property_check})")
+        return checks
@@ -0,0 +1,159 @@
+"""Module: Swagger file loader"""
+
+import json
+import time
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import yaml
+from yaml.composer import Composer, ComposerError
+from yaml.events import MappingStartEvent, MappingEndEvent, SequenceStartEvent, SequenceEndEvent, ScalarEvent
+
+from swagger2locustio.utils import get_peak_rss
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+LOG = logging.getLogger(__name__)
+
+# Top level sections that are used by parsers, everything else is skipped while loading
+SPEC_SECTIONS = frozenset(
+    (
+        "swagger",
+        "openapi",
+        "host",
+        "paths",
+        "securityDefinitions",
+        "definitions",
+        "parameters",
+        "responses",
+        "components",
+        "servers",
+    )
+)
+
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)  # pylint: disable=invalid-name
+YAML_BACKEND = f"yaml.{YAML_LOADER.__name__}"
+
+if YAML_LOADER is yaml.SafeLoader:  # pragma: no cover
+    _SectionsLoader = yaml.SafeLoader
+else:
+
+    class _SectionsLoader(YAML_LOADER, Composer):  # type: ignore # pylint: disable=too-many-ancestors
+        """Class: libyaml based loader that is able to compose separate nodes"""
+
+        def __init__(self, stream):
+            super().__init__(stream)
+            Composer.__init__(self)
+
+
+JSON_BACKEND = "orjson" if orjson is not None else "json"
+
+
+@dataclass
+class LoadStats:
+    """Data Class: Load Stats"""
+
+    backend: str
+    file_size: int
+    seconds: float
+    peak_rss: int
+
+
+def load_swagger_file(
+    swagger_file: Path, sections: Optional[Iterable[str]] = SPEC_SECTIONS
+) -> Tuple[Dict[str, Any], LoadStats]:
+    """Function: load swagger file, keeping only `sections` top level keys (all of them if None)"""
+
+    ext = swagger_file.suffix
+    wanted = frozenset(sections) if sections is not None else None
+    start = time.perf_counter()
+    if ext == ".json":
+        backend = JSON_BACKEND
+        swagger_data = _load_json(swagger_file, wanted)
+    elif ext in (".yaml", ".yml"):
+        backend = YAML_BACKEND
+        swagger_data = _load_yaml(swagger_file, wanted)
+    else:
+        raise ValueError("Incorrect file format")
+    stats = LoadStats(
+        backend=backend,
+        file_size=swagger_file.stat().st_size,
+        seconds=time.perf_counter() - start,
+        peak_rss=get_peak_rss(),
+    )
+    LOG.info(
+        "Swagger file loaded in %.3fs using %s (%.1f MiB, peak RSS %.1f MiB)",
+        stats.seconds,
+        stats.backend,
+        stats.file_size / 2 ** 20,
+        stats.peak_rss / 2 ** 20,
+    )
+    return swagger_data, stats
+
+
+def _load_json(swagger_file: Path, sections: Optional[frozenset]) -> Dict[str, Any]:
+    if orjson is not None:
+        swagger_data = orjson.loads(swagger_file.read_bytes())  # pylint: disable=no-member
+    else:
+        with open(swagger_file, "rb") as file:
+            swagger_data = json.load(file)
+    return _select_sections(swagger_data, sections)
+
+
+def _load_yaml(swagger_file: Path, sections: Optional[frozenset]) -> Dict[str, Any]:
+    with open(swagger_file, "rb") as file:
+        if sections is not None:
+            try:
+                return _load_yaml_sections(file, sections)
+            except ComposerError as error:
+                # e.g. alias that points to an anchor in one of the skipped sections
+                LOG.debug("Partial yaml loading is not possible: %s", error)
+                file.seek(0)
+        return _select_sections(yaml.load(file, Loader=YAML_LOADER), sections)  # nosec - safe loader is used
+
+
+def _load_yaml_sections(stream, sections: frozenset) -> Dict[str, Any]:
+    loader = _SectionsLoader(stream)
+    swagger_data: Dict[str, Any] = {}
+    try:
+        loader.get_event()  # stream start
+        loader.get_event()  # document start
+        if not loader.check_event(MappingStartEvent):
+            raise ValueError("Swagger file should contain mapping on the top level")
+        loader.get_event()
+        while not loader.check_event(MappingEndEvent):
+            key_event = loader.get_event()
+            if isinstance(key_event, ScalarEvent) and key_event.value in sections:
+                swagger_data[key_event.value] = loader.construct_document(loader.compose_node(None, None))
+                continue
+            if not isinstance(key_event, ScalarEvent):
+                _skip_node(loader, key_event)
+            _skip_node(loader, loader.get_event())
+    finally:
+        loader.dispose()
+    return swagger_data
+
+
+def _skip_node(loader, event) -> None:
+    depth = 0
+    while True:
+        if isinstance(event, (MappingStartEvent, SequenceStartEvent)):
+            depth += 1
+        elif isinstance(event, (MappingEndEvent, SequenceEndEvent)):
+            depth -= 1
+        if depth == 0:
+            return
+        event = loader.get_event()
+
+
+def _select_sections(swagger_data: Any, sections: Optional[frozenset]) -> Dict[str, Any]:
+    if not isinstance(swagger_data, dict):
+        raise ValueError("Swagger file should contain mapping on the top level")
+    if sections is None:
+        return swagger_data
+    return {key: value for key, value in swagger_data.items() if key in sections}
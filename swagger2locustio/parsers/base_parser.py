@@ -1,20 +1,56 @@
 """Module: Base Parser"""
 
+import logging
 from abc import ABC, abstractmethod
-from typing import Set, Dict
+from typing import Dict, Tuple, Any, NamedTuple, Optional, Iterator, List
+
+from swagger2locustio.parsers.mask_matcher import MaskMatcher
+from swagger2locustio.parsers.ref_resolver import RefResolver
+
+LOG = logging.getLogger(__name__)
+
+# Should be bumped each time parse results format is changed, it invalidates parsed swagger data cache
+PARSER_VERSION = "6"
+WEIGHT_EXTENSION = "x-locust-weight"
+
+
+class Param(NamedTuple):
+    """Named Tuple: Param"""
+
+    name: str
+    location: str
+    value_type: str
+    default: Any
+    raw: dict
 
 
 class SwaggerBaseParser(ABC):
     """Class: Swagger Base Parser"""
 
-    def parse_swagger_file(self, file_content: dict, mask: Dict[str, Set[str]]) -> dict:
-        """Method: parse swagger file"""
+    def __init__(self):
+        self.resolver = RefResolver({})
+        self.params: Dict[Tuple[str, str, str, str], Param] = {}
+
+    def parse_swagger_file(self, file_content: dict, mask: MaskMatcher, stream: bool = False) -> dict:
+        """Method: parse swagger file
 
-        data = {
+        With `stream` paths data is an iterator, which parses paths one by one while it is consumed,
+        and names of the paths it yields are listed in `path_names`.
+        Objects resolved by `$ref` so far are in `refs`, they are shared by all the paths which refer to them.
+        """
+
+        self.resolver = RefResolver(file_content)
+        self.params = {}
+        data: Dict[str, Any] = {
             "host": self.parse_host_data(file_content),
             "security": self.parse_security_data(file_content),
-            "paths": self.parse_paths_data(file_content, mask),
+            "refs": self.resolver.resolved,
         }
+        if stream:
+            data["path_names"] = self.get_path_names(file_content, mask)
+            data["paths"] = self.iter_paths_data(file_content, mask)
+        else:
+            data["paths"] = self.parse_paths_data(file_content, mask)
         return data
 
     @staticmethod
@@ -34,37 +70,91 @@ class SwaggerBaseParser(ABC):
             security[security_type] = security_config
         return security
 
-    def parse_paths_data(self, file_content: dict, mask: Dict[str, Set[str]]) -> dict:
+    def parse_paths_data(self, file_content: dict, mask: MaskMatcher) -> dict:
         """Method: parse paths data"""
 
-        paths_white_list = mask["paths_white_list"]
-        paths_black_list = mask["paths_black_list"]
-        tags_white_list = mask["tags_white_list"]
-        tags_black_list = mask["tags_black_list"]
+        return dict(self.iter_paths_data(file_content, mask))
+
+    @staticmethod
+    def get_path_names(file_content: dict, mask: MaskMatcher) -> List[str]:
+        """Method: get names of paths matched by mask, they are not parsed"""
+
+        paths = file_content.get("paths")
+        if paths is None:
+            raise ValueError("No paths is found in swagger file")
+        return [path for path in paths if mask.match_path(path)]
+
+    def iter_paths_data(self, file_content: dict, mask: MaskMatcher) -> Iterator[Tuple[str, dict]]:
+        """Method: parse paths data path by path"""
 
-        api_paths = {}
         paths = file_content.get("paths")
         if paths is None:
             raise ValueError("No paths is found in swagger file")
         for path, path_data in paths.items():
             valid_path_methods = {}
-            if (paths_white_list and path.lower() not in paths_white_list) or (path.lower() in paths_black_list):
+            if not mask.match_path(path):
                 continue
+            if "$ref" in path_data:
+                path_data = self.resolver.resolve_ref(path_data["$ref"])
 
             for path_method, method_data in path_data.items():
-                if path_method.lower() not in mask["operations_white_list"]:
-                    continue
-                tags = set(tag.lower() for tag in method_data.get("tags", []))
-                if tags_white_list and not tags_white_list.intersection(tags) or tags_black_list.intersection(tags):
+                if not mask.match_operation(path_method, method_data):
                     continue
-                valid_path_methods[path_method] = {
-                    "params": self._parse_params(method_data.get("parameters", [])),
-                    "responses": method_data.get("responses", {}),
-                }
-            api_paths[path] = valid_path_methods
-        return api_paths
+                valid_path_methods[path_method] = self.parse_method_data(method_data, path_data)
+            yield path, valid_path_methods
+
+    def parse_method_data(self, method_data: dict, path_data: dict) -> dict:
+        """Method: parse method data"""
+
+        params = self._parse_params(path_data.get("parameters", []) + method_data.get("parameters", []))
+        body = self._parse_request_body(method_data)
+        if body is not None:
+            params[body.name] = body
+        return {
+            "operation_id": method_data.get("operationId"),
+            "params": params,
+            "responses": self.resolver.resolve(method_data.get("responses", {})),
+            "weight": self.parse_weight(method_data.get(WEIGHT_EXTENSION, path_data.get(WEIGHT_EXTENSION))),
+        }
 
     @staticmethod
+    def parse_weight(weight: Any) -> Optional[int]:
+        """Method: parse task weight of operation, it may be set for path or operation by vendor extension"""
+
+        if weight is None:
+            return None
+        if isinstance(weight, bool) or not isinstance(weight, (int, float)) or weight < 0:
+            LOG.warning("Incorrect %s value is ignored: %r", WEIGHT_EXTENSION, weight)
+            return None
+        return round(weight)
+
+    def make_param(self, raw: dict, value_type: str, default: Any) -> Param:
+        """Method: make param, equal params are created only once and shared"""
+
+        key = (raw["name"], raw["in"], value_type, repr(default))
+        param = self.params.get(key)
+        if param is None or (param.raw is not raw and param.raw != raw):
+            param = Param(name=raw["name"], location=raw["in"], value_type=value_type, default=default, raw=raw)
+            self.params.setdefault(key, param)
+        return param
+
+    def _parse_params(self, params: list) -> Dict[str, Param]:
+        param_data = {}
+        for param in params:
+            param = self.resolver.resolve(param)
+            param_name = param.get("name")
+            # if not param_name or not param.get("default") or not param.get("in"):
+            if not param_name or not param.get("in"):
+                if param.get("required"):
+                    raise ValueError("Not full info about required param")
+                continue
+            param_data[param_name] = self._parse_param(param)
+        return param_data
+
+    @abstractmethod
+    def _parse_param(self, param: dict) -> Param:
+        raise NotImplementedError()
+
     @abstractmethod
-    def _parse_params(params: dict) -> dict:
+    def _parse_request_body(self, method_data: dict) -> Optional[Param]:
         raise NotImplementedError()
@@ -0,0 +1,134 @@
+"""Module: Mask Matcher"""
+
+import re
+import fnmatch
+from typing import Callable, Dict, Iterable, List, Optional, Pattern, Set, Tuple
+
+REGEX_PREFIX = "re:"
+
+
+class PatternSet:
+    """Class: Pattern Set
+
+    Case insensitive set of literal values, glob patterns and `re:` prefixed regular expressions.
+    Literals are looked up in a set, all the patterns are compiled into one alternation.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self.literals: Set[str] = set()
+        regexes = []
+        for pattern in patterns:
+            if pattern.startswith(REGEX_PREFIX):
+                regexes.append(self._check_regex(pattern))
+            elif "*" in pattern or "?" in pattern or "[" in pattern:
+                regexes.append(fnmatch.translate(pattern))
+            else:
+                self.literals.add(pattern.lower())
+        self.regex = self._compile_regexes(regexes)
+        self.empty = not self.literals and self.regex is None
+        self.match: Callable[[str], bool] = self._compile_match()
+
+    def __bool__(self) -> bool:
+        return not self.empty
+
+    @staticmethod
+    def _check_regex(pattern: str) -> str:
+        regex = pattern[len(REGEX_PREFIX) :]
+        try:
+            re.compile(regex)
+        except re.error as error:
+            raise ValueError(f"Invalid regular expression `{pattern}`: {error}") from error
+        return regex
+
+    @staticmethod
+    def _compile_regexes(regexes: List[str]) -> Optional[Pattern]:
+        if not regexes:
+            return None
+        try:
+            return re.compile("|".join(f"(?:{regex})" for regex in regexes), re.IGNORECASE)
+        except re.error as error:  # e.g. global flags of one of them, which are valid on their own only
+            raise ValueError(f"Regular expressions can not be combined: {error}") from error
+
+    def _compile_match(self) -> Callable[[str], bool]:
+        literals = self.literals
+        if self.regex is None:
+            if not literals:
+                return lambda value: False
+            return lambda value: value.lower() in literals
+        fullmatch = self.regex.fullmatch
+        return lambda value: value.lower() in literals or fullmatch(value) is not None
+
+    def match_any(self, values: Iterable[str]) -> bool:
+        """Method: check if any of values matches"""
+
+        return any(self.match(value) for value in values)
+
+
+class MaskMatcher:  # pylint: disable=too-many-instance-attributes
+    """Class: Mask Matcher
+
+    Mask from the command line compiled once, it decides which paths and operations are used in api testing.
+    `match_path(path)` and `match_operation(method, method_data)` are compiled into functions that check only
+    the filters that are set.
+    """
+
+    def __init__(self, mask: Dict[str, Set[str]]):
+        self.operations = {operation.lower() for operation in mask["operations_white_list"]}
+        self.paths_white = PatternSet(mask.get("paths_white_list", ()))
+        self.paths_black = PatternSet(mask.get("paths_black_list", ()))
+        self.tags_white = PatternSet(mask.get("tags_white_list", ()))
+        self.tags_black = PatternSet(mask.get("tags_black_list", ()))
+        self.operation_ids_white = PatternSet(mask.get("operation_ids_white_list", ()))
+        self.operation_ids_black = PatternSet(mask.get("operation_ids_black_list", ()))
+        self.check_tags = not (self.tags_white.empty and self.tags_black.empty)
+        self.check_operation_ids = not (self.operation_ids_white.empty and self.operation_ids_black.empty)
+        self.tags_results: Dict[Tuple[str, ...], bool] = {}
+        self.match_path: Callable[[str], bool] = self._compile_match_path()
+        self.match_operation: Callable[[str, dict], bool] = self._compile_match_operation()
+
+    def _compile_match_path(self) -> Callable[[str], bool]:
+        paths_white, paths_black = self.paths_white, self.paths_black
+        if paths_white.empty and paths_black.empty:
+            return lambda path: True
+        if paths_black.empty:
+            return paths_white.match
+        if paths_white.empty:
+            return lambda path: not paths_black.match(path)
+        return lambda path: paths_white.match(path) and not paths_black.match(path)
+
+    def _compile_match_operation(self) -> Callable[[str, dict], bool]:
+        operations = self.operations
+        if not self.check_tags and not self.check_operation_ids:
+            return lambda method, method_data: method in operations or method.lower() in operations
+        tags_results = self.tags_results
+
+        def match_operation(method: str, method_data: dict) -> bool:
+            if method not in operations and method.lower() not in operations:
+                return False
+            if self.check_tags:
+                tags = tuple(method_data.get("tags", ()))
+                matched = tags_results.get(tags)
+                if not (self.match_tags(tags) if matched is None else matched):
+                    return False
+            return not self.check_operation_ids or self.match_operation_id(method_data.get("operationId", ""))
+
+        return match_operation
+
+    def match_operation_id(self, operation_id: str) -> bool:
+        """Method: check if operation with operation id should be used"""
+
+        if not self.operation_ids_white.empty and not self.operation_ids_white.match(operation_id):
+            return False
+        return not self.operation_ids_black.match(operation_id)
+
+    def match_tags(self, tags: Tuple[str, ...]) -> bool:
+        """Method: check if operation with tags should be used, results are memoized as tags are repeated a lot"""
+
+        result = self.tags_results.get(tags)
+        if result is None:
+            if not self.tags_white.empty and not self.tags_white.match_any(tags):
+                result = False
+            else:
+                result = not self.tags_black.match_any(tags)
+            self.tags_results[tags] = result
+        return result
@@ -0,0 +1,108 @@
+"""Module: Ref Resolver"""
+
+import logging
+from typing import Any, Dict, Set
+from urllib.parse import unquote
+
+LOG = logging.getLogger(__name__)
+
+# Top level sections with reusable objects, their items are indexed up front
+INDEXED_SECTIONS = ("definitions", "parameters", "responses", "securityDefinitions")
+COMPONENTS_SECTION = "components"
+
+
+class RefResolver:
+    """Class: Ref Resolver
+
+    Builds JSON pointer index of reusable objects once and resolves `$ref` lazily.
+    Every reference is resolved only once, the result is shared between all the places that refer to it.
+    Circular references are left unresolved.
+    """
+
+    def __init__(self, file_content: dict):
+        self.file_content = file_content
+        self.index: Dict[str, Any] = self._build_index(file_content)
+        self.resolved: Dict[str, Any] = {}
+        self.resolving: Set[str] = set()
+
+    @staticmethod
+    def _build_index(file_content: dict) -> Dict[str, Any]:
+        index = {}
+        sections = [(f"#/{section}", file_content.get(section)) for section in INDEXED_SECTIONS]
+        components = file_content.get(COMPONENTS_SECTION)
+        if isinstance(components, dict):
+            sections.extend((f"#/{COMPONENTS_SECTION}/{kind}", objects) for kind, objects in components.items())
+        for prefix, objects in sections:
+            if not isinstance(objects, dict):
+                continue
+            for name, value in objects.items():
+                index[f"{prefix}/{name.replace('~', '~0').replace('/', '~1')}"] = value
+        return index
+
+    def resolve(self, node: Any) -> Any:
+        """Method: resolve all the references inside node, node itself is returned if it has no references"""
+
+        if isinstance(node, dict):
+            ref = node.get("$ref")
+            if isinstance(ref, str):
+                return self.resolve_ref(ref)
+            resolved_dict = None
+            for key, value in node.items():
+                resolved_value = self.resolve(value)
+                if resolved_value is not value:
+                    if resolved_dict is None:
+                        resolved_dict = dict(node)
+                    resolved_dict[key] = resolved_value
+            return node if resolved_dict is None else resolved_dict
+        if isinstance(node, list):
+            resolved_list = None
+            for i, value in enumerate(node):
+                resolved_value = self.resolve(value)
+                if resolved_value is not value:
+                    if resolved_list is None:
+                        resolved_list = list(node)
+                    resolved_list[i] = resolved_value
+            return node if resolved_list is None else resolved_list
+        return node
+
+    def resolve_ref(self, ref: str) -> Any:
+        """Method: resolve reference"""
+
+        if ref in self.resolved:
+            return self.resolved[ref]
+        if ref in self.resolving:
+            LOG.debug("Circular reference %s is left unresolved", ref)
+            return {"$ref": ref}
+
+        try:
+            target = self._lookup(ref)
+        except ValueError as error:
+            LOG.warning(error)
+            target = {"$ref": ref}
+            self.resolved[ref] = target
+            return target
+
+        self.resolving.add(ref)
+        try:
+            resolved = self.resolve(target)
+        finally:
+            self.resolving.discard(ref)
+        self.resolved[ref] = resolved
+        return resolved
+
+    def _lookup(self, ref: str) -> Any:
+        if ref in self.index:
+            return self.index[ref]
+        if not ref.startswith("#/"):
+            raise ValueError(f"Only local references are supported: {ref}")
+        target: Any = self.file_content
+        for part in ref[2:].split("/"):
+            part = unquote(part).replace("~1", "/").replace("~0", "~")
+            if isinstance(target, dict) and part in target:
+                target = target[part]
+            elif isinstance(target, list) and part.isdigit() and int(part) < len(target):
+                target = target[int(part)]
+            else:
+                raise ValueError(f"Reference {ref} can not be resolved")
+        self.index[ref] = target
+        return target
@@ -1,21 +1,16 @@
 """Module: SwaggerV2 parser"""
-from copy import deepcopy
 
-from swagger2locustio.parsers.base_parser import SwaggerBaseParser
+from typing import Optional
+
+from swagger2locustio.parsers.base_parser import SwaggerBaseParser, Param
 
 
 class SwaggerV2Parser(SwaggerBaseParser):
     """Class: SwaggerV2 parser"""
 
-    @staticmethod
-    def _parse_params(params: dict) -> dict:
-        param_data = {}
-        for param in params:
-            param_name = param.get("name")
-            # if not param_name or not param.get("default") or not param.get("in"):
-            if not param_name or not param.get("in"):
-                if param.get("required"):
-                    raise ValueError("Not full info about required param")
-                continue
-            param_data[param_name] = deepcopy(param)
-        return param_data
+    def _parse_param(self, param: dict) -> Param:
+        return self.make_param(param, param.get("type", ""), param.get("default"))
+
+    def _parse_request_body(self, method_data: dict) -> Optional[Param]:
+        # body is described as one of the parameters
+        return None
@@ -1,11 +1,61 @@
 """Module: SwaggerV3 parser"""
 
-from swagger2locustio.parsers.base_parser import SwaggerBaseParser
+import re
+from typing import Optional
+
+from swagger2locustio.parsers.base_parser import SwaggerBaseParser, Param
+
+SERVER_VARIABLE_PATTERN = re.compile(r"{(.*?)}", re.UNICODE)
+JSON_MEDIA_TYPE_PATTERN = re.compile(r"^application/(.+\+)?json", re.UNICODE)
 
 
 class SwaggerV3Parser(SwaggerBaseParser):
     """Class: SwaggerV3 parser"""
 
     @staticmethod
-    def _parse_params(params: dict) -> dict:
-        raise NotImplementedError()
+    def parse_host_data(file_content: dict) -> str:
+        """Method: parse host data"""
+
+        servers = file_content.get("servers") or [{}]
+        server = servers[0]
+        variables = server.get("variables", {})
+        return re.sub(
+            SERVER_VARIABLE_PATTERN,
+            lambda match: str(variables.get(match.group(1), {}).get("default", match.group(0))),
+            server.get("url", ""),
+        )
+
+    @staticmethod
+    def parse_security_data(file_content: dict) -> dict:
+        """Method: parse security data"""
+
+        security = {}
+        security_schemes = file_content.get("components", {}).get("securitySchemes", {})
+        for security_config in security_schemes.values():
+            security_type = security_config.get("type", "")
+            if security_type == "http" and security_config.get("scheme", "").lower() == "basic":
+                security_type = "basic"
+            security[security_type] = security_config
+        return security
+
+    def _parse_param(self, param: dict) -> Param:
+        schema = param.get("schema", {})
+        return self.make_param(param, schema.get("type", ""), schema.get("default"))
+
+    def _parse_request_body(self, method_data: dict) -> Optional[Param]:
+        request_body = method_data.get("requestBody")
+        if request_body is None:
+            return None
+        request_body = self.resolver.resolve(request_body)
+        content = request_body.get("content", {})
+        if not content:
+            return None
+        media_type = next((media for media in content if JSON_MEDIA_TYPE_PATTERN.match(media)), next(iter(content)))
+        raw = {
+            "name": "body",
+            "in": "body",
+            "required": request_body.get("required", False),
+            "mediaType": media_type,
+            "schema": content[media_type].get("schema", {}),
+        }
+        return self.make_param(raw, "", None)
@@ -0,0 +1,119 @@
+"""Module: Profiler"""
+
+import json
+import time
+import cProfile
+import logging
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, TypeVar
+
+from swagger2locustio.utils import get_peak_rss
+
+LOG = logging.getLogger(__name__)
+
+TOP_ALLOCATIONS_COUNT = 20
+
+T = TypeVar("T")
+
+
+class Profiler:  # pylint: disable=too-many-instance-attributes
+    """Class: Profiler
+
+    Collects wall time of stages and counters of a run into JSON report. With `capture` the run is profiled
+    by cProfile as well, and top allocations of it are taken by tracemalloc.
+    Time of nested stages is not counted in their outer stages, e.g. lazy parsing of paths consumed by generation.
+    """
+
+    def __init__(self, capture: bool = False):
+        self.capture = capture
+        self.stages: Dict[str, float] = {}
+        self.counters: Dict[str, int] = {}
+        self.top_allocations: List[dict] = []
+        # nested time of open stages, the last one is the innermost
+        self.nested_seconds: List[float] = []
+        self.c_profile: Optional[cProfile.Profile] = cProfile.Profile() if capture else None
+        self.started = time.perf_counter()
+        self.finished: Optional[float] = None
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Method: time stage, time of stages with the same name is summed up, time of nested stages is excluded"""
+
+        start = time.perf_counter()
+        self.nested_seconds.append(0.0)
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            self.stages[name] = self.stages.get(name, 0.0) + seconds - self.nested_seconds.pop()
+            if self.nested_seconds:
+                self.nested_seconds[-1] += seconds
+
+    def iterate(self, name: str, iterable: Iterable[T]) -> Iterator[T]:
+        """Method: time taking of items of lazy iterable as stage, e.g. parsing of paths while they are consumed"""
+
+        iterator = iter(iterable)
+        while True:
+            with self.stage(name):
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    return
+            yield item
+
+    def count(self, name: str, value: int = 1) -> None:
+        """Method: increase counter"""
+
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def start(self) -> None:
+        """Method: start the run, cProfile and tracemalloc are started if capture is enabled"""
+
+        self.started = time.perf_counter()
+        if self.c_profile is not None:
+            tracemalloc.start()
+            self.c_profile.enable()
+
+    def stop(self) -> None:
+        """Method: stop the run, top allocations are taken if capture is enabled"""
+
+        self.finished = time.perf_counter()
+        if self.c_profile is None:
+            return
+        self.c_profile.disable()
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.stop()
+        self.top_allocations = [
+            {
+                "location": str(statistic.traceback),
+                "size_kib": round(statistic.size / 1024, 1),
+                "count": statistic.count,
+            }
+            for statistic in snapshot.statistics("lineno")[:TOP_ALLOCATIONS_COUNT]
+        ]
+
+    def report(self) -> dict:
+        """Method: make report of the run"""
+
+        finished = self.finished if self.finished is not None else time.perf_counter()
+        report = {
+            "total_seconds": round(finished - self.started, 6),
+            "stages": {name: round(seconds, 6) for name, seconds in self.stages.items()},
+            "counters": dict(self.counters),
+            "peak_rss_mib": round(get_peak_rss() / 2 ** 20, 1),
+        }
+        if self.capture:
+            report["top_allocations"] = self.top_allocations
+        return report
+
+    def save(self, report_path: Path) -> None:
+        """Method: save JSON report, cProfile stats are saved next to it with `.prof` suffix"""
+
+        report_path.write_text(json.dumps(self.report(), indent=2), encoding="utf-8")
+        LOG.info("Profile report is saved to %s", report_path)
+        if self.c_profile is not None:
+            stats_path = report_path.with_suffix(".prof")
+            self.c_profile.dump_stats(str(stats_path))
+            LOG.info("cProfile stats are saved to %s", stats_path)
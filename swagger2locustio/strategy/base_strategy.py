@@ -1,28 +1,48 @@
 """Module: Base Strategy"""
 
+import logging
 from pathlib import Path
-from typing import Set, Dict
+from typing import Set, Dict, Optional
 
+from swagger2locustio.cache import ParsedSpecCache
+from swagger2locustio.loader import load_swagger_file
+from swagger2locustio.profiler import Profiler
 from swagger2locustio.parsers.base_parser import SwaggerBaseParser
+from swagger2locustio.parsers.mask_matcher import MaskMatcher
 from swagger2locustio.parsers.swagger_v2 import SwaggerV2Parser
 from swagger2locustio.parsers.swagger_v3 import SwaggerV3Parser
-from swagger2locustio.generators.base_generator import BaseGenerator
+from swagger2locustio.generators.base_generator import BaseGenerator, GeneratorConfig
+
+LOG = logging.getLogger(__name__)
 
 
 class BaseStrategy:
     """Class: Base Strategy"""
 
-    def __init__(self, file_content: dict, results_path: Path, mask: Dict[str, Set[str]]):
-        self.swagger_file_content = file_content
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        swagger_file: Path,
+        results_path: Path,
+        mask: Dict[str, Set[str]],
+        cache: Optional[ParsedSpecCache] = None,
+        config: Optional[GeneratorConfig] = None,
+        *,
+        profiler: Optional[Profiler] = None,
+    ):
+        self.swagger_file = swagger_file
         self.mask = mask
-        self.generator = BaseGenerator(results_path)
+        self.mask_matcher = MaskMatcher(mask)
+        self.cache = cache
+        self.profiler = profiler if profiler is not None else Profiler()
+        self.generator = BaseGenerator(results_path, config)
         results_path.mkdir(exist_ok=True)
 
-    def get_specific_version_parser(self) -> SwaggerBaseParser:
+    @staticmethod
+    def get_specific_version_parser(file_content: dict) -> SwaggerBaseParser:
         """Method: get specific version parser"""
 
-        swagger_version = self.swagger_file_content.get("swagger")
-        openapi_version = self.swagger_file_content.get("openapi")
+        swagger_version = file_content.get("swagger")
+        openapi_version = file_content.get("openapi")
         version = swagger_version if swagger_version else openapi_version
         if not version:
             raise ValueError("No swagger version is specified")
@@ -35,9 +55,55 @@ class BaseStrategy:
             raise ValueError("There is no support for %s version of swagger" % version)
         return parser
 
+    def parse(self) -> dict:
+        """Method: parse swagger file, parsed data is taken from cache if possible
+
+        Paths are parsed lazily, while test classes are generated, and they are put to cache while they are parsed,
+        see `parse_swagger_file` and `ParsedSpecCache.put`. Taking of paths is timed in stages of its own.
+        """
+
+        cache_key = ""
+        if self.cache is not None:
+            cache_key = self.cache.make_key(self.swagger_file, self.mask)
+            with self.profiler.stage("cache_get"):
+                swagger_data = self.cache.get(cache_key)
+            if swagger_data is not None:
+                LOG.info("Parsed swagger data is taken from cache")
+                self.profiler.count("cache_hits")
+                return dict(swagger_data, paths=self.profiler.iterate("cache_get", swagger_data["paths"]))
+
+        with self.profiler.stage("load"):
+            file_content, _ = load_swagger_file(self.swagger_file)
+        with self.profiler.stage("parse"):
+            specific_version_parser = self.get_specific_version_parser(file_content)
+            swagger_data = specific_version_parser.parse_swagger_file(file_content, self.mask_matcher, stream=True)
+        swagger_data["paths"] = self.profiler.iterate("parse", swagger_data["paths"])
+        if self.cache is not None:
+            swagger_data = self.cache.put(cache_key, swagger_data)
+            swagger_data["paths"] = self.profiler.iterate("cache_put", swagger_data["paths"])
+        return swagger_data
+
     def process(self):
-        """Method: process"""
+        """Method: process, files written by the run are rolled back if it fails"""
+
+        writer = self.generator.writer
+        try:
+            swagger_data = self.parse()
+            write_seconds = writer.write_seconds
+            with self.profiler.stage("generate"):
+                self.generator.generate_locustfiles(swagger_data)
+        except BaseException:
+            writer.rollback()
+            raise
+        self.profiler.count("operations_parsed", self.generator.operations_count)
 
-        specific_version_parser = self.get_specific_version_parser()
-        swagger_data = specific_version_parser.parse_swagger_file(self.swagger_file_content, self.mask)
-        self.generator.generate_locustfiles(swagger_data)
+        # files are written while test classes are rendered, so the time of writing is taken from the writer
+        # and it is not counted in the time of generation
+        self.profiler.stages["generate"] -= writer.write_seconds - write_seconds
+        self.profiler.stages["write_files"] = writer.write_seconds
+        files_count = len(writer.written) + len(writer.skipped)
+        self.profiler.count("test_methods_rendered", self.generator.rendered_methods_count)
+        self.profiler.count("templates_rendered", self.generator.rendered_methods_count + files_count)
+        self.profiler.count("files_written", len(writer.written))
+        self.profiler.count("files_skipped", len(writer.skipped))
+        self.profiler.count("bytes_written", writer.bytes_written)
@@ -1,8 +1,9 @@
 """Module: Auth templates"""
 
-from jinja2 import Template
+from swagger2locustio.templates.environment import make_template
 
-AUTH_BASIC = Template(
+AUTH_BASIC = make_template(
+    "auth_templates/auth_basic",
     """
         ''' Security config
         {{ security_config }}
@@ -10,24 +11,26 @@ AUTH_BASIC = Template(
         auth_str = str(os.getenv(\"TEST_USER_LOGIN\")) + ":" + str(os.getenv(\"TEST_USER_PASSWORD\"))
         credentials = b64encode(auth_str.encode()).decode("utf-8")
         credentials = "Basic " + credentials
-        self.client.headers.update({"Authorization": credentials})
-"""
+        {{ headers }}.update({"Authorization": credentials})
+""",
 )
 
-AUTH_KEY_HEADER = Template(
+AUTH_KEY_HEADER = make_template(
+    "auth_templates/auth_key_header",
     """
         ''' Security config
         {{ security_config }}
         '''
-        self.client.headers.update({"{{ name }}": str(os.getenv(\"TEST_USER_API_KEY\"))})
-"""
+        {{ headers }}.update({"{{ name }}": str(os.getenv(\"TEST_USER_API_KEY\"))})
+""",
 )
 
-AUTH_UNDEFINED = Template(
+AUTH_UNDEFINED = make_template(
+    "auth_templates/auth_undefined",
     """
         ''' Security config
         {{ security_config }}
         '''
         raise NotImplementedError("You should add or delete auth")
-"""
+""",
 )
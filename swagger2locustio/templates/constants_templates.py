@@ -1,20 +1,69 @@
 """Module: constants templates"""
 
-from jinja2 import Template
+from swagger2locustio.templates.environment import make_template
 
-CONSTANTS_BASE_FILE = Template(
-    """from apps.helper import Helper
+CONSTANTS_BASE_FILE = make_template(
+    "constants_templates/constants_base_file",
+    """{% if wait_mode == "target_rps" or worker_constants %}import os
 
-API_PREFIX = ""
+{% endif %}from apps.helper import Helper
 
-"""
+API_PREFIX = ""
+{% if wait_mode == "between" %}
+# Every user waits from WAIT_MIN to WAIT_MAX seconds between tasks
+WAIT_MIN = 5
+WAIT_MAX = 10
+{% elif wait_mode == "constant_pacing" %}
+# Every user starts a task once in PACING seconds, unless tasks take longer
+PACING = 1.0
+{% elif wait_mode == "constant_throughput" %}
+# Every user runs THROUGHPUT tasks per second, unless tasks take longer
+THROUGHPUT = 1.0
+{% elif wait_mode == "target_rps" %}
+# All the users run TARGET_RPS tasks per second in total, RPS of every task is proportional to its weight.
+# Pacing of users is derived from USER_COUNT, it should be equal to the number of users of the test run
+TARGET_RPS = {{ target_rps }}
+USER_COUNT = int(os.environ.get("LOCUST_USERS", {{ user_count }}))
+{% endif %}{% if worker_constants %}
+# Index of locust worker and number of workers, they are set by run_distributed.py to partition data of workers
+WORKER_INDEX = int(os.environ.get("WORKER_INDEX", 0))
+WORKER_COUNT = int(os.environ.get("WORKER_COUNT", 1))
+{% endif %}{% if user_class == "fast" %}
+# FastHttpUser connection pool, every user keeps up to FAST_HTTP_CONCURRENCY keep-alive connections
+FAST_HTTP_CONCURRENCY = 10
+FAST_HTTP_CONNECTION_TIMEOUT = 60.0
+FAST_HTTP_NETWORK_TIMEOUT = 60.0
+FAST_HTTP_MAX_RETRIES = 1
+FAST_HTTP_MAX_REDIRECTS = 5
+FAST_HTTP_INSECURE = True
+{% endif %}{% if data_pools %}
+# Data pools: values generated in advance for every constant, they are the same in every run with the same seed
+DATA_POOL_SEED = 0
+DATA_POOL_SIZE = 10000
+DATA_POOL_REFILL = False
+{% endif %}{% if feeder_cursor %}
+# Feeders take values from files one by one (`sequential`) or randomly (`random`)
+FEEDER_CURSOR = "{{ feeder_cursor }}"
+{% endif %}{% if chain_requests %}
+# Every user keeps the last CHAIN_SIZE values saved by every producer of request chains
+CHAIN_SIZE = 100
+{% endif %}{% if validation_sample %}
+# Response bodies are validated against schemas once in VALIDATION_SAMPLE responses, status codes are always checked
+VALIDATION_SAMPLE = {{ validation_sample }}
+{% endif %}
+""",
 )
 
-CONSTANTS_FILE = Template(
+CONSTANTS_FILE = make_template(
+    "constants_templates/constants_file",
     """from apps.helper import Helper
-
+{% if constants | selectattr("kind", "equalto", "pool") | first %}from apps.data_pool import DataPool
+{% endif %}{% if constants | selectattr("kind", "equalto", "feeder") | first %}from apps.feeder import Feeder
+{% endif %}
 {% for const in constants %}# value type -> {{ const.value_type }}
-{{ const.name }} = [{{ const.val }}]
-{% endfor %}
-"""
+{% if const.kind == "pool" %}{{ const.name }} = DataPool("{{ const.name }}", {{ const.val }})
+{% elif const.kind == "feeder" %}{{ const.name }} = Feeder({{ const.val }})
+{% else %}{{ const.name }} = [{{ const.val }}]
+{% endif %}{% endfor %}
+""",
 )
@@ -0,0 +1,61 @@
+"""Module: Templates environment"""
+
+import logging
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from jinja2 import BytecodeCache, DictLoader, Environment, FileSystemBytecodeCache, Template
+
+LOG = logging.getLogger(__name__)
+
+BYTECODE_CACHE_DIR_NAME = "jinja"
+
+TEMPLATES: Dict[str, str] = {}
+
+# Templates never change while running, so they are compiled once and never checked for updates
+ENVIRONMENT = Environment(  # nosec - generated code is not html, nothing to escape
+    loader=DictLoader(TEMPLATES), auto_reload=False, cache_size=-1
+)
+
+
+class LazyTemplate:  # pylint: disable=too-few-public-methods
+    """Class: Lazy Template
+
+    Template registered in the shared environment, it is compiled on the first access to its attributes, e.g. `render`,
+    so importing templates neither compiles them nor touches bytecode cache, which is set by `set_bytecode_cache`.
+    Attributes of compiled template are kept in the instance, so later calls of them cost nothing extra.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __getattr__(self, attr: str) -> Any:
+        template: Template = ENVIRONMENT.get_template(self.name)
+        value = getattr(template, attr)
+        setattr(self, attr, value)
+        return value
+
+
+def make_bytecode_cache(cache_dir: Path) -> Optional[BytecodeCache]:
+    """Function: make bytecode cache for compiled templates in `jinja` dir of cache dir, None if it is not writable"""
+
+    bytecode_cache_dir = cache_dir / BYTECODE_CACHE_DIR_NAME
+    try:
+        bytecode_cache_dir.mkdir(parents=True, exist_ok=True)
+    except OSError as error:
+        LOG.debug("Templates bytecode cache is disabled: %s", error)
+        return None
+    return FileSystemBytecodeCache(str(bytecode_cache_dir))
+
+
+def set_bytecode_cache(cache_dir: Optional[Path]) -> None:
+    """Function: cache compiled templates in cache dir, None disables bytecode cache"""
+
+    ENVIRONMENT.bytecode_cache = make_bytecode_cache(cache_dir) if cache_dir is not None else None
+
+
+def make_template(name: str, source: str) -> LazyTemplate:
+    """Function: register template source in the shared environment, it is compiled on the first render"""
+
+    TEMPLATES[name] = source
+    return LazyTemplate(name)
@@ -1,23 +1,41 @@
 """Module: locustfile templates"""
 
-from jinja2 import Template
+from swagger2locustio.templates.environment import make_template
+
+HELPER_FACTORY_MAPPING = {}
+HELPER_FACTORY_MAPPING.update(dict.fromkeys(["int", "integer", "int32", "int64"], "Helper.get_random_int"))
+HELPER_FACTORY_MAPPING.update(dict.fromkeys(["positiveint", "positive_int"], "Helper.get_random_positive_int"))
+HELPER_FACTORY_MAPPING.update(dict.fromkeys(["negativeint", "negative_int"], "Helper.get_random_negative_int"))
+HELPER_FACTORY_MAPPING.update(dict.fromkeys(["float", "double", "number"], "Helper.get_random_float"))
+HELPER_FACTORY_MAPPING.update(dict.fromkeys(["bool", "boolean"], "Helper.get_random_bool"))
+HELPER_FACTORY_MAPPING.update(dict.fromkeys(["null"], "Helper.get_null_value"))
+
+# Strings of plain constants are left for user to fill in, data pools generate random ones
+POOL_FACTORY_MAPPING = dict(HELPER_FACTORY_MAPPING, string="Helper.get_random_string")
 
 HELPER_MAPPING = {}
-HELPER_MAPPING.update(dict.fromkeys(["choice"], "Helper.get_random_choice_from_values(*{values})"))
-HELPER_MAPPING.update(dict.fromkeys(["int", "integer", "int32", "int64"], "Helper.get_random_int()"))
-HELPER_MAPPING.update(dict.fromkeys(["positiveint", "positive_int"], "Helper.get_random_positive_int()"))
-HELPER_MAPPING.update(dict.fromkeys(["negativeint", "negative_int"], "Helper.get_random_negative_int()"))
-HELPER_MAPPING.update(dict.fromkeys(["float", "double", "number"], "Helper.get_random_float()"))
-HELPER_MAPPING.update(dict.fromkeys(["bool", "boolean"], "Helper.get_random_bool()"))
-HELPER_MAPPING.update(dict.fromkeys(["null"], "Helper.get_null_value()"))
-
-HELPER_CLASS = Template(
+HELPER_MAPPING.update(dict.fromkeys(["choice"], "Helper.get_random_choice({values})"))
+HELPER_MAPPING.update(dict.fromkeys(["pool"], "{values}.next()"))
+HELPER_MAPPING.update({value_type: f"{factory}()" for value_type, factory in HELPER_FACTORY_MAPPING.items()})
+
+# Values of these types are stored in `array.array` by data pools
+POOL_TYPECODES = {}
+POOL_TYPECODES.update(dict.fromkeys(["int", "integer", "int32", "int64"], "q"))
+POOL_TYPECODES.update(dict.fromkeys(["positiveint", "positive_int", "negativeint", "negative_int"], "q"))
+POOL_TYPECODES.update(dict.fromkeys(["float", "double", "number"], "d"))
+
+HELPER_CLASS = make_template(
+    "helpers_templates/helper_class",
     """import datetime
 import random
 import string
 
 
 class Helper:
+    @staticmethod
+    def get_random_choice(values):
+        return random.choice(values)
+
     @staticmethod
     def get_random_choice_from_values(*args):
         return random.choice(args)
@@ -83,10 +101,7 @@ class Helper:
 
     @classmethod
     def get_random_ipv4(cls):
-        result = cls.get_random_int(0, 255)
-        for x in range(3):
-            result += "." + cls.get_random_int(0, 255)
-        return result
+        return ".".join(str(cls.get_random_int(0, 255)) for _ in range(4))
 
     @classmethod
     def get_random_ipv6(cls):
@@ -95,5 +110,239 @@ class Helper:
             result += ":" + "".join(random.choices("abcdef" + string.digits, k=4))
         return result
 
-"""
+""",
+)
+
+DATA_POOL_FILE = make_template(
+    "helpers_templates/data_pool_file",
+    """import random
+import zlib
+from array import array
+
+from constants.base_constants import DATA_POOL_SEED, DATA_POOL_SIZE, DATA_POOL_REFILL, WORKER_INDEX
+
+
+class PoolValues:
+    \"\"\"Values generated in advance for all the pools of the same factory, typecode and size
+
+    Random is seeded by DATA_POOL_SEED, the factory name and WORKER_INDEX, so every run uses the same values
+    and locust workers use different values.
+    \"\"\"
+
+    def __init__(self, factory, typecode, size):
+        self.factory = factory
+        self.typecode = typecode
+        self.size = size
+        self.values = ()
+        self.random_state = None
+        self.generation = 0
+        self.generate(seed=DATA_POOL_SEED ^ zlib.crc32(factory.__qualname__.encode()) ^ WORKER_INDEX * 0x9E3779B1)
+
+    def generate(self, seed=None):
+        # generation is not interrupted by other greenlets, so global random state can be borrowed
+        state = random.getstate()
+        if seed is not None:
+            random.seed(seed)
+        else:
+            random.setstate(self.random_state)
+        values = [self.factory() for _ in range(self.size)]
+        self.random_state = random.getstate()
+        random.setstate(state)
+        self.values = array(self.typecode, values) if self.typecode else tuple(values)
+        self.generation += 1
+
+    def refill(self, generation):
+        # the first pool exhausted on the current values generates the next ones, the others just take them
+        if generation == self.generation:
+            self.generate()
+
+
+# (factory, typecode, size) -> values shared by pools, so memory does not grow with the number of constants
+SHARED_VALUES = {}
+
+
+class DataPool:
+    \"\"\"Values of a constant generated in advance, every request just takes the next one
+
+    Values are generated on the first `next` call and are shared by pools of the same factory, see `PoolValues`.
+    Every pool starts at its own offset taken from its name, so constants do not get the same values.
+    When pool is exhausted it starts from its offset again, or it takes the next values if DATA_POOL_REFILL is set.
+    \"\"\"
+
+    def __init__(self, name, factory=None, typecode=None, values=(), size=DATA_POOL_SIZE):
+        self.name = name
+        self.factory = factory
+        self.typecode = typecode
+        self.shared = None
+        self.generation = 0
+        self.taken = 0
+        if factory is None:
+            self.values = tuple(values)
+            self.size = len(self.values)
+            self.offset = 0
+        else:
+            self.values = None
+            self.size = size
+            self.offset = zlib.crc32(name.encode()) % size
+
+    def take_shared_values(self):
+        key = (self.factory, self.typecode, self.size)
+        self.shared = SHARED_VALUES.get(key)
+        if self.shared is None:
+            self.shared = SHARED_VALUES[key] = PoolValues(*key)
+        self.values = self.shared.values
+        self.generation = self.shared.generation
+
+    def next(self):
+        if self.values is None:
+            self.take_shared_values()
+        elif self.taken >= self.size:
+            self.taken = 0
+            if DATA_POOL_REFILL and self.shared is not None:
+                self.shared.refill(self.generation)
+                self.take_shared_values()
+        value = self.values[(self.offset + self.taken) % self.size]
+        self.taken += 1
+        return value
+
+""",
+)
+
+FEEDER_FILE = make_template(
+    "helpers_templates/feeder_file",
+    """import mmap
+import random
+import struct
+
+from constants.base_constants import FEEDER_CURSOR, WORKER_INDEX, WORKER_COUNT
+
+RECORD_FORMATS = {"int32": struct.Struct("<i"), "int64": struct.Struct("<q")}
+
+
+class Feeder:
+    \"\"\"Values of a constant read from external file, every request takes the next one
+
+    File is memory mapped, so its pages are shared by all the workers of the host through OS page cache.
+    Every worker reads only its own shard of the file, WORKER_INDEX of WORKER_COUNT.
+    Values are taken one by one, or randomly if FEEDER_CURSOR is `random`. Random lines are picked by random
+    offset of the shard, so lines of equal length are equally likely.
+    `lines` files are newline-delimited text, `int32` and `int64` files are arrays of little-endian integers.
+    \"\"\"
+
+    def __init__(self, path, file_format="lines"):
+        self.path = path
+        self.record = RECORD_FORMATS.get(file_format)
+        with open(path, "rb") as file:
+            self.data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        size = len(self.data)
+        if self.record is None:
+            self.start = self.line_boundary(size * WORKER_INDEX // WORKER_COUNT)
+            self.end = self.line_boundary(size * (WORKER_INDEX + 1) // WORKER_COUNT)
+        else:
+            count = size // self.record.size
+            self.start = count * WORKER_INDEX // WORKER_COUNT * self.record.size
+            self.end = count * (WORKER_INDEX + 1) // WORKER_COUNT * self.record.size
+        if self.start >= self.end:
+            raise ValueError(f"Feeder file {path} has no values for worker {WORKER_INDEX} of {WORKER_COUNT}")
+        self.position = self.start
+        self.random = FEEDER_CURSOR == "random"
+
+    def line_boundary(self, position):
+        # start of the first line which starts at position or after it
+        if position == 0:
+            return 0
+        line_end = self.data.find(b"\\n", position - 1)
+        return len(self.data) if line_end < 0 else line_end + 1
+
+    def next(self):
+        if self.record is not None:
+            return self.next_record()
+        if self.random:
+            offset = random.randrange(self.start, self.end)
+            position = self.data.rfind(b"\\n", self.start, offset) + 1 or self.start
+        else:
+            position = self.position
+        line_end = self.data.find(b"\\n", position, self.end)
+        if line_end < 0:
+            line_end = self.end
+        if not self.random:
+            self.position = line_end + 1 if line_end + 1 < self.end else self.start
+        return self.data[position:line_end].rstrip(b"\\r").decode()
+
+    def next_record(self):
+        if self.random:
+            position = self.start + random.randrange((self.end - self.start) // self.record.size) * self.record.size
+        else:
+            position = self.position
+            self.position += self.record.size
+            if self.position >= self.end:
+                self.position = self.start
+        return self.record.unpack_from(self.data, position)[0]
+
+""",
+)
+
+BODIES_FILE = make_template(
+    "helpers_templates/bodies_file",
+    """import random
+import string
+from uuid import uuid4
+
+from apps.helper import Helper
+
+# Generated bodies call these on every request, so they are bound once instead of looked up in random module
+randint = random.randint
+uniform = random.uniform
+choice = random.choice
+choices = random.choices
+STRING_CHARACTERS = string.ascii_letters + string.digits
+
+
+def random_string(min_length, max_length):
+    return "".join(choices(STRING_CHARACTERS, k=randint(min_length, max_length)))
+{% for function in functions %}
+
+{{ function }}{% endfor %}
+""",
+)
+
+VALIDATORS_FILE = make_template(
+    "helpers_templates/validators_file",
+    """import itertools
+import json
+
+from constants.base_constants import VALIDATION_SAMPLE
+
+MISSING = object()
+RESPONSES_COUNTER = itertools.count()
+
+
+def validate_response(response, validators):
+    \"\"\"Check response of request made with `catch_response`, validators are `{status: validator}` dicts
+
+    Status code is checked for every response, body is validated once in VALIDATION_SAMPLE responses.
+    Response is left to default handling of locust if it is valid.
+    \"\"\"
+    status_code = response.status_code
+    if not status_code:  # connection error
+        return
+    validator = validators.get(status_code, MISSING)
+    if validator is MISSING:
+        validator = validators.get(f"{status_code // 100}xx", validators.get("default", MISSING))
+    if validator is MISSING:
+        response.failure(f"Status code {status_code} is not declared")
+        return
+    if validator is None or next(RESPONSES_COUNTER) % VALIDATION_SAMPLE:
+        return
+    try:
+        body = json.loads(response.content)
+    except (TypeError, ValueError):
+        response.failure("Response body is not valid JSON")
+        return
+    if not validator(body):
+        response.failure("Response body does not match schema")
+{% for function in functions %}
+
+{{ function }}{% endfor %}
+""",
 )
@@ -1,34 +1,143 @@
 """Module: locustfile templates"""
 
-from jinja2 import Template
+from swagger2locustio.templates.environment import make_template
 
-MAIN_LOCUSTFILE = Template(
-    """from locust import HttpLocust
+# Wait time of users for every wait mode: locust wait function, wait time expression and constants it uses
+WAIT_TIME_MAPPING = {
+    "between": ("between", "between(WAIT_MIN, WAIT_MAX)", ("WAIT_MIN", "WAIT_MAX")),
+    "constant_pacing": ("constant_pacing", "constant_pacing(PACING)", ("PACING",)),
+    "constant_throughput": ("constant_pacing", "constant_pacing(1 / THROUGHPUT)", ("THROUGHPUT",)),
+    "target_rps": ("constant_pacing", "constant_pacing(USER_COUNT / TARGET_RPS)", ("TARGET_RPS", "USER_COUNT")),
+}
 
+MAIN_LOCUSTFILE = make_template(
+    "locustfile_templates/main_locustfile",
+    """{% if user_class == "fast" %}from locust import {{ wait_function }}
+from locust.contrib.fasthttp import FastHttpUser
+
+from constants.base_constants import (
+    {% for constant in wait_constants %}{{ constant }},
+    {% endfor %}FAST_HTTP_CONCURRENCY,
+    FAST_HTTP_CONNECTION_TIMEOUT,
+    FAST_HTTP_NETWORK_TIMEOUT,
+    FAST_HTTP_MAX_RETRIES,
+    FAST_HTTP_MAX_REDIRECTS,
+    FAST_HTTP_INSECURE,
+)
+from apps.{{ app_name }}.generated_taskset import GeneratedTaskSet
+
+
+class TestUser(FastHttpUser):
+    tasks = [GeneratedTaskSet]
+    wait_time = {{ wait_time }}
+    host = "{{ host }}"
+    concurrency = FAST_HTTP_CONCURRENCY
+    connection_timeout = FAST_HTTP_CONNECTION_TIMEOUT
+    network_timeout = FAST_HTTP_NETWORK_TIMEOUT
+    max_retries = FAST_HTTP_MAX_RETRIES
+    max_redirects = FAST_HTTP_MAX_REDIRECTS
+    insecure = FAST_HTTP_INSECURE
+{% else %}from locust import HttpLocust, {{ wait_function }}
+
+from constants.base_constants import {{ wait_constants | join(", ") }}
 from apps.{{ app_name }}.generated_taskset import GeneratedTaskSet
 
 
 class TestUser(HttpLocust):
     task_set = GeneratedTaskSet
-    min_wait = 5 * 1000
-    max_wait = 10 * 1000
+    wait_time = {{ wait_time }}
     host = "{{ host }}"
+{% endif %}
+""",
+)
+
+# Command line flags of locust distributed mode, they were renamed in locust 1.0
+DISTRIBUTED_FLAGS_MAPPING = {
+    "http": {"worker": "--slave", "expect_workers": "--expect-slaves", "users": "-c"},
+    "fast": {"worker": "--worker", "expect_workers": "--expect-workers", "users": "-u"},
+}
+
+LAUNCHER_FILE = make_template(
+    "locustfile_templates/launcher_file",
+    """\"\"\"Runs locust master and one locust worker per CPU core on this host
+
+Usage: python run_distributed.py [--workers N] [{{ users_flag }} USERS] [other locust options of master]
+
+Every worker gets WORKER_INDEX and WORKER_COUNT env variables, so data of workers does not collide.
+\"\"\"
+
+import os
+import sys
+import argparse
+import subprocess
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+LOCUST_COMMAND = ["locust", "-f", os.path.join(ROOT_DIR, "locustfile.py")]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="number of worker processes")
+    parser.add_argument("{{ users_flag }}", dest="users", type=int, help="number of users, it is passed to master")
+    args, master_args = parser.parse_known_args()
 
-"""
+    env = dict(os.environ, WORKER_COUNT=str(args.workers))
+    if args.users is not None:
+        master_args = ["{{ users_flag }}", str(args.users)] + master_args
+        env["LOCUST_USERS"] = str(args.users)
+    master = subprocess.Popen(
+        LOCUST_COMMAND + ["--master", "{{ expect_workers_flag }}", str(args.workers)] + master_args,
+        cwd=ROOT_DIR,
+        env=env,
+    )
+    workers = [
+        subprocess.Popen(LOCUST_COMMAND + ["{{ worker_flag }}"], cwd=ROOT_DIR, env=dict(env, WORKER_INDEX=str(index)))
+        for index in range(args.workers)
+    ]
+    try:
+        return master.wait()
+    except KeyboardInterrupt:
+        return master.wait()
+    finally:
+        for worker in workers:
+            worker.terminate()
+        for worker in workers:
+            worker.wait()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
+""",
 )
 
-BASE_TASKSET_FILE = Template(
-    """import os
+BASE_TASKSET_FILE = make_template(
+    "locustfile_templates/base_taskset_file",
+    """{% if chain_requests %}import json
+{% endif %}import os{% if chain_requests %}
+import random
+from collections import deque{% endif %}
 from base64 import b64encode
 from locust import TaskSet as LocustTaskSet
 
-from constants.base_constants import API_PREFIX
+from constants.base_constants import API_PREFIX{% if chain_requests %}, CHAIN_SIZE{% endif %}
 from apps.helper import Helper
 
 
+def generic_name(file):
+    if os.environ.get("DEBUG"):
+        return None
+    return (
+        "-".join(os.path.realpath(file).split("/")[-3:])
+        .replace("_", "-")
+        .replace(".py", "")
+    )
+
+
 class TaskSet(LocustTaskSet):
 
-    def on_start(self):
+    def on_start(self):{% if user_class == "fast" %}
+        self.headers = {}{% endif %}{% if chain_requests %}
+        self.chains = {}{% endif %}
         self.login()
 
     def on_stop(self):
@@ -39,20 +148,41 @@ class TaskSet(LocustTaskSet):
 
     def url(self, _url: str, **kwargs):
         return API_PREFIX + _url.format(**kwargs)
+{% if user_class == "fast" %}
+    def cookie_header(self, cookies: dict):
+        return "; ".join(f"{name}={value}" for name, value in cookies.items())
+{% endif %}{% if chain_requests %}
+    def chain_value(self, key, default):
+        # random value of the last CHAIN_SIZE values saved by producer
+        values = self.chains.get(key)
+        return random.choice(values) if values else default
+
+    def chain_pop(self, key, default):
+        values = self.chains.get(key)
+        return values.pop() if values else default
 
+    def save_chain_value(self, key, response, pointer):
+        if not 200 <= response.status_code < 300:
+            return
+        try:
+            value = json.loads(response.content)
+            for part in pointer:
+                value = value[int(part)] if isinstance(value, list) else value[part]
+        except (TypeError, ValueError, LookupError):
+            return
+        values = self.chains.get(key)
+        if values is None:
+            values = self.chains[key] = deque(maxlen=CHAIN_SIZE)
+        values.append(value)
+{% endif %}
     def get_generic_name(self, file):
-        if os.environ.get("DEBUG"):
-            return None
-        return (
-            "-".join(os.path.realpath(file).split("/")[-3:])
-            .replace("_", "-")
-            .replace(".py", "")
-        )
-
-"""
+        return generic_name(file)
+
+""",
 )
 
-GENERATED_TASKSET_FILE = Template(
+GENERATED_TASKSET_FILE = make_template(
+    "locustfile_templates/generated_taskset_file",
     """from apps.base import TaskSet
 from apps.helper import Helper
 {% for class_import in test_classes_imports %}{{ class_import }}
@@ -64,37 +194,75 @@ class GeneratedTaskSet(
 ):
     pass
 
-"""
+""",
 )
 
-TEST_CLASS_FILE = Template(
-    """from locust import task
+TEST_CLASS_FILE = make_template(
+    "locustfile_templates/test_class_file",
+    """{% if user_class == "fast" %}from urllib.parse import urlencode
+
+{% endif %}from locust import task
 
-from apps.base import TaskSet
+from apps.base import TaskSet, generic_name
 from apps.helper import Helper
+from constants.base_constants import API_PREFIX
 {% if constants %}from apps.{{ app_name }}.constants.{{ file_name }} import {{ constants }}{% endif %}
-
+{% if bodies %}from apps.{{ app_name }}.bodies import {{ bodies }}
+{% endif %}{% if validators %}from apps.{{ app_name }}.validators import {{ validators }}
+{% endif %}
+REQUEST_NAME = generic_name(__file__)
+{% for request_plan in request_plans %}{{ request_plan }}
+{% endfor %}
 
 class {{ class_name }}(TaskSet):
 {{ test_methods }}
-"""
+""",
 )
 
 
-FUNC = Template(
+FUNC = make_template(
+    "locustfile_templates/func",
     """
-    @task(1)
+    @task({{ weight }})
     def {{ func_name }}(self):
-        self.client.{{ method }}(
-            name=self.get_generic_name(__file__),
-            url=self.url("{{ path }}"{{ path_params }}),
+        {% if responses %}with {% elif chain_saves %}response = {% endif %}self.client.{{ method }}(
+            name=REQUEST_NAME,
+            url={{ url }},
             params={{ query_params }},
             headers={{ header_params }},
-            cookies={{ cookie_params }},
-        )
+            cookies={{ cookie_params }},{% if body %}
+            {{ body }},{% endif %}{% if responses %}
+            catch_response=True,
+        ) as response:
+            validate_response(response, {{ responses }}){% for chain_save in chain_saves %}
+            {{ chain_save }}{% endfor %}{% else %}
+        ){% for chain_save in chain_saves %}
+        {{ chain_save }}{% endfor %}{% endif %}
+
+""",
+)
+
+FAST_FUNC = make_template(
+    "locustfile_templates/fast_func",
+    """
+    @task({{ weight }})
+    def {{ func_name }}(self):
+        {% if responses %}with {% elif chain_saves %}response = {% endif %}self.client.request(
+            "{{ method.upper() }}",
+            name=REQUEST_NAME,
+            url={{ url }},
+            headers={{ headers }},{% if body %}
+            {{ body }},{% endif %}{% if responses %}
+            catch_response=True,
+        ) as response:
+            validate_response(response, {{ responses }}){% for chain_save in chain_saves %}
+            {{ chain_save }}{% endfor %}{% else %}
+        ){% for chain_save in chain_saves %}
+        {{ chain_save }}{% endfor %}{% endif %}
 
-"""
+""",
 )
 
-PATH_PARAM_PAIR = Template("{{ key }}={{ val }}")
-DICT_PARAM_PAIR = Template('"{{ key }}": {{ val }}')
+# Tiny fragments are rendered for every parameter, so they are formatted with str.format
+PATH_PARAM_PAIR = "{key}={val}"
+DICT_PARAM_PAIR = '"{key}": {val}'
@@ -0,0 +1,44 @@
+"""Module: Fixtures of unit tests"""
+
+import sys
+import types
+from typing import Callable
+
+import pytest
+
+from swagger2locustio.templates import helpers_templates
+
+BASE_CONSTANTS = {
+    "WORKER_INDEX": 0,
+    "WORKER_COUNT": 1,
+    "VALIDATION_SAMPLE": 1,
+    "FEEDER_CURSOR": "sequential",
+    "DATA_POOL_SEED": 0,
+    "DATA_POOL_SIZE": 10000,
+    "DATA_POOL_REFILL": False,
+}
+
+
+@pytest.fixture
+def generated_module(monkeypatch) -> Callable[..., types.ModuleType]:
+    """Fixture: executes generated source as module of results dir, e.g. `apps.bodies`
+
+    `apps.helper` and `constants.base_constants` are importable by it, keyword arguments override base constants.
+    """
+
+    def exec_module(name: str, source: str) -> types.ModuleType:
+        module = types.ModuleType(name)
+        package_name = name.rpartition(".")[0]
+        if package_name not in sys.modules:
+            monkeypatch.setitem(sys.modules, package_name, types.ModuleType(package_name))
+        monkeypatch.setitem(sys.modules, name, module)
+        exec(compile(source, name, "exec"), module.__dict__)  # pylint: disable=exec-used  # nosec
+        return module
+
+    def load(name: str, source: str, **constants) -> types.ModuleType:
+        base_constants = exec_module("constants.base_constants", "")
+        base_constants.__dict__.update(BASE_CONSTANTS, **constants)
+        exec_module("apps.helper", helpers_templates.HELPER_CLASS.render())
+        return exec_module(name, source)
+
+    return load
@@ -0,0 +1,205 @@
+"""Module: Tests of Base Generator"""
+
+import json
+from pathlib import Path
+from typing import Dict
+
+import pytest
+
+from swagger2locustio.generators.base_generator import BaseGenerator, GeneratorConfig
+from swagger2locustio.feeders import FeederSource
+from swagger2locustio.strategy.base_strategy import BaseStrategy
+from swagger2locustio.traffic_profile import TrafficProfile
+
+TEST_DATA_PATH = Path(__file__).parent / "test_data"
+MASK = {"operations_white_list": {"get", "post", "put", "delete"}}
+PATHS_COUNT = 40
+
+
+def make_swagger_file(tmp_path: Path) -> Path:
+    """Function: make swagger file with many paths of many test classes"""
+
+    paths = {}
+    for num in range(PATHS_COUNT):
+        item_params = [{"name": "itemId", "in": "path", "required": True, "type": "integer"}]
+        body = {"name": "body", "in": "body", "schema": {"type": "object", "properties": {"num": {"type": "integer"}}}}
+        paths[f"/group{num % 7}/items{num}"] = {
+            "get": {"parameters": [{"name": "q", "in": "query", "type": "string"}], "responses": {"200": {}}},
+            "post": {"parameters": [body], "responses": {"201": {"schema": {"type": "object"}}}},
+        }
+        paths[f"/group{num % 7}/items{num}/{{itemId}}"] = {"delete": {"parameters": item_params, "responses": {}}}
+    swagger_file = tmp_path / "swagger.json"
+    swagger_file.write_text(json.dumps({"swagger": "2.0", "host": "example.com", "paths": paths}), encoding="utf-8")
+    return swagger_file
+
+
+def generate(swagger_file: Path, results_path: Path, **config) -> BaseStrategy:
+    """Function: generate locustfiles of app, changed files are overwritten"""
+
+    strategy = BaseStrategy(
+        swagger_file, results_path, MASK, None, GeneratorConfig(app_name="app", conflict_policy="overwrite", **config)
+    )
+    strategy.process()
+    return strategy
+
+
+def read_results(results_path: Path) -> Dict[str, bytes]:
+    """Function: read generated files, they are checked to be valid python code"""
+
+    results = {}
+    for path in sorted(results_path.rglob("*.py")):
+        results[path.relative_to(results_path).as_posix()] = path.read_bytes()
+        compile(path.read_bytes(), str(path), "exec")
+    return results
+
+
+def test_get_test_class_names():
+    """Test: test classes are named by paths without params"""
+
+    assert BaseGenerator.get_test_class_names("/pets/{petId}") == (Path(), "Pets", "Pets")
+    assert BaseGenerator.get_test_class_names("/store/order-items/{id}") == (Path("store"), "Order_Items", "OrderItems")
+    assert BaseGenerator.get_test_class_names("/v1/2fa") == (Path("v1"), "Test_2Fa", "Test2Fa")
+
+
+def test_get_constant_name():
+    """Test: constants are named by params and number of test method"""
+
+    assert BaseGenerator.get_constant_name("petId", 1) == "PETID__1"
+    assert BaseGenerator.get_constant_name("X-Trace", 0) == "X_TRACE__0"
+    assert BaseGenerator.get_constant_name("2fa", 3) == "_2FA__3"
+    assert BaseGenerator.get_constant_name("", 3) == "___3"
+
+
+def test_jobs_give_the_same_results(tmp_path):
+    """Test: test classes rendered by pool of processes are the same as rendered one by one"""
+
+    swagger_file = make_swagger_file(tmp_path)
+    generate(swagger_file, tmp_path / "serial", jobs=1)
+    generate(swagger_file, tmp_path / "parallel", jobs=3)
+    serial = read_results(tmp_path / "serial")
+
+    assert len(serial) > 7
+    assert read_results(tmp_path / "parallel") == serial
+
+
+def test_unchanged_test_classes_are_not_rendered(tmp_path):
+    """Test: only test classes with changed operations are rendered again"""
+
+    swagger_file = make_swagger_file(tmp_path)
+    first = generate(swagger_file, tmp_path / "results")
+    expected = read_results(tmp_path / "results")
+    second = generate(swagger_file, tmp_path / "results")
+
+    assert first.generator.rendered_methods_count == PATHS_COUNT * 3
+    assert second.generator.rendered_methods_count == 0
+    assert not second.generator.writer.written
+    assert read_results(tmp_path / "results") == expected
+
+    swagger_data = json.loads(swagger_file.read_text(encoding="utf-8"))
+    del swagger_data["paths"]["/group0/items0"]["post"]
+    swagger_file.write_text(json.dumps(swagger_data), encoding="utf-8")
+    third = generate(swagger_file, tmp_path / "results")
+    assert third.generator.rendered_methods_count == 2  # test class of the path and of its item
+
+
+def test_kept_files_are_not_asked_about_again(tmp_path):
+    """Test: test class file kept by user is not overwritten and is not taken as unchanged generated file"""
+
+    swagger_file = TEST_DATA_PATH / "petstore_v2.yaml"
+    generate(swagger_file, tmp_path)
+    pets_file = tmp_path / "apps" / "app" / "tasksets" / "generated_tests" / "Pets.py"
+    pets_file.write_text(pets_file.read_text(encoding="utf-8") + "# mine\n", encoding="utf-8")
+
+    kept = BaseStrategy(swagger_file, tmp_path, MASK, None, GeneratorConfig(app_name="app", conflict_policy="keep"))
+    kept.process()
+    again = generate(swagger_file, tmp_path)
+
+    assert kept.generator.writer.kept == ["apps/app/tasksets/generated_tests/Pets.py"]
+    assert pets_file.read_text(encoding="utf-8").endswith("# mine\n")
+    assert not again.generator.writer.replaced
+    assert pets_file.read_text(encoding="utf-8").endswith("# mine\n")
+
+
+@pytest.mark.parametrize(
+    "config",
+    [
+        {"user_class": "http", "wait_mode": "constant_pacing", "launcher": True},
+        {"user_class": "fast", "wait_mode": "target_rps", "launcher": True},
+        {"data_pools": True},
+        {"validate_responses": True, "validation_sample": 5, "chain_requests": True},
+        {"feeders": {"petId": FeederSource(TEST_DATA_PATH / "missing.txt")}, "feeder_cursor": "random"},
+        {"traffic_profile": TrafficProfile({("get", "/pets"): 9.0, ("get", "/pets/1"): 1.0})},
+    ],
+)
+def test_options(tmp_path, config):
+    """Test: generated files are valid python code with any options"""
+
+    strategy = generate(TEST_DATA_PATH / "petstore_v2.yaml", tmp_path, **config)
+    results = read_results(tmp_path)
+
+    assert strategy.generator.operations_count == 6
+    assert "apps/app/generated_taskset.py" in results
+    assert (b"FastHttpUser" in results["locustfile.py"]) == (config.get("user_class") == "fast")
+    assert ("apps/data_pool.py" in results) == bool(config.get("data_pools"))
+    assert ("run_distributed.py" in results) == bool(config.get("launcher"))
+    assert ("apps/app/validators.py" in results) == bool(config.get("validate_responses"))
+    assert ("apps/feeder.py" in results) == bool(config.get("feeders"))
+    if config.get("launcher"):
+        assert (b'"--worker"' in results["run_distributed.py"]) == (config["user_class"] == "fast")
+
+
+def test_request_plans(tmp_path):
+    """Test: request names and urls are computed once on import of test class, path params are filled in per call"""
+
+    generate(make_swagger_file(tmp_path), tmp_path / "results")
+    test_class = tmp_path / "results" / "apps" / "app" / "tasksets" / "generated_tests" / "group0" / "Items14.py"
+    source = test_class.read_text(encoding="utf-8")
+
+    assert "REQUEST_NAME = generic_name(__file__)\n" in source
+    assert 'ITEMS14_TEST_0_URL = API_PREFIX + "/group0/items14"\n' in source
+    assert 'ITEMS14_TEST_2_URL = (API_PREFIX + "/group0/items14/{itemId}").format\n' in source
+    assert "url=ITEMS14_TEST_2_URL(itemId=" in source
+    assert "from apps.app.bodies import body_" in source
+
+
+def test_traffic_profile_weights(tmp_path):
+    """Test: task weights are derived from traffic profile, operations without traffic get 0"""
+
+    generate(
+        TEST_DATA_PATH / "petstore_v2.yaml",
+        tmp_path,
+        traffic_profile=TrafficProfile({("get", "/pets"): 3.0, ("get", "/pets/1"): 1.0}),
+    )
+    pets = (tmp_path / "apps" / "app" / "tasksets" / "generated_tests" / "Pets.py").read_text(encoding="utf-8")
+
+    assert "@task(750)" in pets
+    assert "@task(250)" in pets
+    assert "@task(0)" in pets
+
+
+@pytest.mark.parametrize(
+    "config, target_rps",
+    [
+        ({}, "10.0"),
+        ({"traffic_profile": TrafficProfile({("get", "/pets"): 3.25, ("get", "/pets/1"): 1.0})}, "4.25"),
+        ({"traffic_profile": TrafficProfile({("get", "/pets"): 3.0}), "target_rps": 50.0}, "50.0"),
+    ],
+)
+def test_target_rps(tmp_path, config, target_rps):
+    """Test: total RPS of target_rps wait mode is taken from config, traffic profile or default"""
+
+    generate(TEST_DATA_PATH / "petstore_v2.yaml", tmp_path, wait_mode="target_rps", user_count=20, **config)
+    base_constants = (tmp_path / "constants" / "base_constants.py").read_text(encoding="utf-8")
+
+    assert f"TARGET_RPS = {target_rps}\n" in base_constants
+    assert 'USER_COUNT = int(os.environ.get("LOCUST_USERS", 20))\n' in base_constants
+
+
+def test_string_data_pools(tmp_path):
+    """Test: data pools of strings are generated, no pool is left without values"""
+
+    generate(TEST_DATA_PATH / "petstore_v2.yaml", tmp_path, data_pools=True)
+    constants = (tmp_path / "apps" / "app" / "constants" / "Pets.py").read_text(encoding="utf-8")
+
+    assert 'X_TRACE__0 = DataPool("X_TRACE__0", factory=Helper.get_random_string)\n' in constants
+    assert "values=[]" not in constants
@@ -0,0 +1,96 @@
+"""Module: Tests of batch mode"""
+
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+from swagger2locustio.batch import load_manifest, process_manifest
+
+TEST_DATA_PATH = Path(__file__).parent / "test_data"
+
+
+@pytest.fixture(name="manifest_dir")
+def fixture_manifest_dir(tmp_path) -> Path:
+    """Fixture: dir with swagger files, traffic profile and feeder file of manifest"""
+
+    manifest_dir = tmp_path / "manifest"
+    (manifest_dir / "specs").mkdir(parents=True)
+    shutil.copy(TEST_DATA_PATH / "petstore_v2.yaml", manifest_dir / "specs")
+    shutil.copy(TEST_DATA_PATH / "petstore_v3.yaml", manifest_dir / "specs")
+    (manifest_dir / "specs" / "broken.yaml").write_text("swagger: '2.0'\npaths:\n  /pets: [1]\n", encoding="utf-8")
+    (manifest_dir / "profile.csv").write_text("GET,/pets,10\nGET,/pets/1,5\n", encoding="utf-8")
+    (manifest_dir / "ids.txt").write_text("1\n2\n", encoding="utf-8")
+    return manifest_dir
+
+
+def write_manifest(manifest_dir: Path, manifest) -> Path:
+    """Function: write JSON manifest"""
+
+    manifest_file = manifest_dir / "manifest.json"
+    manifest_file.write_text(json.dumps(manifest), encoding="utf-8")
+    return manifest_file
+
+
+def test_load_manifest(manifest_dir, tmp_path):
+    """Test: args of entries are added to common args, paths are relative to the manifest"""
+
+    manifest = {
+        "args": ["-o", "get", "post"],
+        "entries": [
+            {"swagger_file": "specs/petstore_v2.yaml", "app_name": "v2", "args": ["--pw", "/pets*"]},
+            {
+                "swagger_file": "specs/petstore_v3.yaml",
+                "app_name": "v3",
+                "results_path": "generated/v3",
+                "args": ["--traffic-profile", "profile.csv", "--feeder", "petId=ids.txt"],
+            },
+        ],
+    }
+    entries = load_manifest(write_manifest(manifest_dir, manifest), tmp_path / "results")
+
+    assert [entry.app_name for entry in entries] == ["v2", "v3"]
+    assert entries[0].swagger_file == manifest_dir / "specs" / "petstore_v2.yaml"
+    assert entries[0].results_path == tmp_path / "results"
+    assert entries[0].mask["operations_white_list"] == {"get", "post"}
+    assert entries[0].mask["paths_white_list"] == {"/pets*"}
+    assert entries[1].results_path == manifest_dir / "generated" / "v3"
+    assert entries[1].config.traffic_profile.total_rps == 15
+    assert entries[1].config.feeders["petId"].path == manifest_dir / "ids.txt"
+
+
+@pytest.mark.parametrize(
+    "manifest",
+    [
+        [],
+        {"entries": "specs/petstore_v2.yaml"},
+        [{"swagger_file": "specs/petstore_v2.yaml"}],
+        [{"swagger_file": "specs/petstore_v2.yaml", "app_name": "v2", "args": ["--user-class", "slow"]}],
+        [{"swagger_file": "specs/petstore_v2.yaml", "app_name": "2v"}],
+    ],
+)
+def test_invalid_manifest(manifest_dir, tmp_path, manifest):
+    """Test: invalid manifest is an error before any of entries is processed"""
+
+    with pytest.raises(ValueError):
+        load_manifest(write_manifest(manifest_dir, manifest), tmp_path)
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_process_manifest(manifest_dir, tmp_path, jobs):
+    """Test: failed entry does not stop the rest of entries, results are returned in order of entries"""
+
+    manifest = [
+        {"swagger_file": "specs/petstore_v2.yaml", "app_name": "v2", "results_path": "v2"},
+        {"swagger_file": "specs/broken.yaml", "app_name": "broken", "results_path": "v2"},
+        {"swagger_file": "specs/missing.yaml", "app_name": "missing"},
+        {"swagger_file": "specs/petstore_v3.yaml", "app_name": "v3"},
+    ]
+    results = process_manifest(load_manifest(write_manifest(manifest_dir, manifest), tmp_path), None, "keep", jobs)
+
+    assert [result.app_name for result in results] == ["v2", "broken", "missing", "v3"]
+    assert [result.error is None for result in results] == [True, False, False, True]
+    assert (manifest_dir / "v2" / "apps" / "v2" / "generated_taskset.py").exists()
+    assert not list((manifest_dir / "v2" / "apps" / "broken").rglob("*.py"))
+    assert (tmp_path / "apps" / "v3" / "generated_taskset.py").exists()
@@ -0,0 +1,141 @@
+"""Module: Tests of parsed swagger data cache"""
+
+import os
+import pickle
+
+import pytest
+
+from swagger2locustio.cache import ParsedSpecCache
+
+SWAGGER_DATA = {
+    "host": "api.example.com",
+    "security": {"basic": {"type": "basic"}},
+    "paths": {"/pets": {"get": {"params": {}}}, "/store": {"post": {"params": {}}}},
+}
+
+
+def put(cache: ParsedSpecCache, key: str) -> dict:
+    """Function: put swagger data to cache, its paths are consumed, so the entry is added"""
+
+    swagger_data = cache.put(key, SWAGGER_DATA)
+    return dict(swagger_data, paths=dict(swagger_data["paths"]))
+
+
+def test_put_and_get(tmp_path):
+    """Test: paths are written while they are consumed and read back while they are consumed"""
+
+    cache = ParsedSpecCache(tmp_path)
+    stored = put(cache, "key")
+    cached = cache.get("key")
+
+    assert stored["paths"] == SWAGGER_DATA["paths"]
+    assert cached["path_names"] == ["/pets", "/store"]
+    assert cached["host"] == SWAGGER_DATA["host"]
+    assert cached["security"] == SWAGGER_DATA["security"]
+    assert dict(cached["paths"]) == SWAGGER_DATA["paths"]
+    assert cache.get("missing") is None
+
+
+def test_streamed_paths_are_put(tmp_path):
+    """Test: iterator of paths with names of them is put as well"""
+
+    cache = ParsedSpecCache(tmp_path)
+    swagger_data = dict(SWAGGER_DATA, paths=iter(SWAGGER_DATA["paths"].items()), path_names=["/pets", "/store"])
+    list(cache.put("key", swagger_data)["paths"])
+
+    assert dict(cache.get("key")["paths"]) == SWAGGER_DATA["paths"]
+
+
+def test_refs_are_written_once(tmp_path):
+    """Test: objects resolved by $ref are written once and shared by paths which are read back"""
+
+    pet = {"type": "object", "properties": {"name": {"type": "string"}}}
+    error = {"type": "object"}
+    refs: dict = {}
+
+    def parse_paths():
+        refs["#/definitions/Pet"] = pet
+        yield "/pets", {"get": {"responses": {"200": pet}}}
+        refs["#/definitions/Error"] = error
+        yield "/store", {"get": {"responses": {"200": pet, "400": error}}, "post": {"responses": {"400": error}}}
+
+    cache = ParsedSpecCache(tmp_path)
+    swagger_data = dict(SWAGGER_DATA, paths=parse_paths(), path_names=["/pets", "/store"], refs=refs)
+    stored = dict(cache.put("key", swagger_data)["paths"])
+    cached = dict(cache.get("key")["paths"])
+
+    assert cached == stored
+    assert cached["/pets"]["get"]["responses"]["200"] is cached["/store"]["get"]["responses"]["200"]
+    assert cached["/store"]["get"]["responses"]["400"] is cached["/store"]["post"]["responses"]["400"]
+    assert (tmp_path / "key.pickle").read_bytes().count(b"properties") == 1
+
+
+def test_not_consumed_paths_are_not_put(tmp_path):
+    """Test: entry is not added if consuming of paths is not finished"""
+
+    cache = ParsedSpecCache(tmp_path)
+    paths = cache.put("key", SWAGGER_DATA)["paths"]
+    next(paths)
+    paths.close()
+
+    assert cache.get("key") is None
+    assert not list(tmp_path.iterdir())
+
+
+def test_make_key(tmp_path):
+    """Test: key depends on content of swagger file and mask"""
+
+    swagger_file = tmp_path / "swagger.json"
+    swagger_file.write_text("{}", encoding="utf-8")
+    key = ParsedSpecCache.make_key(swagger_file, {"paths_white_list": {"/b", "/a"}})
+
+    assert key == ParsedSpecCache.make_key(swagger_file, {"paths_white_list": {"/a", "/b"}})
+    assert key != ParsedSpecCache.make_key(swagger_file, {"paths_white_list": {"/a"}})
+    swagger_file.write_text("{ }", encoding="utf-8")
+    assert key != ParsedSpecCache.make_key(swagger_file, {"paths_white_list": {"/b", "/a"}})
+
+
+def test_broken_header_is_removed(tmp_path):
+    """Test: entry with broken header is removed and taken as missing"""
+
+    cache = ParsedSpecCache(tmp_path)
+    put(cache, "key")
+    cache_file = tmp_path / "key.pickle"
+    cache_file.write_bytes(b"broken")
+
+    assert cache.get("key") is None
+    assert not cache_file.exists()
+    cache_file.write_bytes(pickle.dumps(["not", "header"]))
+    assert cache.get("key") is None
+    assert not cache_file.exists()
+
+
+def test_broken_path_is_removed(tmp_path):
+    """Test: entry with broken path is removed, it is found out only while paths are consumed"""
+
+    cache = ParsedSpecCache(tmp_path)
+    put(cache, "key")
+    cache_file = tmp_path / "key.pickle"
+    cache_file.write_bytes(cache_file.read_bytes()[:-10])
+    paths = cache.get("key")["paths"]
+
+    with pytest.raises(ValueError, match="Cache entry is broken"):
+        list(paths)
+    assert not cache_file.exists()
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path):
+    """Test: least recently used entries are evicted once cache is full, the last added one is kept"""
+
+    put(ParsedSpecCache(tmp_path), "first")
+    entry_size = (tmp_path / "first.pickle").stat().st_size
+    cache = ParsedSpecCache(tmp_path, max_size=entry_size * 2)
+    put(cache, "second")
+    os.utime(tmp_path / "first.pickle", (0, 0))
+    os.utime(tmp_path / "second.pickle", (1, 1))
+    cache.get("first")  # it becomes the most recently used one
+    put(cache, "third")
+
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["first.pickle", "third.pickle"]
+    put(ParsedSpecCache(tmp_path, max_size=0), "fourth")
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["fourth.pickle"]
@@ -0,0 +1,157 @@
+"""Module: Tests of body and validator compilers, generated functions are executed"""
+
+from typing import List
+
+import pytest
+
+from swagger2locustio.generators.body_compiler import BodyCompiler
+from swagger2locustio.generators.schema_compiler import SchemaCompiler
+from swagger2locustio.generators.validator_compiler import ValidatorCompiler
+from swagger2locustio.templates import helpers_templates
+
+PET_SCHEMA = {
+    "type": "object",
+    "required": ["name", "tags"],
+    "properties": {
+        "id": {"type": "integer", "minimum": 1, "maximum": 3, "exclusiveMaximum": True, "readOnly": True},
+        "name": {"type": "string", "minLength": 3, "maxLength": 5},
+        "status": {"type": "string", "enum": ["available", "sold"]},
+        "price": {"type": "number", "exclusiveMinimum": 0.001, "maximum": 0.02},
+        "born": {"type": "string", "format": "date-time"},
+        "tags": {"type": "array", "items": {"type": "integer", "minimum": 5, "maximum": 5}, "maxItems": 2},
+        "owner": {"allOf": [{"properties": {"email": {"type": "string", "format": "email"}}}, {"required": ["email"]}]},
+        "nickname": {"type": ["string", "null"], "example": "rex"},
+    },
+}
+RUNS = 50
+
+
+def load_bodies(generated_module, compiler: BodyCompiler):
+    """Function: load bodies file with functions of compiler"""
+
+    source = helpers_templates.BODIES_FILE.render(functions=list(compiler.functions.values()))
+    return generated_module("apps.app.bodies", source)
+
+
+def load_validators(generated_module, compiler: ValidatorCompiler):
+    """Function: load validators file with functions of compiler"""
+
+    source = helpers_templates.VALIDATORS_FILE.render(functions=list(compiler.functions.values()))
+    return generated_module("apps.app.validators", source)
+
+
+def test_schema_compiler_is_abstract():
+    """Test: schema compiler is base of compilers only"""
+
+    with pytest.raises(TypeError):
+        SchemaCompiler()  # pylint: disable=abstract-class-instantiated
+
+
+def test_equal_schemas_share_function():
+    """Test: functions are named by hash of schema"""
+
+    compiler = BodyCompiler()
+    name = compiler.compile(PET_SCHEMA)
+
+    assert name.startswith("body_")
+    assert compiler.compile(dict(PET_SCHEMA)) == name
+    assert compiler.compile({"type": "string"}) != name
+    assert len(compiler.functions) == 2
+
+
+def test_bodies_conform_to_schema(generated_module):
+    """Test: generated bodies conform to schema, they are checked by generated validator as well"""
+
+    body_compiler = BodyCompiler()
+    validator_compiler = ValidatorCompiler()
+    body_name = body_compiler.compile(PET_SCHEMA)
+    validator_name = validator_compiler.compile(PET_SCHEMA)
+    make_body = getattr(load_bodies(generated_module, body_compiler), body_name)
+    validate = getattr(load_validators(generated_module, validator_compiler), validator_name)
+
+    for _ in range(RUNS):
+        body = make_body()
+        assert "id" not in body
+        assert 3 <= len(body["name"]) <= 5
+        assert body["status"] in ("available", "sold")
+        assert 0.001 < body["price"] <= 0.02
+        assert 1 <= len(body["tags"]) <= 2 and set(body["tags"]) == {5}
+        assert "@" in body["owner"]["email"]
+        assert body["nickname"] == "rex"
+        assert validate(body)
+
+
+@pytest.mark.parametrize(
+    "schema, low, high",
+    [
+        ({"type": "integer", "minimum": 1, "exclusiveMinimum": True, "maximum": 2}, 2, 2),
+        ({"type": "integer", "exclusiveMinimum": 1.5, "exclusiveMaximum": 3.5}, 3, 3),
+        ({"type": "number", "minimum": 0.011, "maximum": 0.019}, 0.011, 0.019),
+        ({"type": "number", "maximum": -5}, -1005, -5),
+    ],
+)
+def test_number_bounds(generated_module, schema, low, high):
+    """Test: generated numbers stay in inclusive and exclusive bounds"""
+
+    compiler = BodyCompiler()
+    name = compiler.compile(schema)
+    make_number = getattr(load_bodies(generated_module, compiler), name)
+
+    for _ in range(RUNS):
+        assert low <= make_number() <= high
+
+
+def test_validator(generated_module):
+    """Test: generated validator rejects values that do not conform to schema"""
+
+    compiler = ValidatorCompiler()
+    name = compiler.compile(PET_SCHEMA)
+    validate = getattr(load_validators(generated_module, compiler), name)
+    valid = {"name": "rex", "tags": [5], "owner": {"email": "a@b.c"}}
+
+    assert validate(valid)
+    assert validate(dict(valid, nickname=None))
+    assert not validate({"name": "rex"})
+    assert not validate(dict(valid, name="re"))
+    assert not validate(dict(valid, status="lost"))
+    assert not validate(dict(valid, price=0.001))
+    assert not validate(dict(valid, tags=[5, 5, 5]))
+    assert not validate(dict(valid, tags=["5"]))
+    assert not validate(dict(valid, owner={}))
+    assert not validate([valid])
+
+
+def test_validate_response(generated_module):
+    """Test: status codes are checked by validators of responses, bodies are checked by their schemas"""
+
+    class Response:  # pylint: disable=too-few-public-methods
+        """Class: Response of locust client with `catch_response`"""
+
+        def __init__(self, status_code: int, content: bytes):
+            self.status_code = status_code
+            self.content = content
+            self.failures: List[str] = []
+
+        def failure(self, message: str) -> None:
+            """Method: mark response as failed"""
+
+            self.failures.append(message)
+
+    compiler = ValidatorCompiler()
+    validators_str, names = compiler.compile_responses(
+        {200: {"schema": {"type": "array"}}, "4XX": {"description": "error"}}
+    )
+    validators = load_validators(generated_module, compiler)
+    responses = eval(validators_str, vars(validators))  # pylint: disable=eval-used  # nosec
+
+    assert validators_str == f"{{200: {names[0]}, '4xx': None}}"
+    for status_code, content, failures in [
+        (200, b"[]", []),
+        (200, b"{}", ["Response body does not match schema"]),
+        (200, b"[", ["Response body is not valid JSON"]),
+        (404, b"", []),
+        (500, b"", ["Status code 500 is not declared"]),
+    ]:
+        response = Response(status_code, content)
+        validators.validate_response(response, responses)
+        assert response.failures == failures
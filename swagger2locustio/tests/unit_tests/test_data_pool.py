@@ -0,0 +1,98 @@
+"""Module: Tests of data pools of generated constants, generated module is executed"""
+
+import random
+import sys
+
+from swagger2locustio.templates import helpers_templates
+
+
+def load_data_pool(generated_module, **constants):
+    """Function: load module of data pools, `Helper` of results dir is taken with it"""
+
+    module = generated_module("apps.data_pool", helpers_templates.DATA_POOL_FILE.render(), **constants)
+    return module.DataPool, sys.modules["apps.helper"].Helper
+
+
+def take_values(pool, count: int) -> list:
+    """Function: take next values of pool"""
+
+    return [pool.next() for _ in range(count)]
+
+
+def test_pools_are_seeded(generated_module):
+    """Test: pool of the same name has the same values whatever the global random state is, other names differ"""
+
+    data_pool, helper = load_data_pool(generated_module)
+    values = take_values(data_pool("PETID__1", helper.get_random_int, "q", size=5), 5)
+    random.seed(1)
+
+    assert take_values(data_pool("PETID__1", helper.get_random_int, "q", size=5), 5) == values
+    assert take_values(data_pool("PETID__2", helper.get_random_int, "q", size=5), 5) != values
+
+
+def test_values_are_generated_lazily_and_shared(generated_module):
+    """Test: values are generated on the first next call, pools of the same factory share them"""
+
+    data_pool, helper = load_data_pool(generated_module)
+    pools = [data_pool(f"PETID__{num}", helper.get_random_int, "q", size=5) for num in range(100)]
+    shared_values = sys.modules["apps.data_pool"].SHARED_VALUES
+
+    assert not shared_values
+    assert all(pool.values is None for pool in pools)
+    take_values(pools[0], 1)
+    take_values(pools[1], 1)
+    take_values(data_pool("NAME__0", helper.get_random_string, size=5), 1)
+    assert len(shared_values) == 2
+    assert pools[0].values is pools[1].values
+    assert pools[2].values is None
+
+
+def test_workers_have_own_values(generated_module):
+    """Test: pools of the same name have different values on every worker, worker 0 keeps values of single run"""
+
+    data_pool, helper = load_data_pool(generated_module)
+    values = take_values(data_pool("PETID__1", helper.get_random_int, "q", size=5), 5)
+    data_pool, helper = load_data_pool(generated_module, WORKER_INDEX=1, WORKER_COUNT=2)
+
+    assert take_values(data_pool("PETID__1", helper.get_random_int, "q", size=5), 5) != values
+    data_pool, helper = load_data_pool(generated_module, WORKER_INDEX=0, WORKER_COUNT=2)
+    assert take_values(data_pool("PETID__1", helper.get_random_int, "q", size=5), 5) == values
+
+
+def test_exhausted_pool(generated_module):
+    """Test: exhausted pool starts from the beginning, or it is refilled with the next values"""
+
+    data_pool, helper = load_data_pool(generated_module)
+    values = take_values(data_pool("NAME__0", helper.get_random_string, size=3), 6)
+
+    assert values[:3] == values[3:]
+    data_pool, helper = load_data_pool(generated_module, DATA_POOL_REFILL=True)
+    refilled = take_values(data_pool("NAME__0", helper.get_random_string, size=3), 6)
+    assert refilled[:3] == values[:3]
+    assert refilled[3:] != values[3:]
+
+
+def test_shared_values_are_refilled_once(generated_module):
+    """Test: the first exhausted pool refills shared values, the other pools take them when they are exhausted"""
+
+    data_pool, helper = load_data_pool(generated_module, DATA_POOL_REFILL=True)
+    first = data_pool("ID__0", helper.get_random_int, "q", size=3)
+    second = data_pool("ID__1", helper.get_random_int, "q", size=3)
+    take_values(first, 1)
+    take_values(second, 1)
+    old_values = first.values
+
+    take_values(first, 3)
+    assert first.values is not old_values
+    assert second.values is old_values
+    take_values(second, 3)
+    assert second.values is first.values
+    assert first.shared.generation == 2
+
+
+def test_pool_of_values(generated_module):
+    """Test: pool without factory cycles over its values"""
+
+    data_pool, _ = load_data_pool(generated_module)
+
+    assert take_values(data_pool("LIMIT__0", values=[20]), 2) == [20, 20]
@@ -0,0 +1,30 @@
+"""Module: Tests of templates environment"""
+
+from jinja2 import FileSystemBytecodeCache
+
+from swagger2locustio.templates.environment import ENVIRONMENT, make_bytecode_cache, make_template, set_bytecode_cache
+
+
+def test_templates_share_environment():
+    """Test: templates are registered in the shared environment and compiled once, on the first render"""
+
+    template = make_template("test_environment.j2", "{{ name }}")
+
+    assert "render" not in vars(template)
+    assert template.render(name="pets") == "pets"
+    assert template.render(name="store") == "store"
+    assert ENVIRONMENT.get_template("test_environment.j2") is ENVIRONMENT.get_template("test_environment.j2")
+
+
+def test_bytecode_cache(tmp_path, monkeypatch):
+    """Test: bytecode cache is in cache dir, it is disabled if its dir can not be created"""
+
+    monkeypatch.setattr(ENVIRONMENT, "bytecode_cache", None)
+    set_bytecode_cache(tmp_path)
+    assert isinstance(ENVIRONMENT.bytecode_cache, FileSystemBytecodeCache)
+    assert (tmp_path / "jinja").is_dir()
+    set_bytecode_cache(None)
+    assert ENVIRONMENT.bytecode_cache is None
+
+    (tmp_path / "file").write_text("", encoding="utf-8")
+    assert make_bytecode_cache(tmp_path / "file") is None
@@ -0,0 +1,86 @@
+"""Module: Tests of feeders"""
+
+import argparse
+import struct
+from pathlib import Path
+
+import pytest
+
+from swagger2locustio.feeders import FeederSource, parse_feeder
+from swagger2locustio.templates import helpers_templates
+
+LINES = [f"value-{num}" for num in range(10)]
+
+
+def load_feeder(generated_module, **constants):
+    """Function: load generated feeder file as module of worker"""
+
+    return generated_module("apps.feeder", helpers_templates.FEEDER_FILE.render(), **constants)
+
+
+def take_values(feeder, count: int) -> list:
+    """Function: take values from feeder"""
+
+    return [feeder.next() for _ in range(count)]
+
+
+def test_parse_feeder():
+    """Test: feeder argument is NAME=PATH with optional format, path is kept as is"""
+
+    assert parse_feeder("petId=ids.txt") == ("petId", FeederSource(Path("ids.txt"), "lines"))
+    assert parse_feeder("ID__1=C:/ids.bin:int64") == ("ID__1", FeederSource(Path("C:/ids.bin"), "int64"))
+    assert parse_feeder("petId=ids:txt") == ("petId", FeederSource(Path("ids:txt"), "lines"))
+    for value in ("petId", "=ids.txt", "petId="):
+        with pytest.raises(argparse.ArgumentTypeError):
+            parse_feeder(value)
+
+
+def test_lines_are_sharded(tmp_path, generated_module):
+    """Test: every worker takes its own lines, all of them are taken by workers together"""
+
+    feeder_file = tmp_path / "ids.txt"
+    feeder_file.write_text("\r\n".join(LINES) + "\r\n", encoding="utf-8")
+    shards = []
+    for worker_index in range(3):
+        feeder = load_feeder(generated_module, WORKER_INDEX=worker_index, WORKER_COUNT=3).Feeder(str(feeder_file))
+        values = take_values(feeder, len(LINES))
+        shard = list(dict.fromkeys(values))
+        assert values == (shard * len(LINES))[: len(LINES)]  # values of shard are taken in cycle
+        shards.append(shard)
+
+    assert [value for shard in shards for value in shard] == LINES
+    assert all(shards)
+
+
+def test_records_are_sharded(tmp_path, generated_module):
+    """Test: every worker takes its own binary records, all of them are taken by workers together"""
+
+    feeder_file = tmp_path / "ids.bin"
+    feeder_file.write_bytes(struct.pack("<5q", 1, 2, 3, -4, 2 ** 40))
+    shards = []
+    for worker_index in range(2):
+        module = load_feeder(generated_module, WORKER_INDEX=worker_index, WORKER_COUNT=2)
+        shards.append(take_values(module.Feeder(str(feeder_file), "int64"), 3))
+
+    assert shards == [[1, 2, 1], [3, -4, 2 ** 40]]
+
+
+def test_random_cursor(tmp_path, generated_module):
+    """Test: random values are taken from the shard of worker"""
+
+    feeder_file = tmp_path / "ids.txt"
+    feeder_file.write_text("\n".join(LINES), encoding="utf-8")
+    module = load_feeder(generated_module, WORKER_INDEX=1, WORKER_COUNT=2, FEEDER_CURSOR="random")
+
+    assert set(take_values(module.Feeder(str(feeder_file)), 50)) <= set(LINES[5:])
+
+
+def test_too_many_workers(tmp_path, generated_module):
+    """Test: worker without values of its own is an error"""
+
+    feeder_file = tmp_path / "ids.txt"
+    feeder_file.write_text("1\n", encoding="utf-8")
+    module = load_feeder(generated_module, WORKER_INDEX=1, WORKER_COUNT=2)
+
+    with pytest.raises(ValueError):
+        module.Feeder(str(feeder_file))
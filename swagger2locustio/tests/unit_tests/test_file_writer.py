@@ -0,0 +1,120 @@
+"""Module: Tests of File Writer"""
+
+import os
+
+from swagger2locustio.generators.file_writer import MANIFEST_FILE_NAME, FileWriter
+
+CONTENT = "class Pets:\n    pass\n\n\ndef get_pets():\n    pass\n"
+
+
+def read_replaced(writer: FileWriter) -> dict:
+    """Function: read previous content of replaced files from their backups"""
+
+    return {key: backup_path.read_text(encoding="utf-8") for key, backup_path in writer.replaced.items()}
+
+
+def test_unchanged_file_is_skipped(tmp_path):
+    """Test: file with the same content is not written again, its manifest entry is enough to find it out"""
+
+    writer = FileWriter(tmp_path)
+    assert writer.write(tmp_path / "apps" / "pets.py", CONTENT)
+    writer.save_manifest()
+    mtime_ns = (tmp_path / "apps" / "pets.py").stat().st_mtime_ns
+
+    writer = FileWriter(tmp_path)
+    assert not writer.write(tmp_path / "apps" / "pets.py", CONTENT)
+    assert writer.skipped == ["apps/pets.py"]
+    assert not writer.written
+    assert (tmp_path / "apps" / "pets.py").stat().st_mtime_ns == mtime_ns
+
+
+def test_unknown_file_with_the_same_content_is_skipped(tmp_path):
+    """Test: file unknown to the manifest is compared with new content"""
+
+    (tmp_path / "pets.py").write_text(CONTENT, encoding="utf-8")
+    writer = FileWriter(tmp_path)
+
+    assert not writer.write(tmp_path / "pets.py", CONTENT)
+    assert writer.files["pets.py"]["hash"] == FileWriter.get_hash(CONTENT.encode("utf-8"))
+
+
+def test_changed_file_is_replaced_atomically(tmp_path):
+    """Test: changed file is replaced through temporary file, its previous content is backed up until it is saved"""
+
+    (tmp_path / "pets.py").write_text("old\n", encoding="utf-8")
+    writer = FileWriter(tmp_path)
+
+    assert writer.write(tmp_path / "pets.py", CONTENT)
+    assert (tmp_path / "pets.py").read_text(encoding="utf-8") == CONTENT
+    assert read_replaced(writer) == {"pets.py": "old\n"}
+    assert writer.bytes_written == len(CONTENT)
+    assert not list(tmp_path.glob("*.tmp"))
+    writer.save_manifest()
+    assert sorted(path.name for path in tmp_path.iterdir()) == [MANIFEST_FILE_NAME, "pets.py"]
+
+
+def test_manifest(tmp_path):
+    """Test: manifest keeps hashes of files, their classes and functions, deleted files are dropped from it"""
+
+    writer = FileWriter(tmp_path)
+    writer.write(tmp_path / "pets.py", CONTENT)
+    writer.write(tmp_path / "store.py", "")
+    (tmp_path / "store.py").unlink()
+    writer.save_manifest()
+    files = FileWriter.load_manifest(tmp_path)
+
+    assert list(files) == ["pets.py"]
+    assert set(files["pets.py"]["classes"]) == {"class Pets"}
+    assert set(files["pets.py"]["functions"]) == {"def get_pets"}
+    (tmp_path / MANIFEST_FILE_NAME).write_text("broken", encoding="utf-8")
+    assert not FileWriter.load_manifest(tmp_path)
+
+
+def test_kept_file_is_not_replaced_again(tmp_path):
+    """Test: kept file is not replaced until its generated content is changed"""
+
+    (tmp_path / "pets.py").write_text("mine\n", encoding="utf-8")
+    writer = FileWriter(tmp_path)
+    writer.write(tmp_path / "pets.py", CONTENT)
+    writer.keep("pets.py")
+    writer.save_manifest()
+
+    assert (tmp_path / "pets.py").read_text(encoding="utf-8") == "mine\n"
+    assert writer.kept == ["pets.py"]
+    writer = FileWriter(tmp_path)
+    assert not writer.write(tmp_path / "pets.py", CONTENT)
+    assert writer.write(tmp_path / "pets.py", CONTENT + "\n")
+    assert read_replaced(writer) == {"pets.py": "mine\n"}
+
+
+def test_rollback(tmp_path):
+    """Test: replaced files are restored and new ones are removed"""
+
+    (tmp_path / "pets.py").write_text("old\n", encoding="utf-8")
+    (tmp_path / "store.py").write_text(CONTENT, encoding="utf-8")
+    writer = FileWriter(tmp_path)
+    writer.write(tmp_path / "pets.py", CONTENT)
+    writer.write(tmp_path / "store.py", CONTENT)
+    writer.write(tmp_path / "users.py", CONTENT)
+    writer.rollback()
+
+    assert (tmp_path / "pets.py").read_text(encoding="utf-8") == "old\n"
+    assert (tmp_path / "store.py").read_text(encoding="utf-8") == CONTENT
+    assert not (tmp_path / "users.py").exists()
+    assert not writer.written
+    assert not writer.replaced
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["pets.py", "store.py"]
+
+
+def test_modified_file_of_the_same_size_is_written(tmp_path):
+    """Test: file modified after the last run is compared with new content even if its size is the same"""
+
+    writer = FileWriter(tmp_path)
+    writer.write(tmp_path / "pets.py", CONTENT)
+    writer.save_manifest()
+    (tmp_path / "pets.py").write_text(CONTENT.upper(), encoding="utf-8")
+    os.utime(tmp_path / "pets.py", ns=(0, 0))
+
+    writer = FileWriter(tmp_path)
+    assert writer.write(tmp_path / "pets.py", CONTENT)
+    assert read_replaced(writer) == {"pets.py": CONTENT.upper()}
@@ -0,0 +1,137 @@
+"""Module: Tests of fingerprints of operations"""
+
+from swagger2locustio.generators import fingerprints as fingerprints_module
+from swagger2locustio.generators.fingerprints import Fingerprints, get_fingerprint
+
+OPERATIONS = [("/pets", "get", {"params": {}, "weight": None}), ("/pets", "post", {"params": {}, "weight": 5})]
+ENTRY = {"files": ["Pets.py"], "methods_count": 2, "bodies": {}, "validators": {}}
+
+
+def save_run(results_path, context="config", operations=None) -> Fingerprints:
+    """Function: save fingerprints of run with Pets test class"""
+
+    fingerprints = Fingerprints(results_path, "app", context)
+    fingerprints.fingerprint_operations("Pets", OPERATIONS if operations is None else operations)
+    fingerprints.put("Pets", ENTRY)
+    fingerprints.save()
+    return fingerprints
+
+
+def known_files(results_path) -> dict:
+    """Function: make manifest entries of existing files"""
+
+    stat = (results_path / "Pets.py").stat()
+    return {"Pets.py": {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}}
+
+
+def test_get_fingerprint():
+    """Test: fingerprint is stable and depends on data"""
+
+    assert get_fingerprint({"a": {1, 2}}) == get_fingerprint({"a": {2, 1}})
+    assert get_fingerprint([1]) != get_fingerprint([2])
+
+
+def make_operations(properties: dict) -> list:
+    """Function: make operations which share schema of the given properties"""
+
+    schema = {"type": "object", "properties": properties}
+    return [("/pets", method, {"responses": {"200": {"schema": schema}}}) for method in ("get", "put")]
+
+
+def test_shared_objects_are_fingerprinted_once(tmp_path, monkeypatch):
+    """Test: large object shared by operations is serialized once, fingerprints depend on its content only"""
+
+    properties = {f"field{num}": {"type": "string"} for num in range(100)}
+    fingerprints = Fingerprints(tmp_path, "app", "config")
+    operations = fingerprints.fingerprint_operations("Pets", make_operations(properties))
+
+    assert [id(value) for value, _ in fingerprints.memo.values()] == [id(properties)]
+    copied = Fingerprints(tmp_path, "app", "config").fingerprint_operations("Pets", make_operations(dict(properties)))
+    assert copied == operations
+    changed = Fingerprints(tmp_path, "app", "config").fingerprint_operations(
+        "Pets", make_operations(dict(properties, field0={"type": "integer"}))
+    )
+    assert changed[0][1] != operations[0][1]
+
+    monkeypatch.setattr(fingerprints_module, "MEMO_MAX_SIZE", 1)
+    other_properties = dict(properties)
+    fingerprints.fingerprint_operations("Store", make_operations(other_properties))
+    assert [id(value) for value, _ in fingerprints.memo.values()] == [id(other_properties)]
+
+
+def test_unchanged_test_class(tmp_path):
+    """Test: entry of test class is taken from the previous run if nothing is changed"""
+
+    (tmp_path / "Pets.py").write_text("class Pets:\n    pass\n", encoding="utf-8")
+    save_run(tmp_path)
+    fingerprints = Fingerprints(tmp_path, "app", "config")
+    fingerprints.fingerprint_operations("Pets", OPERATIONS)
+
+    entry = fingerprints.get_unchanged("Pets", known_files(tmp_path))
+    assert entry["files"] == ENTRY["files"]
+    assert fingerprints.get_unchanged("Pets", {}) is None
+    assert fingerprints.get_unchanged("Store", known_files(tmp_path)) is None
+
+
+def test_changed_test_class(tmp_path):
+    """Test: test class is rendered again if its operations, context or files are changed"""
+
+    (tmp_path / "Pets.py").write_text("class Pets:\n    pass\n", encoding="utf-8")
+    save_run(tmp_path)
+    files = known_files(tmp_path)
+
+    fingerprints = Fingerprints(tmp_path, "app", "config")
+    fingerprints.fingerprint_operations("Pets", OPERATIONS[:1])
+    assert fingerprints.get_unchanged("Pets", files) is None
+
+    fingerprints = Fingerprints(tmp_path, "app", "other config")
+    fingerprints.fingerprint_operations("Pets", OPERATIONS)
+    assert fingerprints.get_unchanged("Pets", files) is None
+
+    fingerprints = Fingerprints(tmp_path, "app", "config")
+    fingerprints.fingerprint_operations("Pets", OPERATIONS)
+    (tmp_path / "Pets.py").write_text("class Pets:\n    x = 1\n", encoding="utf-8")
+    assert fingerprints.get_unchanged("Pets", files) is None
+    (tmp_path / "Pets.py").unlink()
+    assert fingerprints.get_unchanged("Pets", files) is None
+
+
+def test_apps_are_kept_apart(tmp_path):
+    """Test: fingerprints of the other apps of results dir are kept"""
+
+    save_run(tmp_path)
+    other = Fingerprints(tmp_path, "other", "config")
+    other.save()
+
+    assert set(Fingerprints.load(tmp_path)) == {"app", "other"}
+    assert Fingerprints(tmp_path, "other", "config").previous == {}
+    assert set(Fingerprints(tmp_path, "app", "config").previous) == {"Pets"}
+
+
+def test_dropped_files(tmp_path):
+    """Test: entries of test classes with dropped files are not saved"""
+
+    fingerprints = Fingerprints(tmp_path, "app", "config")
+    fingerprints.fingerprint_operations("Pets", OPERATIONS)
+    fingerprints.put("Pets", ENTRY)
+    fingerprints.fingerprint_operations("Store", [])
+    fingerprints.put("Store", dict(ENTRY, files=["Store.py"]))
+    fingerprints.drop_files(["Pets.py"])
+    fingerprints.save()
+
+    assert set(Fingerprints(tmp_path, "app", "config").previous) == {"Store"}
+
+
+def test_log_changes(tmp_path, caplog):
+    """Test: added, removed and modified operations are counted"""
+
+    save_run(tmp_path)
+    fingerprints = Fingerprints(tmp_path, "app", "config")
+    fingerprints.fingerprint_operations("Pets", [OPERATIONS[0], ("/pets", "post", {"params": {}, "weight": 1})])
+    fingerprints.put("Pets", ENTRY)
+    fingerprints.fingerprint_operations("Store", [("/store", "get", {})])
+    fingerprints.put("Store", ENTRY)
+    caplog.set_level("INFO")
+    fingerprints.log_changes()
+
+    assert "Operations since the previous run: 1 added, 0 removed, 1 modified" in caplog.text
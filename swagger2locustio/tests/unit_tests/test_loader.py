@@ -0,0 +1,41 @@
+"""Module: Tests of swagger file loader"""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from swagger2locustio.loader import SPEC_SECTIONS, load_swagger_file
+
+TEST_DATA_PATH = Path(__file__).parent / "test_data"
+
+
+def test_yaml_and_json_are_the_same(tmp_path):
+    """Test: the same swagger file is loaded from YAML and JSON"""
+
+    swagger_data, stats = load_swagger_file(TEST_DATA_PATH / "petstore_v2.yaml", sections=None)
+    json_file = tmp_path / "petstore.json"
+    json_file.write_text(json.dumps(swagger_data), encoding="utf-8")
+
+    assert stats.file_size == (TEST_DATA_PATH / "petstore_v2.yaml").stat().st_size
+    assert load_swagger_file(json_file, sections=None)[0] == swagger_data
+
+
+@pytest.mark.parametrize("file_name", ["petstore_v2.yaml", "petstore_v3.yaml", "swagger_file.json"])
+def test_sections(file_name):
+    """Test: only sections used by parsers are loaded by default"""
+
+    swagger_data, _ = load_swagger_file(TEST_DATA_PATH / file_name)
+    all_sections, _ = load_swagger_file(TEST_DATA_PATH / file_name, sections=None)
+
+    assert "info" in all_sections
+    assert "info" not in swagger_data
+    assert swagger_data == {key: value for key, value in all_sections.items() if key in SPEC_SECTIONS}
+    assert load_swagger_file(TEST_DATA_PATH / file_name, sections=["paths"])[0] == {"paths": all_sections["paths"]}
+
+
+def test_incorrect_format(tmp_path):
+    """Test: only JSON and YAML files are loaded"""
+
+    with pytest.raises(ValueError):
+        load_swagger_file(tmp_path / "swagger.txt")
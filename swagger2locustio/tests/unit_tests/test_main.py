@@ -0,0 +1,87 @@
+"""Module: Tests of command line"""
+
+import json
+import sys
+from pathlib import Path
+
+import coloredlogs
+import pytest
+
+from swagger2locustio.__main__ import main, make_cache, make_config, make_mask, parse_args
+from swagger2locustio.templates.environment import ENVIRONMENT
+
+TEST_DATA_PATH = Path(__file__).parent / "test_data"
+
+
+def test_make_mask():
+    """Test: mask is made from white and black lists of arguments"""
+
+    args = parse_args(["-f", "swagger.yaml", "-o", "get", "post", "--pw", "/pets*", "--tb", "admin", "--oiw", "getPet"])
+    mask = make_mask(args)
+
+    assert mask["operations_white_list"] == {"get", "post"}
+    assert mask["paths_white_list"] == {"/pets*"}
+    assert mask["tags_black_list"] == {"admin"}
+    assert mask["operation_ids_white_list"] == {"getPet"}
+    with pytest.raises(ValueError):
+        make_mask(parse_args(["-f", "swagger.yaml", "--pw", "/pets", "--pb", "/store"]))
+    with pytest.raises(ValueError):
+        make_mask(parse_args(["-f", "swagger.yaml", "--tw", "pets", "--tb", "store"]))
+
+
+def test_profile_capture_requires_profile(capsys):
+    """Test: capture of profile without report path is rejected as usage error"""
+
+    assert parse_args(["-f", "swagger.yaml", "--profile", "p.json", "--profile-capture"]).profile_capture
+    with pytest.raises(SystemExit):
+        parse_args(["-f", "swagger.yaml", "--profile-capture"])
+    assert "--profile-capture requires --profile report path" in capsys.readouterr().err
+
+
+def test_make_config(tmp_path, monkeypatch):
+    """Test: config is made from arguments, relative feeder paths are resolved against current dir"""
+
+    monkeypatch.chdir(tmp_path)
+    args = parse_args(["-f", "swagger.yaml", "--user-class", "fast", "--feeder", "petId=ids.txt:int32", "-j", "2"])
+    config = make_config(args)
+
+    assert config.user_class == "fast"
+    assert config.jobs == 2
+    assert config.conflict_policy == "prompt"
+    assert config.feeders["petId"].path == tmp_path.resolve() / "ids.txt"
+    assert config.feeders["petId"].file_format == "int32"
+    with pytest.raises(ValueError):
+        make_config(parse_args(["-f", "swagger.yaml", "--validation-sample", "0"]))
+    with pytest.raises(ValueError):
+        make_config(parse_args(["-f", "swagger.yaml", "--app-name", "my-app"]))
+
+
+def test_make_cache(tmp_path):
+    """Test: caches of parsed swagger files and compiled templates are in the same cache dir"""
+
+    cache = make_cache(parse_args(["-f", "swagger.yaml", "--cache-dir", str(tmp_path), "--cache-size", "1"]))
+
+    assert cache.cache_dir == tmp_path
+    assert cache.max_size == 2 ** 20
+    assert (tmp_path / "jinja").is_dir()
+    assert make_cache(parse_args(["-f", "swagger.yaml", "--no-cache"])) is None
+    assert ENVIRONMENT.bytecode_cache is None
+
+
+def test_main(tmp_path, monkeypatch):
+    """Test: command generates locustfiles and writes profile report"""
+
+    results_path = tmp_path / "results"
+    argv = ["swagger2locustio", "-f", str(TEST_DATA_PATH / "petstore_v3.yaml"), "-r", str(results_path)]
+    argv += ["--app-name", "pets", "--no-cache", "--conflict-policy", "overwrite"]
+    argv += ["--profile", str(tmp_path / "p.json")]
+    monkeypatch.setattr(sys, "argv", argv)
+    # root logger of the other tests is not changed
+    monkeypatch.setattr(coloredlogs, "install", lambda **kwargs: None)
+    main()
+    report = json.loads((tmp_path / "p.json").read_text(encoding="utf-8"))
+
+    assert (results_path / "locustfile.py").exists()
+    assert (results_path / "apps" / "pets" / "generated_taskset.py").exists()
+    assert report["counters"]["operations_parsed"] == 2
+    assert {"load", "parse", "generate", "write_files", "log_result", "log_diff"} <= set(report["stages"])
@@ -0,0 +1,97 @@
+"""Module: Tests of Mask Matcher"""
+
+import pytest
+
+from swagger2locustio.parsers.mask_matcher import MaskMatcher, PatternSet
+
+
+def make_matcher(**mask) -> MaskMatcher:
+    """Function: make matcher of GET and POST operations with lists of mask"""
+
+    return MaskMatcher(dict({"operations_white_list": {"get", "POST"}}, **mask))
+
+
+def test_literals_are_case_insensitive():
+    """Test: literal values are matched as whole values regardless of case"""
+
+    patterns = PatternSet(["/Pets", "Store"])
+
+    assert patterns.match("/pets")
+    assert patterns.match("STORE")
+    assert not patterns.match("/pets/{petId}")
+    assert not PatternSet([])
+    assert not PatternSet([]).match("/pets")
+
+
+def test_globs_match_whole_values():
+    """Test: globs are matched against the whole value"""
+
+    patterns = PatternSet(["/pets*", "/store/?rders", "/users/[ab]"])
+
+    assert patterns.match("/PETS/{petId}")
+    assert patterns.match("/store/orders")
+    assert patterns.match("/users/b")
+    assert not patterns.match("/v1/pets")
+    assert not patterns.match("/users/c")
+
+
+def test_regexes_are_full_matched():
+    """Test: `re:` prefixed regular expressions are matched against the whole value, case insensitive"""
+
+    patterns = PatternSet([r"re:/pets/\{\w+\}", "re:/store.*"])
+
+    assert patterns.match("/pets/{petId}")
+    assert patterns.match("/STORE/orders")
+    assert not patterns.match("/pets")
+    assert not patterns.match("/v1/store")
+
+
+@pytest.mark.parametrize("pattern", ["re:(", "re:[a-"])
+def test_invalid_regex(pattern):
+    """Test: invalid regular expression is reported with the pattern"""
+
+    with pytest.raises(ValueError, match="Invalid regular expression"):
+        PatternSet([pattern])
+
+
+def test_paths_white_and_black_lists():
+    """Test: path is used if it is white listed and is not black listed"""
+
+    matcher = make_matcher(paths_white_list={"/pets*"}, paths_black_list={"re:.*/admin.*"})
+
+    assert matcher.match_path("/pets")
+    assert not matcher.match_path("/pets/admin")
+    assert not matcher.match_path("/store")
+    assert make_matcher().match_path("/anything")
+    assert not make_matcher(paths_black_list={"/store"}).match_path("/Store")
+
+
+def test_operations_are_case_insensitive():
+    """Test: methods of operations are matched regardless of case"""
+
+    matcher = make_matcher()
+
+    assert matcher.match_operation("GET", {})
+    assert matcher.match_operation("post", {})
+    assert not matcher.match_operation("delete", {})
+    assert not matcher.match_operation("parameters", {})
+
+
+def test_tags_and_operation_ids():
+    """Test: operation is used if any of its tags is white listed, none is black listed and its id is allowed"""
+
+    matcher = make_matcher(
+        tags_white_list={"pets", "store*"},
+        tags_black_list={"Admin"},
+        operation_ids_black_list={"re:delete.*"},
+    )
+
+    assert matcher.match_operation("get", {"tags": ["Pets"], "operationId": "listPets"})
+    assert matcher.match_operation("get", {"tags": ["storefront"]})
+    assert not matcher.match_operation("get", {"tags": ["pets", "admin"]})
+    assert not matcher.match_operation("get", {"tags": ["users"]})
+    assert not matcher.match_operation("get", {})
+    assert not matcher.match_operation("post", {"tags": ["pets"], "operationId": "deletePets"})
+    assert matcher.tags_results[("pets", "admin")] is False
+    assert make_matcher(operation_ids_white_list={"getPet"}).match_operation("get", {"operationId": "GETPET"})
+    assert not make_matcher(operation_ids_white_list={"getPet"}).match_operation("get", {})
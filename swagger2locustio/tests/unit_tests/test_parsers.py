@@ -0,0 +1,128 @@
+"""Module: Tests of swagger parsers"""
+
+from pathlib import Path
+
+import pytest
+
+from swagger2locustio.loader import load_swagger_file
+from swagger2locustio.parsers.mask_matcher import MaskMatcher
+from swagger2locustio.parsers.swagger_v2 import SwaggerV2Parser
+from swagger2locustio.parsers.swagger_v3 import SwaggerV3Parser
+from swagger2locustio.strategy.base_strategy import BaseStrategy
+
+TEST_DATA_PATH = Path(__file__).parent / "test_data"
+MASK = MaskMatcher({"operations_white_list": {"get", "post", "delete"}})
+
+
+def parse(file_name: str, stream: bool = False) -> dict:
+    """Function: parse swagger file of test data"""
+
+    file_content, _ = load_swagger_file(TEST_DATA_PATH / file_name)
+    return BaseStrategy.get_specific_version_parser(file_content).parse_swagger_file(file_content, MASK, stream)
+
+
+def test_parser_version():
+    """Test: parser is chosen by version of swagger file"""
+
+    assert isinstance(BaseStrategy.get_specific_version_parser({"swagger": "2.0"}), SwaggerV2Parser)
+    assert isinstance(BaseStrategy.get_specific_version_parser({"openapi": "3.0.1"}), SwaggerV3Parser)
+    with pytest.raises(ValueError):
+        BaseStrategy.get_specific_version_parser({"openapi": "4.0"})
+    with pytest.raises(ValueError):
+        BaseStrategy.get_specific_version_parser({})
+
+
+def test_v2_paths():
+    """Test: operations of swagger 2 file with path level params and refs"""
+
+    swagger_data = parse("petstore_v2.yaml")
+    paths = swagger_data["paths"]
+
+    assert swagger_data["host"] == "petstore.example.com"
+    assert set(swagger_data["security"]) == {"apiKey", "basic"}
+    assert list(paths) == ["/pets", "/pets/{petId}", "/store/orders/{orderId}", "/store/orders"]
+    assert set(paths["/pets"]) == {"get", "post"}
+    assert paths["/pets"]["get"]["operation_id"] == "listPets"
+    assert paths["/pets"]["get"]["weight"] == 10
+    assert paths["/pets"]["get"]["params"]["limit"].default == 20
+    assert paths["/pets"]["get"]["params"]["X-Trace"].location == "header"
+    assert paths["/pets"]["post"]["params"]["body"].raw["schema"]["required"] == ["name"]
+    assert set(paths["/pets/{petId}"]["delete"]["params"]) == {"petId", "session"}
+    assert paths["/pets/{petId}"]["get"]["responses"]["404"]["schema"]["properties"]["code"] == {"type": "integer"}
+
+
+def test_params_are_interned():
+    """Test: equal params of different operations are the same object"""
+
+    paths = parse("petstore_v2.yaml")["paths"]
+
+    assert paths["/pets/{petId}"]["get"]["params"]["petId"] is paths["/pets/{petId}"]["delete"]["params"]["petId"]
+    parser = SwaggerV2Parser()
+    raw = {"name": "id", "in": "query", "type": "integer"}
+    param = parser.make_param(raw, "integer", None)
+    assert parser.make_param(dict(raw), "integer", None) is param
+    assert parser.make_param(dict(raw, minimum=1), "integer", None) is not param
+    assert parser.make_param(raw, "integer", 1) is not param
+
+
+def test_v3_servers_and_security():
+    """Test: host is taken from the first server with defaults of its variables"""
+
+    swagger_data = parse("petstore_v3.yaml")
+
+    assert swagger_data["host"] == "https://api.example.com/v1"
+    assert set(swagger_data["security"]) == {"basic", "apiKey"}
+    assert SwaggerV3Parser.parse_host_data({"servers": [{"url": "http://{host}:{port}", "variables": {}}]}) == (
+        "http://{host}:{port}"
+    )
+    assert SwaggerV3Parser.parse_host_data({}) == ""
+
+
+def test_v3_request_body_and_path_params():
+    """Test: request body is parsed as body param, path level params are added to operations"""
+
+    paths = parse("petstore_v3.yaml")["paths"]
+    body = paths["/pets"]["post"]["params"]["body"]
+
+    assert body.location == "body"
+    assert body.raw["required"] is True
+    assert body.raw["mediaType"] == "application/json"
+    assert body.raw["schema"]["properties"]["parent"] == {"$ref": "#/components/schemas/Pet"}
+    assert paths["/pets"]["get"]["params"]["limit"].value_type == "integer"
+    assert paths["/pets"]["get"]["params"]["limit"].default == 20
+    assert paths["/pets/{petId}"]["get"]["params"]["petId"].location == "path"
+
+
+def test_v3_request_body_media_type():
+    """Test: JSON media type of request body is preferred, the first one is taken otherwise"""
+
+    parser = SwaggerV3Parser()
+    form_body = {"content": {"multipart/form-data": {"schema": {"type": "object"}}}}
+    json_body = {"content": {"text/plain": {}, "application/vnd.api+json": {"schema": {"type": "string"}}}}
+
+    def get_params(request_body: dict) -> dict:
+        return parser.parse_method_data({"requestBody": request_body}, {})["params"]
+
+    assert get_params(form_body)["body"].raw["mediaType"] == "multipart/form-data"
+    assert get_params(json_body)["body"].raw["schema"] == {"type": "string"}
+    assert not get_params({"content": {}})
+    assert not parser.parse_method_data({}, {})["params"]
+
+
+def test_streamed_paths():
+    """Test: streamed paths are parsed while they are consumed, names of them are listed in advance"""
+
+    swagger_data = parse("petstore_v2.yaml", stream=True)
+
+    assert swagger_data["path_names"] == list(parse("petstore_v2.yaml")["paths"])
+    assert [path for path, _ in swagger_data["paths"]] == swagger_data["path_names"]
+
+
+def test_required_param_without_name():
+    """Test: required param without name or location is an error"""
+
+    parser = SwaggerV2Parser()
+
+    with pytest.raises(ValueError):
+        parser.parse_method_data({"parameters": [{"in": "query", "required": True}]}, {})
+    assert not parser.parse_method_data({"parameters": [{"in": "query"}]}, {})["params"]
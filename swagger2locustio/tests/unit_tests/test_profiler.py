@@ -0,0 +1,60 @@
+"""Module: Tests of Profiler"""
+
+import json
+import time
+
+from swagger2locustio.profiler import Profiler
+
+PAUSE = 0.01
+
+
+def test_nested_stages_are_excluded():
+    """Test: time of nested stage is not counted in its outer stage"""
+
+    profiler = Profiler()
+    with profiler.stage("outer"):
+        with profiler.stage("inner"):
+            time.sleep(PAUSE * 4)
+        time.sleep(PAUSE)
+    with profiler.stage("inner"):
+        time.sleep(PAUSE)
+
+    assert profiler.stages["inner"] >= PAUSE * 5
+    assert PAUSE <= profiler.stages["outer"] < PAUSE * 4
+
+
+def test_iterate():
+    """Test: taking of items of lazy iterable is timed as stage"""
+
+    def slow_items():
+        for item in range(3):
+            time.sleep(PAUSE)
+            yield item
+
+    profiler = Profiler()
+    with profiler.stage("consume"):
+        items = list(profiler.iterate("produce", slow_items()))
+
+    assert items == [0, 1, 2]
+    assert profiler.stages["produce"] >= PAUSE * 3
+    assert profiler.stages["consume"] < profiler.stages["produce"]
+
+
+def test_report(tmp_path):
+    """Test: report with stages and counters is saved, cProfile stats are saved next to it with capture"""
+
+    profiler = Profiler(capture=True)
+    profiler.start()
+    with profiler.stage("parse"):
+        profiler.count("operations_parsed", 2)
+        profiler.count("operations_parsed")
+    profiler.stop()
+    profiler.save(tmp_path / "report.json")
+    report = json.loads((tmp_path / "report.json").read_text(encoding="utf-8"))
+
+    assert set(report["stages"]) == {"parse"}
+    assert report["counters"] == {"operations_parsed": 3}
+    assert report["total_seconds"] >= report["stages"]["parse"]
+    assert "top_allocations" in report
+    assert (tmp_path / "report.prof").exists()
+    assert "top_allocations" not in Profiler().report()
@@ -0,0 +1,69 @@
+"""Module: Tests of Ref Resolver"""
+
+from swagger2locustio.parsers.ref_resolver import RefResolver
+
+FILE_CONTENT = {
+    "definitions": {
+        "Tag": {"type": "object", "properties": {"name": {"type": "string"}}},
+        "Pet": {
+            "type": "object",
+            "properties": {
+                "tags": {"type": "array", "items": {"$ref": "#/definitions/Tag"}},
+                "parent": {"$ref": "#/definitions/Pet"},
+            },
+        },
+        "a/b~c": {"type": "integer"},
+    },
+    "components": {"schemas": {"Node": {"properties": {"next": {"$ref": "#/components/schemas/Node"}}}}},
+    "paths": {"/pets": {"get": {"responses": {"200": {"schema": {"$ref": "#/definitions/Pet"}}}}}},
+}
+
+
+def test_shared_ref_is_resolved_once():
+    """Test: equal references are resolved into the same object"""
+
+    resolver = RefResolver(FILE_CONTENT)
+    first = resolver.resolve({"schema": {"$ref": "#/definitions/Tag"}})
+    second = resolver.resolve([{"$ref": "#/definitions/Tag"}])
+
+    assert first["schema"] is second[0]
+    assert first["schema"] == FILE_CONTENT["definitions"]["Tag"]
+
+
+def test_node_without_refs_is_not_copied():
+    """Test: node without references is returned as is"""
+
+    resolver = RefResolver(FILE_CONTENT)
+    node = FILE_CONTENT["definitions"]["Tag"]
+
+    assert resolver.resolve(node) is node
+
+
+def test_circular_ref_is_left_unresolved():
+    """Test: reference to the schema being resolved is left as is"""
+
+    resolver = RefResolver(FILE_CONTENT)
+    pet = resolver.resolve_ref("#/definitions/Pet")
+    node = resolver.resolve_ref("#/components/schemas/Node")
+
+    assert pet["properties"]["parent"] == {"$ref": "#/definitions/Pet"}
+    assert pet["properties"]["tags"]["items"] == FILE_CONTENT["definitions"]["Tag"]
+    assert node["properties"]["next"] == {"$ref": "#/components/schemas/Node"}
+
+
+def test_escaped_and_nested_refs():
+    """Test: escaped names of reusable objects and refs to any node of the file are resolved"""
+
+    resolver = RefResolver(FILE_CONTENT)
+
+    assert resolver.resolve_ref("#/definitions/a~1b~0c") == {"type": "integer"}
+    assert resolver.resolve_ref("#/paths/~1pets/get/responses/200/schema") is resolver.resolve_ref("#/definitions/Pet")
+
+
+def test_unresolvable_refs_are_kept():
+    """Test: missing and remote references are left as is"""
+
+    resolver = RefResolver(FILE_CONTENT)
+
+    assert resolver.resolve({"$ref": "#/definitions/Missing"}) == {"$ref": "#/definitions/Missing"}
+    assert resolver.resolve({"$ref": "other.yaml#/Pet"}) == {"$ref": "other.yaml#/Pet"}
@@ -0,0 +1,50 @@
+"""Module: Tests of request chains"""
+
+from pathlib import Path
+
+from swagger2locustio.generators.request_chains import ChainLink, apply_request_chains, find_links
+from swagger2locustio.loader import load_swagger_file
+from swagger2locustio.parsers.mask_matcher import MaskMatcher
+from swagger2locustio.strategy.base_strategy import BaseStrategy
+
+TEST_DATA_PATH = Path(__file__).parent / "test_data"
+MASK = MaskMatcher({"operations_white_list": {"get", "post"}})
+
+
+def parse_paths(file_name: str) -> dict:
+    """Function: parse paths of swagger file of test data"""
+
+    file_content, _ = load_swagger_file(TEST_DATA_PATH / file_name)
+    return BaseStrategy.get_specific_version_parser(file_content).parse_swagger_file(file_content, MASK)["paths"]
+
+
+def test_declared_links():
+    """Test: OpenAPI links of responses are found"""
+
+    assert find_links(parse_paths("petstore_v3.yaml")) == [
+        ChainLink(producer=("/pets", "post"), consumer=("/pets/{petId}", "get"), param="petId", pointer=("id",))
+    ]
+
+
+def test_named_links():
+    """Test: path params are taken from `id` of responses of operations that create collection items"""
+
+    links = find_links(parse_paths("petstore_v2.yaml"))
+
+    assert [(link.producer, link.consumer, link.param) for link in links] == [
+        (("/pets", "post"), ("/pets/{petId}", "get"), "petId"),
+        (("/store/orders", "post"), ("/store/orders/{orderId}", "get"), "orderId"),
+    ]
+    assert links[0].key == "POST /pets#/id"
+
+
+def test_apply_request_chains():
+    """Test: producers and consumers are marked, method data of the rest is not copied"""
+
+    paths_data = parse_paths("petstore_v2.yaml")
+    chained = apply_request_chains(paths_data)
+
+    assert chained["/pets"]["post"]["chain_producers"] == [("POST /pets#/id", ("id",))]
+    assert chained["/pets/{petId}"]["get"]["chain_consumers"] == {"petId": "POST /pets#/id"}
+    assert chained["/pets"]["get"] is paths_data["/pets"]["get"]
+    assert "chain_producers" not in paths_data["/pets"]["post"]
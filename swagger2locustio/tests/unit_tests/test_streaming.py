@@ -0,0 +1,91 @@
+"""Module: Tests of streaming of parsed paths"""
+
+from pathlib import Path
+from typing import Dict, Optional
+
+import pytest
+import yaml
+
+from swagger2locustio.cache import ParsedSpecCache
+from swagger2locustio.loader import load_swagger_file
+from swagger2locustio.parsers.mask_matcher import MaskMatcher
+from swagger2locustio.strategy.base_strategy import BaseStrategy
+from swagger2locustio.generators.base_generator import BaseGenerator, GeneratorConfig
+
+TEST_DATA_PATH = Path(__file__).parent / "test_data"
+SWAGGER_FILE = TEST_DATA_PATH / "petstore_v2.yaml"
+MASK = {"operations_white_list": {"get", "post", "delete"}}
+
+
+def make_config() -> GeneratorConfig:
+    """Function: make config of generator, which renders bodies and validators as well"""
+
+    return GeneratorConfig(app_name="pets", validate_responses=True, conflict_policy="overwrite")
+
+
+def read_results(results_path: Path) -> Dict[str, str]:
+    """Function: read generated files, manifest and fingerprints are not compared as they keep mtime of files"""
+
+    return {
+        path.relative_to(results_path).as_posix(): path.read_text(encoding="utf-8")
+        for path in sorted(results_path.rglob("*.py"))
+    }
+
+
+def generate_not_streamed(results_path: Path) -> Dict[str, str]:
+    """Function: generate locustfiles from all the paths parsed in advance"""
+
+    file_content, _ = load_swagger_file(SWAGGER_FILE)
+    parser = BaseStrategy.get_specific_version_parser(file_content)
+    swagger_data = parser.parse_swagger_file(file_content, MaskMatcher(MASK), stream=False)
+    assert isinstance(swagger_data["paths"], dict)
+    generator = BaseGenerator(results_path, make_config())
+    generator.generate_locustfiles(swagger_data)
+    return read_results(results_path)
+
+
+def generate_streamed(results_path: Path, cache: Optional[ParsedSpecCache] = None) -> Dict[str, str]:
+    """Function: generate locustfiles as the command does, paths are parsed or read from cache while consumed"""
+
+    BaseStrategy(SWAGGER_FILE, results_path, MASK, cache, make_config()).process()
+    return read_results(results_path)
+
+
+def test_streamed_results_are_the_same(tmp_path):
+    """Test: paths parsed while they are consumed give the same files as paths parsed in advance"""
+
+    expected = generate_not_streamed(tmp_path / "not_streamed")
+
+    assert expected
+    assert generate_streamed(tmp_path / "streamed") == expected
+
+
+def test_cached_results_are_the_same(tmp_path):
+    """Test: paths written to cache and read from it while they are consumed give the same files"""
+
+    expected = generate_not_streamed(tmp_path / "not_streamed")
+    cache = ParsedSpecCache(tmp_path / "cache")
+
+    assert generate_streamed(tmp_path / "cache_miss", cache) == expected
+    assert len(list((tmp_path / "cache").glob("*.pickle"))) == 1
+    assert generate_streamed(tmp_path / "cache_hit", cache) == expected
+
+
+def test_failed_run_is_rolled_back(tmp_path):
+    """Test: files written before broken path is parsed are restored, its cache entry is not added"""
+
+    results_path = tmp_path / "results"
+    expected = generate_streamed(results_path)
+    swagger_data = yaml.safe_load(SWAGGER_FILE.read_text(encoding="utf-8"))
+    swagger_data["parameters"]["limit"]["default"] = 50
+    swagger_data["paths"]["/stores"] = {"get": {"responses": {"200": {"description": "ok"}}}}
+    swagger_data["paths"]["/broken"] = {"get": {"parameters": [{"required": True}], "responses": {}}}
+    broken_file = tmp_path / "broken.yaml"
+    broken_file.write_text(yaml.safe_dump(swagger_data, sort_keys=False), encoding="utf-8")
+    cache = ParsedSpecCache(tmp_path / "cache")
+
+    with pytest.raises(ValueError):
+        BaseStrategy(broken_file, results_path, MASK, cache, make_config()).process()
+
+    assert read_results(results_path) == expected
+    assert not list((tmp_path / "cache").glob("*"))
@@ -0,0 +1,79 @@
+"""Module: Tests of traffic profile"""
+
+import json
+
+import pytest
+
+from swagger2locustio.traffic_profile import WEIGHTS_TOTAL, TrafficProfile, scale_weights
+
+OPERATIONS = [("/pets", "get"), ("/pets/{petId}", "get"), ("/pets/{petId}", "delete"), ("/pets/mine", "get")]
+
+
+def test_load_csv(tmp_path):
+    """Test: rows of csv file are summed up by method and path without query"""
+
+    profile_file = tmp_path / "profile.csv"
+    profile_file.write_text(
+        "method,path,rps\nGET,/pets?limit=1,2\nget,/pets,3\n\nDELETE,/pets/1,0.5\n", encoding="utf-8"
+    )
+    profile = TrafficProfile.load(profile_file)
+
+    assert profile.rps == {("get", "/pets"): 5.0, ("delete", "/pets/1"): 0.5}
+    assert profile.total_rps == 5.5
+
+
+def test_load_json(tmp_path):
+    """Test: json file is either mapping of `METHOD path` keys or list of rows"""
+
+    mapping_file = tmp_path / "mapping.json"
+    mapping_file.write_text(json.dumps({"GET /pets": 1, "POST /pets": 2}), encoding="utf-8")
+    rows_file = tmp_path / "rows.json"
+    rows_file.write_text(json.dumps([{"method": "get", "path": "/pets", "rps": 1}]), encoding="utf-8")
+
+    assert TrafficProfile.load(mapping_file).rps == {("get", "/pets"): 1.0, ("post", "/pets"): 2.0}
+    assert TrafficProfile.load(rows_file).rps == {("get", "/pets"): 1.0}
+
+
+@pytest.mark.parametrize("file_name, content", [("profile.txt", ""), ("profile.csv", "GET,/pets,many\n")])
+def test_load_errors(tmp_path, file_name, content):
+    """Test: unknown format and incorrect rows are errors"""
+
+    profile_file = tmp_path / file_name
+    profile_file.write_text(content, encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        TrafficProfile.load(profile_file)
+
+
+def test_match():
+    """Test: concrete paths are matched to the most specific path templates"""
+
+    profile = TrafficProfile(
+        {
+            ("get", "/pets"): 10.0,
+            ("get", "/pets/1"): 2.0,
+            ("get", "/pets/2"): 3.0,
+            ("get", "/pets/mine"): 1.0,
+            ("get", "/pets/{petId}"): 1.0,
+            ("delete", "/pets/{id}"): 4.0,
+            ("post", "/pets"): 1.0,
+            ("get", "/users"): 1.0,
+        }
+    )
+
+    assert profile.match(OPERATIONS) == {
+        ("/pets", "get"): 10.0,
+        ("/pets/{petId}", "get"): 6.0,
+        ("/pets/mine", "get"): 1.0,
+        ("/pets/{petId}", "delete"): 4.0,
+    }
+
+
+def test_scale_weights():
+    """Test: RPS are scaled to integer weights, operations with any traffic get at least 1"""
+
+    weights = scale_weights({("/pets", "get"): 999.0, ("/pets", "post"): 0.01, ("/store", "get"): 0.0})
+
+    assert weights == {("/pets", "get"): WEIGHTS_TOTAL, ("/pets", "post"): 1, ("/store", "get"): 0}
+    assert scale_weights({("/pets", "get"): 0.0}) == {("/pets", "get"): 0}
+    assert scale_weights({}) == {}
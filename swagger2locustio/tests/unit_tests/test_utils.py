@@ -0,0 +1,82 @@
+"""Module: Tests of utils"""
+
+import logging
+
+import pytest
+
+from swagger2locustio.generators.file_writer import FileWriter
+from swagger2locustio.utils import changed_files_user_check, get_peak_rss, log_diff, log_result
+
+
+def write_files(results_path, files: dict, save_manifest: bool = True) -> FileWriter:
+    """Function: write files and save manifest of them, changed files are resolved before it is saved"""
+
+    writer = FileWriter(results_path)
+    for name, content in files.items():
+        writer.write(results_path / name, content)
+    if save_manifest:
+        writer.save_manifest()
+    return writer
+
+
+def test_log_result(tmp_path):
+    """Test: results are taken from the manifest of generated files"""
+
+    write_files(tmp_path, {"apps/app/pets.py": "class Pets:\n    pass\n", "locustfile.py": "def main():\n    pass\n"})
+    result = log_result(tmp_path)
+
+    assert set(result["folders"]) == {"/apps", "/apps/app"}
+    assert set(result["files"]) == {"/apps/app/pets.py", "/locustfile.py"}
+    assert set(result["classes"]) == {"/apps/app/pets.py: class Pets"}
+    assert set(result["functions"]) == {"/locustfile.py: def main"}
+
+
+def test_log_diff(tmp_path, caplog):
+    """Test: created, updated and deleted items are counted"""
+
+    write_files(tmp_path, {"pets.py": "class Pets:\n    pass\n", "store.py": "class Store:\n    pass\n"})
+    start = log_result(tmp_path)
+    (tmp_path / "store.py").unlink()
+    write_files(tmp_path, {"pets.py": "class Pets:\n    x = 1\n", "users.py": "class Users:\n    pass\n"})
+    end = log_result(tmp_path)
+
+    with caplog.at_level(logging.INFO):
+        log_diff(start, end, tmp_path)
+    messages = {record.getMessage() for record in caplog.records}
+    assert {"FILES created: 1", "FILES updated: 1", "FILES deleted: 1"} <= messages
+    assert {"CLASSES created: 1", "CLASSES updated: 1", "CLASSES deleted: 1"} <= messages
+
+
+@pytest.mark.parametrize("policy, content", [("overwrite", "new\n"), ("keep", "old\n")])
+def test_conflict_policy(tmp_path, policy, content):
+    """Test: changed files are overwritten or kept by policy, kept ones are returned"""
+
+    (tmp_path / "pets.py").write_text("old\n", encoding="utf-8")
+    writer = write_files(tmp_path, {"pets.py": "new\n"}, save_manifest=False)
+
+    kept = changed_files_user_check(writer, policy)
+    writer.save_manifest()
+
+    assert (tmp_path / "pets.py").read_text(encoding="utf-8") == content
+    assert kept == ([] if policy == "overwrite" else ["pets.py"])
+    assert not list(tmp_path.glob(".pets.py.*"))
+
+
+def test_conflict_prompt(tmp_path, monkeypatch):
+    """Test: user is asked about every changed file"""
+
+    (tmp_path / "pets.py").write_text("old pets\n", encoding="utf-8")
+    (tmp_path / "store.py").write_text("old store\n", encoding="utf-8")
+    writer = write_files(tmp_path, {"pets.py": "new pets\n", "store.py": "new store\n"}, save_manifest=False)
+    answers = iter(["y", "n"])
+    monkeypatch.setattr("builtins.input", lambda: next(answers))
+
+    assert changed_files_user_check(writer) == ["store.py"]
+    assert (tmp_path / "pets.py").read_text(encoding="utf-8") == "new pets\n"
+    assert (tmp_path / "store.py").read_text(encoding="utf-8") == "old store\n"
+
+
+def test_get_peak_rss():
+    """Test: peak RSS of the process is known"""
+
+    assert get_peak_rss() > 0
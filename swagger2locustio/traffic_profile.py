@@ -0,0 +1,111 @@
+"""Module: Traffic profile"""
+
+import re
+import csv
+import json
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+LOG = logging.getLogger(__name__)
+
+# Sum of weights of all the operations, RPS of profile are scaled to it
+WEIGHTS_TOTAL = 1000
+PROFILE_COLUMNS = ("method", "path", "rps")
+PATH_PARAMS_PATTERN = re.compile(r"{[^/]*?}")
+
+
+class TrafficProfile:
+    """Class: Traffic Profile
+
+    Requests per second of operations, e.g. aggregated from access logs. Paths of the profile are either
+    path templates of swagger file or concrete paths, concrete paths are matched to path templates.
+    """
+
+    def __init__(self, rps: Dict[Tuple[str, str], float]):
+        self.rps = rps
+
+    @property
+    def total_rps(self) -> float:
+        """Method: get total RPS of all the operations"""
+
+        return sum(self.rps.values())
+
+    @classmethod
+    def load(cls, profile_file: Path) -> "TrafficProfile":
+        """Method: load profile from csv file with `method,path,rps` rows or json file"""
+
+        if profile_file.suffix == ".json":
+            raw_profile = json.loads(profile_file.read_text(encoding="utf-8"))
+            if isinstance(raw_profile, dict):
+                rows = [(*key.split(maxsplit=1), value) for key, value in raw_profile.items()]
+            else:
+                rows = [tuple(row.get(column) for column in PROFILE_COLUMNS) for row in raw_profile]
+        elif profile_file.suffix == ".csv":
+            with open(profile_file, newline="", encoding="utf-8") as file:
+                rows = [tuple(row) for row in csv.reader(file) if row]
+            if rows and tuple(column.strip().lower() for column in rows[0]) == PROFILE_COLUMNS:
+                rows = rows[1:]
+        else:
+            raise ValueError(f"Incorrect traffic profile format: {profile_file}")
+
+        rps: Dict[Tuple[str, str], float] = {}
+        for row in rows:
+            try:
+                method, path, value = row
+                key = (method.strip().lower(), path.strip().split("?", 1)[0])
+                rps[key] = rps.get(key, 0.0) + float(value)
+            except (TypeError, ValueError, AttributeError):
+                raise ValueError(f"Incorrect traffic profile row: {row}") from None
+        profile = cls(rps)
+        LOG.info("Traffic profile with %d operations is loaded, total %.1f RPS", len(rps), profile.total_rps)
+        return profile
+
+    def match(self, operations: List[Tuple[str, str]]) -> Dict[Tuple[str, str], float]:
+        """Method: get RPS of (path template, method) operations, operations missing in profile are not returned"""
+
+        operations_rps: Dict[Tuple[str, str], float] = {}
+        templates: Dict[str, List[Tuple[int, re.Pattern, Tuple[str, str]]]] = {}
+        for path, method in operations:
+            templates.setdefault(method.lower(), []).append(
+                (len(PATH_PARAMS_PATTERN.findall(path)), self.compile_path(path), (path, method))
+            )
+        for method_templates in templates.values():
+            method_templates.sort(key=lambda template: template[0])  # the most specific template wins
+
+        unmatched = 0
+        for (method, path), rps in self.rps.items():
+            operation = self._match_operation(templates.get(method, []), path)
+            if operation is None:
+                unmatched += 1
+                continue
+            operations_rps[operation] = operations_rps.get(operation, 0.0) + rps
+        if unmatched:
+            LOG.warning("%d traffic profile entries do not match any operation", unmatched)
+        return operations_rps
+
+    @staticmethod
+    def _match_operation(method_templates, path: str) -> Optional[Tuple[str, str]]:
+        for _, template, operation in method_templates:
+            if template.fullmatch(path):
+                return operation
+        return None
+
+    @staticmethod
+    def compile_path(path: str) -> re.Pattern:
+        """Method: compile path template to pattern that matches the template itself and concrete paths"""
+
+        parts = PATH_PARAMS_PATTERN.split(path)
+        return re.compile("(?:{[^/]*?}|[^/]+)".join(re.escape(part) for part in parts))
+
+
+def scale_weights(operations_rps: Dict[Tuple[str, str], float]) -> Dict[Tuple[str, str], int]:
+    """Function: scale RPS of operations to integer task weights, every operation with traffic gets at least 1"""
+
+    total_rps = sum(operations_rps.values())
+    if total_rps <= 0:
+        return {operation: 0 for operation in operations_rps}
+    return {
+        operation: max(1, round(rps / total_rps * WEIGHTS_TOTAL)) if rps > 0 else 0
+        for operation, rps in operations_rps.items()
+    }
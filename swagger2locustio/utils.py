@@ -1,49 +1,59 @@
 """Module: Utils"""
 
 import os
+import sys
 import logging
 from pathlib import Path
+from typing import List
+
+from swagger2locustio.generators.file_writer import FileWriter
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None  # type: ignore
 
 LOG = logging.getLogger(__name__)
 
+# `prompt` asks user about every changed file, `overwrite` and `keep` do not ask
+CONFLICT_POLICIES = ("prompt", "overwrite", "keep")
 
-def changed_files_user_check(existed_files, new_files, results_path):
-    """Function: changed files user check"""
 
-    for file_name, old_data in existed_files.items():
-        new_data = new_files.get(file_name, "")
-        if old_data != new_data:
-            LOG.warning("%s file has been changed. Do you want to overwrite it? [Y/any key]", file_name)
-            user_input = input()
-            if user_input not in ("y", "Y"):
-                Path(str(results_path) + file_name).write_text(old_data)
-            if file_name == "/locustfile.py":
-                LOG.warning("NOTE: You should include imports to all apps tasksets yourself in `locustfile.py`")
+def changed_files_user_check(writer: FileWriter, conflict_policy: str = "prompt") -> List[str]:
+    """Function: changed files user check, files replaced by `writer` are kept or overwritten, kept ones are returned"""
+
+    for file_name in sorted(writer.replaced):
+        if conflict_policy == "prompt":
+            LOG.warning("/%s file has been changed. Do you want to overwrite it? [Y/any key]", file_name)
+            overwrite = input() in ("y", "Y")
+        else:
+            overwrite = conflict_policy == "overwrite"
+            LOG.info("/%s file has been changed, it is %s", file_name, "overwritten" if overwrite else "kept")
+        if not overwrite:
+            writer.keep(file_name)
+        if file_name == "locustfile.py":
+            LOG.warning("NOTE: You should include imports to all apps tasksets yourself in `locustfile.py`")
+    return writer.kept
 
 
 def log_diff(start, end, results_path):
     """Function: log difference"""
 
-    changed_files_user_check(start["files"], end["files"], results_path)
-
     for key, items in start.items():
-        start_key = set(items)
-        end_key = set(end[key])
+        end_items = end[key]
         result = {
-            "created": list(end_key - start_key),
+            "created": [name for name in end_items if name not in items],
             "unchanged": [],
             "updated": [],
-            "deleted": list(start_key - end_key),
+            "deleted": [name for name in items if name not in end_items],
         }
-
-        # UNCHANGED / UPDATED
-        for each_start_key, each_start_data in items.items():
-            for each_end_key, each_end_data in end[key].items():
-                if each_start_key == each_end_key and each_start_data == each_end_data:
-                    result["unchanged"].append(each_start_key)
-                elif each_start_key == each_end_key:
-                    result["updated"].append(each_start_key)
-                # else is not used as we compare two lists which includes a lot of false entries
+        for name, start_data in items.items():
+            if name not in end_items:
+                continue
+            if start_data == end_items[name]:
+                result["unchanged"].append(name)
+            else:
+                result["updated"].append(name)
 
         for result_key in result:
             result[result_key].sort()
@@ -60,7 +70,10 @@ def log_diff(start, end, results_path):
 
 
 def log_result(results_path):
-    """Function: log run results"""
+    """Function: log run results
+
+    Generated files are taken from the manifest saved by `FileWriter`, results dir is not scanned.
+    """
 
     result = {
         "folders": {},
@@ -68,46 +81,25 @@ def log_result(results_path):
         "classes": {},
         "functions": {},
     }
-    results_path = str(results_path)
-
-    for root, dirs, files in os.walk(results_path):
-        result["folders"].update({os.path.join(root, folder): "" for folder in dirs})
-
-        for filename in files:
-            if filename[-3:] != ".py":
-                continue
+    for file_name, entry in FileWriter.load_manifest(Path(results_path)).items():
+        path = f"/{file_name}"
+        result["files"][path] = entry["hash"]
+        parent = os.path.dirname(path)
+        while parent != "/":
+            result["folders"][parent] = ""
+            parent = os.path.dirname(parent)
+        for kind in ("classes", "functions"):
+            for name, symbol_hash in entry.get(kind, {}).items():
+                result[kind][f"{path}: {name}"] = symbol_hash
+    return result
 
-            file_path = os.path.join(root, filename)
 
-            results_path = str(results_path)
-            file_path_cleaned = str(file_path)
-            if file_path_cleaned[: len(results_path)] == results_path:
-                file_path_cleaned = file_path_cleaned[len(results_path) :]
-            else:
-                LOG.warning("unknown path %s was mentioned", file_path_cleaned)
-
-            with open(file_path, "r", encoding="utf-8") as file:
-                result["files"][file_path_cleaned] = file.read()
-                file.seek(0)
-
-                file_class = ""
-                file_function = ""
-                for line in file:
-                    if line.find("class ") != -1:
-                        name = file_path_cleaned + ": " + line.lstrip()
-                        name = name[: name.find("\n")] if "\n" in name else name
-                        result["classes"][name] = line.lstrip()
-                        file_class = name
-                        file_function = ""
-                    elif line.find("def ") != -1:
-                        name = file_path_cleaned + ": " + line.lstrip()
-                        name = name[: name.find("\n")] if "\n" in name else name
-                        result["functions"][name] = line.lstrip()
-                        file_function = name
-
-                    if file_class != "":
-                        result["classes"][file_class] += line
-                    if file_function != "":
-                        result["functions"][file_function] += line
+def get_peak_rss() -> int:
+    """Function: get peak resident set size of the process in bytes (0 if unknown)"""
 
-    return result
+    if resource is None:
+        return 0
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        return peak_rss
+    return peak_rss * 1024